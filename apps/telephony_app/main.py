@@ -12,6 +12,10 @@ from vocode.streaming.telephony.server.base import (
     TwilioInboundCallConfig,
     TelephonyServer,
 )
+from vocode.streaming.telephony.server.telephony_worker import TelephonyWorker
+from vocode.streaming.telephony.worker_registry.redis_worker_registry import (
+    RedisWorkerRegistry,
+)
 
 from speller_agent import SpellerAgentFactory
 import sys
@@ -64,6 +68,8 @@ telephony_server = TelephonyServer(
     ],
     agent_factory=SpellerAgentFactory(),
     logger=logger,
+    # set when started by run_telephony_workers, to spread calls over one process per core
+    worker=TelephonyWorker.from_env(RedisWorkerRegistry(), logger=logger),
 )
 
 app.include_router(telephony_server.get_router())
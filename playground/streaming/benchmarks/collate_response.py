@@ -0,0 +1,168 @@
+import argparse
+import asyncio
+import json
+import re
+import time
+from typing import AsyncGenerator, List, Optional
+
+from vocode.streaming.agent.utils import SENTENCE_ENDINGS, collate_response_async
+
+parser = argparse.ArgumentParser(
+    description="Time collate_response_async over LLM token streams, against the regex rescan it replaced.\n"
+    + "Example usage: python playground/streaming/benchmarks/collate_response.py --token_streams_path streams.jsonl"
+)
+parser.add_argument(
+    "--token_streams_path",
+    type=str,
+    default=None,
+    help="JSONL file with one recorded token stream (a list of strings) per line, e.g. the "
+    + "tokens yielded by openai_get_tokens. Defaults to a few built in responses",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=20,
+    help="Times each response is repeated per stream, to see how it scales with response length",
+)
+parser.add_argument("--runs", type=int, default=5)
+
+RESPONSES = [
+    "Hello! Thanks for calling the clinic, my name is Tim. How can I help you today?",
+    "Sure, I can book that for you. The first appointment I have is on Monday at 9:30am, "
+    + "or there's one on Tuesday at 2pm. Which would suit you better?",
+    "The initial consultation costs $95.50 and follow ups are $75. You can pay by card "
+    + "on the day, or email billing.team@example.com for an invoice.",
+    "Here's what I found:\n1. Monday at 9am with Dr. Smith\n2. Tuesday at 11am with Dr. Lee\n"
+    + "3. Friday at 4pm with Dr. Smith\nLet me know which one works!",
+]
+# roughly how GPT tokenizers split English text
+TOKEN_PATTERN = re.compile(r" ?[A-Za-z]+| ?\d{1,3}|\n| ?[^\sA-Za-z\d]| +")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text)
+
+
+async def rescan_collate_response_async(
+    gen, sentence_endings: List[str] = SENTENCE_ENDINGS
+) -> AsyncGenerator[str, None]:
+    """collate_response_async before it was made incremental, for comparison"""
+    sentence_endings_pattern = "|".join(map(re.escape, sentence_endings))
+    list_item_ending_pattern = r"\n"
+    buffer = ""
+    prev_ends_with_money = False
+    async for token in gen:
+        if not token:
+            continue
+        token_starts_with_whitespace = token.startswith(" ")
+        if prev_ends_with_money and token_starts_with_whitespace:
+            yield buffer.strip()
+            buffer = ""
+        elif token_starts_with_whitespace and bool(
+            re.findall(sentence_endings_pattern, buffer)
+        ):
+            to_return = buffer.strip()
+            if to_return:
+                yield to_return
+            buffer = ""
+        buffer += token
+        possible_list_item = bool(re.match(r"^\d+[ .]", buffer))
+        ends_with_money = bool(re.findall(r"\$\d+.$", buffer))
+        token_ends_sentence = bool(
+            re.findall(
+                list_item_ending_pattern
+                if possible_list_item
+                else sentence_endings_pattern,
+                token,
+            )
+        )
+        if (
+            token_ends_sentence
+            and not ends_with_money
+            and token_starts_with_whitespace
+        ):
+            to_return = buffer.strip()
+            if to_return:
+                yield to_return
+            buffer = ""
+        prev_ends_with_money = ends_with_money
+    to_return = buffer.strip()
+    if to_return:
+        yield to_return
+
+
+async def agen_from_list(tokens: List[str]):
+    for token in tokens:
+        yield token
+
+
+def create_sentences_gen(name: str, gen) -> AsyncGenerator[str, None]:
+    if name == "rescan":
+        return rescan_collate_response_async(gen)
+    return collate_response_async(gen, eager_first_clause=name == "incremental, eager")
+
+
+async def collate(name: str, tokens: List[str]):
+    """Returns the sentences, and the tokens streamed before the first one"""
+    tokens_before_first_sentence: Optional[int] = None
+    num_tokens = 0
+
+    async def counting_gen():
+        nonlocal num_tokens
+        for token in tokens:
+            num_tokens += 1
+            yield token
+
+    sentences = []
+    async for sentence in create_sentences_gen(name, counting_gen()):
+        if tokens_before_first_sentence is None:
+            tokens_before_first_sentence = num_tokens
+        sentences.append(sentence)
+    return sentences, tokens_before_first_sentence
+
+
+async def time_collate(name: str, token_streams: List[List[str]], runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for tokens in token_streams:
+            async for _ in create_sentences_gen(name, agen_from_list(tokens)):
+                pass
+        timings.append(time.perf_counter() - start)
+    num_tokens = sum(len(tokens) for tokens in token_streams)
+    first_sentence_tokens = []
+    for tokens in token_streams:
+        _, tokens_before_first_sentence = await collate(name, tokens)
+        if tokens_before_first_sentence is not None:
+            first_sentence_tokens.append(tokens_before_first_sentence)
+    print(
+        f"{name:>20}: {min(timings) / num_tokens * 1e6:6.2f}us per token, "
+        f"first sentence after {sum(first_sentence_tokens) / len(first_sentence_tokens):.1f} tokens on average"
+    )
+
+
+async def main():
+    args = parser.parse_args()
+    if args.token_streams_path:
+        with open(args.token_streams_path) as f:
+            token_streams = [json.loads(line) for line in f if line.strip()]
+    else:
+        token_streams = [tokenize(response) for response in RESPONSES]
+    token_streams = [
+        [token for _ in range(args.repeat) for token in tokens + [" "]]
+        for tokens in token_streams
+    ]
+    for tokens in token_streams:
+        rescan_sentences, _ = await collate("rescan", tokens)
+        incremental_sentences, _ = await collate("incremental", tokens)
+        assert rescan_sentences == incremental_sentences, "sentences differ"
+    print(
+        f"{len(token_streams)} token streams, "
+        f"{sum(len(tokens) for tokens in token_streams)} tokens"
+    )
+    for name in ["rescan", "incremental", "incremental, eager"]:
+        await time_collate(name, token_streams, args.runs)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
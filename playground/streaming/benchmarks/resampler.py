@@ -0,0 +1,88 @@
+import argparse
+import array
+import audioop
+import math
+import time
+from typing import Callable, List
+
+from vocode.streaming.utils.audio_converter import StreamingAudioConverter
+
+parser = argparse.ArgumentParser(
+    description="Compare resampling a chunked audio stream with a fresh audioop.ratecv state per chunk "
+    + "against StreamingAudioConverter.\n"
+    + "Example usage: python playground/streaming/benchmarks/resampler.py --input_rate 16000 --output_rate 8000"
+)
+parser.add_argument("--input_rate", type=int, default=16000)
+parser.add_argument("--output_rate", type=int, default=8000)
+parser.add_argument(
+    "--chunk_ms", type=int, default=20, help="Size of each chunk in milliseconds"
+)
+parser.add_argument(
+    "--seconds", type=int, default=60, help="Seconds of audio to convert per run"
+)
+parser.add_argument("--runs", type=int, default=5)
+
+
+def create_sine_wave(sampling_rate: int, seconds: int, frequency: int = 440) -> bytes:
+    return array.array(
+        "h",
+        (
+            int(10000 * math.sin(2 * math.pi * frequency * i / sampling_rate))
+            for i in range(sampling_rate * seconds)
+        ),
+    ).tobytes()
+
+
+def fresh_state_per_chunk(args) -> Callable[[bytes], bytes]:
+    def convert(chunk: bytes) -> bytes:
+        converted, _ = audioop.ratecv(
+            chunk, 2, 1, args.input_rate, args.output_rate, None
+        )
+        return converted
+
+    return convert
+
+
+def streaming_converter(args) -> Callable[[bytes], bytes]:
+    return StreamingAudioConverter(
+        input_sampling_rate=args.input_rate, output_sampling_rate=args.output_rate
+    ).convert
+
+
+def run(name: str, create_convert, chunks: List[bytes], expected: bytes, args):
+    timings = []
+    for _ in range(args.runs):
+        convert = create_convert(args)
+        start = time.perf_counter()
+        output = b"".join(convert(chunk) for chunk in chunks)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    # how far the output drifts from resampling the whole stream at once
+    compared = min(len(output), len(expected)) // 2
+    errors = [
+        abs(a - b)
+        for a, b in zip(
+            array.array("h", output[: compared * 2]),
+            array.array("h", expected[: compared * 2]),
+        )
+    ]
+    print(
+        f"{name:>24}: {args.seconds / best:10.0f}x realtime, "
+        f"{len(output) - len(expected):+d} bytes vs one-shot, "
+        f"max sample error {max(errors)}"
+    )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    audio = create_sine_wave(args.input_rate, args.seconds)
+    chunk_size = args.input_rate * args.chunk_ms // 1000 * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+    expected, _ = audioop.ratecv(
+        audio, 2, 1, args.input_rate, args.output_rate, None
+    )
+    print(
+        f"{args.seconds}s of audio, {args.input_rate}Hz -> {args.output_rate}Hz in {args.chunk_ms}ms chunks"
+    )
+    run("fresh ratecv per chunk", fresh_state_per_chunk, chunks, expected, args)
+    run("StreamingAudioConverter", streaming_converter, chunks, expected, args)
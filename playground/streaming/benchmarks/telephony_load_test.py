@@ -0,0 +1,570 @@
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import re
+import resource
+import statistics
+import time
+from typing import AsyncGenerator, List, Optional, Tuple
+
+import aiohttp
+from fastapi import WebSocketDisconnect
+
+from vocode.streaming.agent.base_agent import RespondAgent
+from vocode.streaming.agent.factory import AgentFactory
+from vocode.streaming.models.agent import AgentConfig
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.events import Event, EventType
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import SynthesizerConfig
+from vocode.streaming.models.telephony import TwilioConfig, VonageConfig
+from vocode.streaming.models.transcriber import TranscriberConfig
+from vocode.streaming.models.transcript import TranscriptCompleteEvent
+from vocode.streaming.synthesizer.base_synthesizer import (
+    BaseSynthesizer,
+    SynthesisResult,
+)
+from vocode.streaming.synthesizer.factory import SynthesizerFactory
+from vocode.streaming.telephony.config_manager.in_memory_config_manager import (
+    InMemoryConfigManager,
+)
+from vocode.streaming.telephony.constants import (
+    DEFAULT_AUDIO_ENCODING,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_SAMPLING_RATE,
+    VONAGE_AUDIO_ENCODING,
+    VONAGE_CHUNK_SIZE,
+    VONAGE_SAMPLING_RATE,
+)
+from vocode.streaming.telephony.conversation import twilio_call, vonage_call
+from vocode.streaming.telephony.server.base import (
+    TelephonyServer,
+    TwilioInboundCallConfig,
+    VonageAnswerRequest,
+    VonageInboundCallConfig,
+)
+from vocode.streaming.transcriber.base_transcriber import (
+    BaseAsyncTranscriber,
+    Transcription,
+)
+from vocode.streaming.transcriber.factory import TranscriberFactory
+from vocode.streaming.utils import convert_wav, get_chunk_size_per_second
+from vocode.streaming.utils.events_manager import EventsManager
+
+parser = argparse.ArgumentParser(
+    description="Drive simulated phone calls through TelephonyServer with stub transcriber, agent and "
+    + "synthesizer services, replaying recorded audio over fake media websockets, and report turn latency, "
+    + "event loop lag, memory and CPU per call.\n"
+    + "Example usage: python playground/streaming/benchmarks/telephony_load_test.py --calls 200 --provider twilio"
+)
+parser.add_argument("--calls", type=int, default=50, help="Number of concurrent calls")
+parser.add_argument(
+    "--ramp_seconds",
+    type=float,
+    default=10,
+    help="Seconds over which the calls are started",
+)
+parser.add_argument(
+    "--call_seconds", type=float, default=30, help="Length of each call in seconds"
+)
+parser.add_argument("--provider", choices=["twilio", "vonage"], default="twilio")
+parser.add_argument(
+    "--audio_path",
+    type=str,
+    default="playground/streaming/test.wav",
+    help="Caller audio, replayed in a loop for the length of the call",
+)
+parser.add_argument(
+    "--seconds_per_utterance",
+    type=float,
+    default=5,
+    help="Seconds of caller audio after which the stub transcriber emits a final transcription",
+)
+parser.add_argument(
+    "--agent_delay_seconds",
+    type=float,
+    default=0.2,
+    help="Simulated time to the agent's first token",
+)
+parser.add_argument(
+    "--synthesis_delay_seconds",
+    type=float,
+    default=0.15,
+    help="Simulated time for the synthesizer to return",
+)
+parser.add_argument(
+    "--answer_delay_seconds",
+    type=float,
+    default=0.2,
+    help="Simulated time between answering the call and the media websocket connecting",
+)
+parser.add_argument("--log_level", type=str, default="WARNING")
+
+BASE_URL = "load-test.vocode.dev"
+# Twilio and Vonage both send 20ms of audio per media message
+MEDIA_FRAME_SECONDS = 0.02
+EVENT_LOOP_LAG_INTERVAL_SECONDS = 0.05
+
+
+class LoadTestTranscriberConfig(TranscriberConfig, type="transcriber_load_test"):
+    seconds_per_utterance: float = 5
+    message: str = "Hi, I'd like to check on my appointment."
+
+
+class LoadTestTranscriber(BaseAsyncTranscriber[LoadTestTranscriberConfig]):
+    """Emits a final transcription for every seconds_per_utterance of audio it receives"""
+
+    def __init__(
+        self,
+        transcriber_config: LoadTestTranscriberConfig,
+        logger: Optional[logging.Logger] = None,
+    ):
+        super().__init__(transcriber_config)
+
+    async def _run_loop(self):
+        bytes_per_utterance = int(
+            get_chunk_size_per_second(
+                self.transcriber_config.audio_encoding,
+                self.transcriber_config.sampling_rate,
+            )
+            * self.transcriber_config.seconds_per_utterance
+        )
+        bytes_received = 0
+        while True:
+            chunk = await self.input_queue.get()
+            bytes_received += len(chunk)
+            if bytes_received >= bytes_per_utterance:
+                bytes_received -= bytes_per_utterance
+                self.output_queue.put_nowait(
+                    Transcription(
+                        message=self.transcriber_config.message,
+                        confidence=1.0,
+                        is_final=True,
+                    )
+                )
+
+
+class LoadTestTranscriberFactory(TranscriberFactory):
+    def create_transcriber(
+        self,
+        transcriber_config: TranscriberConfig,
+        logger: Optional[logging.Logger] = None,
+    ):
+        if isinstance(transcriber_config, LoadTestTranscriberConfig):
+            return LoadTestTranscriber(transcriber_config, logger=logger)
+        return super().create_transcriber(transcriber_config, logger=logger)
+
+
+class LoadTestAgentConfig(AgentConfig, type="agent_load_test"):
+    response: str = "Sure, let me look that up for you."
+    delay_seconds: float = 0.2
+
+
+class LoadTestAgent(RespondAgent[LoadTestAgentConfig]):
+    """Answers every transcription with the same response after a fixed delay"""
+
+    async def respond(
+        self,
+        human_input,
+        conversation_id: str,
+        is_interrupt: bool = False,
+    ) -> Tuple[Optional[str], bool]:
+        await asyncio.sleep(self.agent_config.delay_seconds)
+        return self.agent_config.response, False
+
+    async def generate_response(
+        self,
+        human_input,
+        conversation_id: str,
+        is_interrupt: bool = False,
+    ) -> AsyncGenerator[Tuple[str, bool], None]:
+        await asyncio.sleep(self.agent_config.delay_seconds)
+        yield self.agent_config.response, True
+
+
+class LoadTestAgentFactory(AgentFactory):
+    def create_agent(self, agent_config: AgentConfig, logger=None):
+        if isinstance(agent_config, LoadTestAgentConfig):
+            return LoadTestAgent(agent_config=agent_config, logger=logger)
+        return super().create_agent(agent_config, logger=logger)
+
+
+class LoadTestSynthesizerConfig(SynthesizerConfig, type="synthesizer_load_test"):
+    delay_seconds: float = 0.15
+    # roughly the speaking rate of a TTS voice
+    seconds_per_character: float = 0.06
+
+
+class LoadTestSynthesizer(BaseSynthesizer[LoadTestSynthesizerConfig]):
+    """Returns silence as long as the message would take to speak after a fixed delay"""
+
+    async def create_speech(
+        self,
+        message: BaseMessage,
+        chunk_size: int,
+        bot_sentiment=None,
+    ) -> SynthesisResult:
+        await asyncio.sleep(self.synthesizer_config.delay_seconds)
+        num_bytes = int(
+            get_chunk_size_per_second(
+                self.synthesizer_config.audio_encoding,
+                self.synthesizer_config.sampling_rate,
+            )
+            * self.synthesizer_config.seconds_per_character
+            * len(message.text)
+        )
+        # NOTE: 0xff is silence for mulaw audio
+        silence = (
+            b"\xff" if self.synthesizer_config.audio_encoding == AudioEncoding.MULAW else b"\x00"
+        )
+        return self.create_synthesis_result_from_bytes(
+            synthesizer_config=self.synthesizer_config,
+            output_bytes=silence * (num_bytes - num_bytes % 2),
+            message=message,
+            chunk_size=chunk_size,
+        )
+
+
+class LoadTestSynthesizerFactory(SynthesizerFactory):
+    def create_synthesizer(
+        self,
+        synthesizer_config: SynthesizerConfig,
+        logger: Optional[logging.Logger] = None,
+        aiohttp_session=None,
+    ):
+        if isinstance(synthesizer_config, LoadTestSynthesizerConfig):
+            if aiohttp_session is None and self.http_resource_pool is not None:
+                aiohttp_session = self.http_resource_pool.get_aiohttp_session()
+            return LoadTestSynthesizer(
+                synthesizer_config, aiohttp_session=aiohttp_session
+            )
+        return super().create_synthesizer(
+            synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
+        )
+
+
+class LoadTestTwilioClient:
+    """Stands in for TwilioClient, which calls the Twilio API"""
+
+    def __init__(
+        self,
+        base_url: str,
+        twilio_config: TwilioConfig,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.base_url = base_url
+        self.twilio_config = twilio_config
+
+    async def fetch_call(self, twilio_sid: str) -> dict:
+        return {"sid": twilio_sid, "answered_by": None}
+
+
+class LoadTestVonageClient:
+    def __init__(self, base_url: str, vonage_config: VonageConfig):
+        self.base_url = base_url
+        self.vonage_config = vonage_config
+
+
+class TurnLatencyEventsManager(EventsManager):
+    def __init__(self):
+        super().__init__(subscriptions=[EventType.TRANSCRIPT_COMPLETE])
+        self.turn_latencies: List[float] = []
+        self.unanswered_turns = 0
+
+    async def handle_event(self, event: Event):
+        if isinstance(event, TranscriptCompleteEvent):
+            for turn_latency in event.transcript.turn_latencies:
+                total_latency = turn_latency.get_total_latency()
+                if total_latency is None:
+                    self.unanswered_turns += 1
+                else:
+                    self.turn_latencies.append(total_latency)
+
+
+class FakeMediaWebSocket:
+    """Replays caller audio in real time, one 20ms frame per message, and records the bot's audio"""
+
+    def __init__(self, audio: bytes, frame_size: int, call_seconds: float):
+        self.audio = audio
+        self.frame_size = frame_size
+        self.num_frames = int(call_seconds / MEDIA_FRAME_SECONDS)
+        self.frames_sent = 0
+        self.start_time: Optional[float] = None
+        self.first_output_time: Optional[float] = None
+        self.output_messages = 0
+
+    async def accept(self):
+        self.start_time = time.time()
+
+    async def next_frame(self) -> Optional[bytes]:
+        if self.frames_sent >= self.num_frames:
+            return None
+        assert self.start_time is not None
+        delay = self.start_time + self.frames_sent * MEDIA_FRAME_SECONDS - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        offset = (self.frames_sent * self.frame_size) % (
+            len(self.audio) - self.frame_size
+        )
+        self.frames_sent += 1
+        return self.audio[offset : offset + self.frame_size]
+
+    def record_output(self):
+        if self.first_output_time is None:
+            self.first_output_time = time.time()
+        self.output_messages += 1
+
+    def get_time_to_first_output(self) -> Optional[float]:
+        if self.first_output_time is None or self.start_time is None:
+            return None
+        return self.first_output_time - self.start_time
+
+    async def close(self):
+        pass
+
+
+class FakeTwilioWebSocket(FakeMediaWebSocket):
+    def __init__(self, audio: bytes, call_seconds: float):
+        super().__init__(audio, DEFAULT_CHUNK_SIZE // 20, call_seconds)
+        self.started = False
+
+    async def receive_text(self) -> str:
+        if not self.started:
+            self.started = True
+            return json.dumps(
+                {"event": "start", "start": {"streamSid": os.urandom(8).hex()}}
+            )
+        timestamp = int(self.frames_sent * MEDIA_FRAME_SECONDS * 1000)
+        frame = await self.next_frame()
+        if frame is None:
+            return json.dumps({"event": "stop"})
+        return json.dumps(
+            {
+                "event": "media",
+                "media": {
+                    "payload": base64.b64encode(frame).decode("ascii"),
+                    "timestamp": timestamp,
+                },
+            }
+        )
+
+    async def send_text(self, message: str):
+        if '"event": "media"' in message:
+            self.record_output()
+
+
+class FakeVonageWebSocket(FakeMediaWebSocket):
+    def __init__(self, audio: bytes, call_seconds: float):
+        super().__init__(audio, VONAGE_CHUNK_SIZE, call_seconds)
+
+    async def receive(self):
+        return {"type": "websocket.receive", "text": json.dumps({"event": "start"})}
+
+    async def receive_bytes(self) -> bytes:
+        frame = await self.next_frame()
+        if frame is None:
+            raise WebSocketDisconnect()
+        return frame
+
+    async def send_bytes(self, chunk: bytes):
+        self.record_output()
+
+
+def get_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # ru_maxrss is the peak, in KB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def get_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class ResourceMonitor:
+    """Samples event loop lag (how late a sleep wakes up) and peak RSS while the test runs"""
+
+    def __init__(self):
+        self.lags: List[float] = []
+        self.peak_rss_bytes = get_rss_bytes()
+
+    async def run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(EVENT_LOOP_LAG_INTERVAL_SECONDS)
+            self.lags.append(
+                time.perf_counter() - start - EVENT_LOOP_LAG_INTERVAL_SECONDS
+            )
+            self.peak_rss_bytes = max(self.peak_rss_bytes, get_rss_bytes())
+
+
+def get_conversation_id(response) -> str:
+    body = (
+        response.body.decode() if hasattr(response, "body") else json.dumps(response)
+    )
+    match = re.search(r"/connect_call/([\w-]+)", body)
+    assert match, f"No media websocket URL in {body}"
+    return match.group(1)
+
+
+async def run_call(
+    server: TelephonyServer, route, index: int, audio: bytes, args
+) -> FakeMediaWebSocket:
+    websocket: FakeMediaWebSocket
+    if args.provider == "twilio":
+        response = await route(
+            twilio_sid=f"CA{index:032d}",
+            twilio_from="+15555550100",
+            twilio_to="+15555550101",
+        )
+        websocket = FakeTwilioWebSocket(audio, args.call_seconds)
+    else:
+        response = await route(
+            vonage_answer_request=VonageAnswerRequest(
+                to="15555550101", uuid=f"load-test-{index}", **{"from": "15555550100"}
+            )
+        )
+        websocket = FakeVonageWebSocket(audio, args.call_seconds)
+    await asyncio.sleep(args.answer_delay_seconds)
+    await server.calls_router.connect_call(
+        websocket, get_conversation_id(response)  # type: ignore
+    )
+    return websocket
+
+
+def format_seconds(values: List[float]) -> str:
+    if len(values) < 2:
+        return "not enough samples"
+    p50, p95, p99 = (
+        statistics.quantiles(values, n=100)[49],
+        statistics.quantiles(values, n=100)[94],
+        statistics.quantiles(values, n=100)[98],
+    )
+    return f"p50 {p50 * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms, p99 {p99 * 1000:.0f}ms, max {max(values) * 1000:.0f}ms"
+
+
+async def run(args):
+    # these clients call the Twilio/Vonage APIs as soon as a call is built
+    twilio_call.TwilioClient = LoadTestTwilioClient  # type: ignore
+    vonage_call.VonageClient = LoadTestVonageClient  # type: ignore
+
+    if args.provider == "twilio":
+        sampling_rate, audio_encoding, chunk_size = (
+            DEFAULT_SAMPLING_RATE,
+            DEFAULT_AUDIO_ENCODING,
+            DEFAULT_CHUNK_SIZE,
+        )
+    else:
+        sampling_rate, audio_encoding, chunk_size = (
+            VONAGE_SAMPLING_RATE,
+            VONAGE_AUDIO_ENCODING,
+            VONAGE_CHUNK_SIZE,
+        )
+    audio = convert_wav(
+        args.audio_path, output_sample_rate=sampling_rate, output_encoding=audio_encoding
+    )
+    transcriber_config = LoadTestTranscriberConfig(
+        sampling_rate=sampling_rate,
+        audio_encoding=audio_encoding,
+        chunk_size=chunk_size,
+        seconds_per_utterance=args.seconds_per_utterance,
+    )
+    agent_config = LoadTestAgentConfig(
+        initial_message=BaseMessage(text="Hello, thanks for calling."),
+        delay_seconds=args.agent_delay_seconds,
+    )
+    synthesizer_config = LoadTestSynthesizerConfig(
+        sampling_rate=sampling_rate,
+        audio_encoding=audio_encoding,
+        delay_seconds=args.synthesis_delay_seconds,
+    )
+    inbound_call_config = (
+        TwilioInboundCallConfig(
+            url="/inbound_call",
+            agent_config=agent_config,
+            transcriber_config=transcriber_config,
+            synthesizer_config=synthesizer_config,
+            twilio_config=TwilioConfig(account_sid="load-test", auth_token="load-test"),
+        )
+        if args.provider == "twilio"
+        else VonageInboundCallConfig(
+            url="/inbound_call",
+            agent_config=agent_config,
+            transcriber_config=transcriber_config,
+            synthesizer_config=synthesizer_config,
+            vonage_config=VonageConfig(
+                api_key="load-test",
+                api_secret="load-test",
+                application_id="load-test",
+                private_key="load-test",
+            ),
+        )
+    )
+    events_manager = TurnLatencyEventsManager()
+    server = TelephonyServer(
+        base_url=BASE_URL,
+        config_manager=InMemoryConfigManager(),
+        inbound_call_configs=[inbound_call_config],
+        transcriber_factory=LoadTestTranscriberFactory(),
+        agent_factory=LoadTestAgentFactory(),
+        synthesizer_factory=LoadTestSynthesizerFactory(),
+        events_manager=events_manager,
+    )
+    route = server.create_inbound_route(inbound_call_config)
+
+    monitor = ResourceMonitor()
+    monitor_task = asyncio.create_task(monitor.run())
+    baseline_rss_bytes = get_rss_bytes()
+    start_cpu_seconds = get_cpu_seconds()
+    start_time = time.time()
+
+    call_tasks = []
+    for i in range(args.calls):
+        call_tasks.append(asyncio.create_task(run_call(server, route, i, audio, args)))
+        await asyncio.sleep(args.ramp_seconds / args.calls)
+    results = await asyncio.gather(*call_tasks, return_exceptions=True)
+
+    elapsed_seconds = time.time() - start_time
+    cpu_seconds = get_cpu_seconds() - start_cpu_seconds
+    monitor_task.cancel()
+    await server.http_resource_pool.close()
+
+    websockets = [r for r in results if isinstance(r, FakeMediaWebSocket)]
+    failures = [r for r in results if isinstance(r, BaseException)]
+    greeting_latencies = [
+        latency
+        for latency in (websocket.get_time_to_first_output() for websocket in websockets)
+        if latency is not None
+    ]
+    print(
+        f"{args.calls} {args.provider} calls of {args.call_seconds}s ramped over {args.ramp_seconds}s, "
+        f"{len(failures)} failed, {elapsed_seconds:.1f}s wall time"
+    )
+    for failure in failures[:5]:
+        print(f"  failure: {failure!r}")
+    print(
+        f"turn latency ({len(events_manager.turn_latencies)} turns, "
+        f"{events_manager.unanswered_turns} unanswered): {format_seconds(events_manager.turn_latencies)}"
+    )
+    print(f"time to greeting audio: {format_seconds(greeting_latencies)}")
+    print(f"event loop lag: {format_seconds(monitor.lags)}")
+    print(
+        f"cpu: {cpu_seconds:.1f}s total, {cpu_seconds / elapsed_seconds * 100:.0f}% of a core, "
+        f"{cpu_seconds / max(len(websockets), 1) * 1000:.0f}ms per call"
+    )
+    print(
+        f"memory: {baseline_rss_bytes / 2**20:.0f}MB baseline, {monitor.peak_rss_bytes / 2**20:.0f}MB peak, "
+        f"{(monitor.peak_rss_bytes - baseline_rss_bytes) / args.calls / 2**10:.0f}KB per concurrent call"
+    )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+    asyncio.run(run(args))
@@ -0,0 +1,91 @@
+import argparse
+import json
+import time
+from typing import Callable
+
+from vocode.streaming.models.agent import ChatGPTAgentConfig
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.events import Sender
+from vocode.streaming.models.model import TypedModel
+from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
+from vocode.streaming.models.transcriber import (
+    DeepgramTranscriberConfig,
+    PunctuationEndpointingConfig,
+)
+from vocode.streaming.models.websocket import (
+    AudioMessage,
+    StartMessage,
+    TranscriptMessage,
+    WebSocketMessage,
+)
+
+parser = argparse.ArgumentParser(
+    description="Time serializing and parsing the TypedModels sent over the client backend websocket.\n"
+    + "Example usage: python playground/streaming/benchmarks/typed_model_serialization.py --extra_types 200"
+)
+parser.add_argument(
+    "--iterations", type=int, default=20000, help="Operations timed per case"
+)
+parser.add_argument(
+    "--extra_types",
+    type=int,
+    default=0,
+    help="Register this many more TypedModel subclasses first, to see how lookups scale with the registry",
+)
+
+# 20ms of 8kHz mulaw, what WebsocketOutputDevice sends per chunk
+AUDIO_CHUNK = b"\xff" * 160
+
+
+def register_extra_types(num_types: int):
+    for i in range(num_types):
+        type(f"ExtraTypedModel{i}", (TypedModel,), {}, type=f"extra_typed_model_{i}")
+
+
+def time_case(name: str, operation: Callable[[], object], iterations: int):
+    operation()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>32}: {elapsed / iterations * 1e6:8.2f}us")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    register_extra_types(args.extra_types)
+    print(f"{len(TypedModel._subtypes_)} registered TypedModel classes")
+
+    audio_message = AudioMessage.from_bytes(AUDIO_CHUNK)
+    transcript_message = TranscriptMessage(
+        text="I'd like to book an appointment", sender=Sender.HUMAN, timestamp=0
+    )
+    start_message = StartMessage(
+        transcriber_config=DeepgramTranscriberConfig(
+            sampling_rate=8000,
+            audio_encoding=AudioEncoding.MULAW,
+            chunk_size=160,
+            endpointing_config=PunctuationEndpointingConfig(),
+        ),
+        agent_config=ChatGPTAgentConfig(prompt_preamble="You are a receptionist"),
+        synthesizer_config=AzureSynthesizerConfig(
+            sampling_rate=8000, audio_encoding=AudioEncoding.MULAW
+        ),
+    )
+    raw_audio_message = audio_message.json()
+    raw_start_message = start_message.json()
+
+    time_case("AudioMessage.from_bytes", lambda: AudioMessage.from_bytes(AUDIO_CHUNK), args.iterations)
+    time_case("AudioMessage.json", audio_message.json, args.iterations)
+    time_case(
+        "AudioMessage parse",
+        lambda: WebSocketMessage.parse_obj(json.loads(raw_audio_message)),
+        args.iterations,
+    )
+    time_case("TranscriptMessage.json", transcript_message.json, args.iterations)
+    time_case("StartMessage.json", start_message.json, args.iterations)
+    time_case(
+        "StartMessage parse",
+        lambda: WebSocketMessage.parse_obj(json.loads(raw_start_message)),
+        args.iterations,
+    )
@@ -0,0 +1,173 @@
+from typing import List
+
+import pytest
+
+from vocode.streaming.agent import context_window as context_window_module
+from vocode.streaming.agent.context_window import (
+    TOKENS_PER_MESSAGE,
+    TOKENS_PER_REPLY,
+    ContextWindow,
+    estimate_text_tokens,
+)
+from vocode.streaming.models.agent import ContextWindowConfig, ContextWindowStrategy
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def create_messages(num_turns: int) -> List[dict]:
+    messages = [{"role": "system", "content": "you are a receptionist"}]
+    for i in range(num_turns):
+        messages.append({"role": "user", "content": f"user turn {i}"})
+        messages.append({"role": "assistant", "content": f"bot turn {i}"})
+    return messages
+
+
+def test_messages_that_fit_are_unchanged():
+    context_window = ContextWindow(
+        ContextWindowConfig(max_prompt_tokens=1000), count_text_tokens=count_words
+    )
+    messages = create_messages(3)
+    assert context_window.fit(messages) == messages
+    # the role and 3 words per turn, the role and 4 words for the system prompt
+    assert context_window.count_tokens(messages) == TOKENS_PER_REPLY + 6 * (
+        TOKENS_PER_MESSAGE + 4
+    ) + (TOKENS_PER_MESSAGE + 5)
+
+
+def test_drop_keeps_system_prompt_and_recent_turns():
+    system_tokens = TOKENS_PER_REPLY + TOKENS_PER_MESSAGE + 5
+    turn_tokens = TOKENS_PER_MESSAGE + 4
+    context_window = ContextWindow(
+        ContextWindowConfig(max_prompt_tokens=system_tokens + 4 * turn_tokens),
+        count_text_tokens=count_words,
+    )
+    messages = create_messages(10)
+    fitted = context_window.fit(messages)
+    assert fitted == messages[:1] + messages[-4:]
+
+    # turns left out stay out, even if the prompt shrinks
+    messages.append({"role": "user", "content": "hi"})
+    fitted = context_window.fit(messages)
+    assert fitted == messages[:1] + messages[-4:]
+
+
+def test_function_results_are_not_sent_without_their_call():
+    context_window = ContextWindow(
+        ContextWindowConfig(
+            max_prompt_tokens=TOKENS_PER_REPLY + 3 * (TOKENS_PER_MESSAGE + 4)
+        ),
+        count_text_tokens=count_words,
+    )
+    messages = [
+        {
+            "role": "assistant",
+            "content": None,
+            "function_call": {"name": "book", "arguments": "{}"},
+        },
+        {"role": "function", "name": "book", "content": "booked for monday"},
+        {"role": "user", "content": "thanks so much"},
+        {"role": "assistant", "content": "you're welcome then"},
+    ]
+    assert context_window.fit(messages) == messages[2:]
+
+
+def test_last_message_is_always_sent():
+    context_window = ContextWindow(
+        ContextWindowConfig(max_prompt_tokens=1), count_text_tokens=count_words
+    )
+    messages = create_messages(2)
+    assert context_window.fit(messages) == messages[:1] + messages[-1:]
+
+
+@pytest.mark.asyncio
+async def test_summarize_folds_dropped_turns_into_summary():
+    summarized: List[List[dict]] = []
+
+    async def summarize(messages: List[dict], max_tokens: int) -> str:
+        summarized.append(messages)
+        return "summary"
+
+    turn_tokens = TOKENS_PER_MESSAGE + 4
+    context_window = ContextWindow(
+        ContextWindowConfig(
+            max_prompt_tokens=TOKENS_PER_REPLY
+            + (TOKENS_PER_MESSAGE + 5)
+            + 4 * turn_tokens
+            + turn_tokens // 2,
+            strategy=ContextWindowStrategy.SUMMARIZE,
+        ),
+        summarize=summarize,
+        count_text_tokens=count_words,
+    )
+    messages = create_messages(4)
+    # the summary isn't waited for
+    assert context_window.fit(messages) == messages[:1] + messages[-4:]
+    assert context_window.summarize_task is not None
+    await context_window.summarize_task
+    assert summarized == [messages[1:5]]
+
+    # the summary takes up room that one more turn was using
+    fitted = context_window.fit(messages)
+    assert fitted[0] == messages[0]
+    assert fitted[1]["role"] == "system"
+    assert fitted[1]["content"].endswith("summary")
+    assert fitted[2:] == messages[-3:]
+
+    await context_window.summarize_task
+    # the previous summary is folded into the next one
+    assert summarized[-1] == [{"role": "system", "content": "summary"}] + messages[5:6]
+    context_window.terminate()
+
+
+class FakeEncoding:
+    def encode(self, text: str, disallowed_special=()) -> List[str]:
+        return text.split()
+
+
+@pytest.mark.asyncio
+async def test_tokenizer_is_loaded_off_the_loop_and_estimated_until_then(monkeypatch):
+    monkeypatch.setattr(context_window_module, "_text_token_counters", {})
+    loads = []
+
+    def get_encoding(model_name):
+        loads.append(model_name)
+        return FakeEncoding()
+
+    monkeypatch.setattr(context_window_module, "get_encoding", get_encoding)
+    message = {"role": "user", "content": "hello there"}
+    context_window = ContextWindow(ContextWindowConfig(), model_name="gpt-test")
+    assert loads == []
+
+    assert context_window.count_message_tokens(message) == TOKENS_PER_MESSAGE + sum(
+        estimate_text_tokens(text) for text in ("user", "hello there")
+    )
+    assert context_window.load_tokenizer_task is not None
+    await context_window.load_tokenizer_task
+    assert context_window.count_message_tokens(message) == TOKENS_PER_MESSAGE + 3
+
+    # later windows for the model use the loaded tokenizer right away
+    other_context_window = ContextWindow(ContextWindowConfig(), model_name="gpt-test")
+    assert other_context_window.count_message_tokens(message) == TOKENS_PER_MESSAGE + 3
+    assert other_context_window.load_tokenizer_task is None
+    assert loads == ["gpt-test"]
+
+
+@pytest.mark.asyncio
+async def test_tokenizer_load_failure_is_cached(monkeypatch):
+    monkeypatch.setattr(context_window_module, "_text_token_counters", {})
+    loads = []
+
+    def get_encoding(model_name):
+        loads.append(model_name)
+        raise RuntimeError("no network")
+
+    monkeypatch.setattr(context_window_module, "get_encoding", get_encoding)
+    for _ in range(2):
+        context_window = ContextWindow(ContextWindowConfig(), model_name="gpt-test")
+        context_window.count_tokens(create_messages(1))
+        if context_window.load_tokenizer_task is not None:
+            await context_window.load_tokenizer_task
+        assert context_window.count_text_tokens is estimate_text_tokens
+    assert loads == ["gpt-test"]
@@ -9,6 +9,7 @@ from vocode.streaming.models.actions import (
 )
 import pytest
 from vocode.streaming.agent.utils import (
+    OpenAIChatMessagesBuilder,
     collate_response_async,
     format_openai_chat_messages_from_transcript,
     openai_get_tokens,
@@ -339,6 +340,44 @@ async def test_collate_response_async():
         assert actual_sentences == test_case.expected_sentences
 
 
+@pytest.mark.asyncio
+async def test_collate_response_async_sentence_rules():
+    test_cases = [
+        (
+            ["Hello", "!", " How", " are", " you", "?"],
+            {},
+            ["Hello!", "How are you?"],
+        ),
+        (
+            ["Email", " john", ".doe", "@example", ".com", " to", " book", "."],
+            {},
+            ["Email john.doe@example.com", "to book."],
+        ),
+        (
+            ["It", " costs", " $", "5", ".", "50", " a", " month", ".", " Ok", "?"],
+            {},
+            ["It costs $5.50", "a month.", "Ok?"],
+        ),
+        (
+            ["1", ".", " Monday", " at", " 9", ".", "\n", "2", ".", " Tuesday", "."],
+            {},
+            ["1.", "Monday at 9.\n2.", "Tuesday."],
+        ),
+        (
+            ["Sure", ",", " I", " can", " help", ",", " one", " moment", ".", " Ok", "."],
+            {"eager_first_clause": True},
+            ["Sure,", "I can help, one moment.", "Ok."],
+        ),
+    ]
+    for tokens, kwargs, expected_sentences in test_cases:
+        actual_sentences = []
+        async for sentence in collate_response_async(
+            _agen_from_list(tokens), **kwargs
+        ):
+            actual_sentences.append(sentence)
+        assert actual_sentences == expected_sentences
+
+
 def test_format_openai_chat_messages_from_transcript():
     test_cases = [
         (
@@ -440,3 +479,38 @@ def test_format_openai_chat_messages_from_transcript():
 
     for params, expected_output in test_cases:
         assert format_openai_chat_messages_from_transcript(*params) == expected_output
+
+
+def test_openai_chat_messages_builder_matches_full_formatting():
+    transcript = Transcript()
+    builder = OpenAIChatMessagesBuilder()
+
+    def assert_matches_full_formatting():
+        assert builder.build(
+            transcript, "prompt preamble"
+        ) == format_openai_chat_messages_from_transcript(
+            transcript, "prompt preamble"
+        )
+
+    transcript.add_bot_message("Hello!", conversation_id="asdf")
+    assert_matches_full_formatting()
+    transcript.add_bot_message("How are", conversation_id="asdf")
+    assert_matches_full_formatting()
+    # the latest bot message is updated in place as it is spoken
+    transcript.event_logs[-1].text = "How are you doing today?"
+    assert_matches_full_formatting()
+    transcript.add_human_message("I'm doing well, thanks!", conversation_id="asdf")
+    transcript.add_action_start_log(
+        ActionInput(action_config=ActionConfig(), conversation_id="asdf", params={}),
+        conversation_id="asdf",
+    )
+    assert_matches_full_formatting()
+    transcript.add_bot_message("It's sunny and", conversation_id="asdf")
+    transcript.add_human_message("Great", conversation_id="asdf")
+    transcript.update_last_bot_message_on_cut_off("It's sunny")
+    assert_matches_full_formatting()
+    assert builder.build(transcript)[-2] == {"role": "assistant", "content": "It's sunny"}
+
+    # a new transcript starts over
+    transcript = Transcript()
+    assert builder.build(transcript) == []
@@ -0,0 +1,57 @@
+from typing import Any, List, Optional
+
+import pytest
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.model import BaseModel, TypedModel
+from vocode.streaming.models.transcriber import (
+    DeepgramTranscriberConfig,
+    EndpointingConfig,
+    PunctuationEndpointingConfig,
+    TranscriberConfig,
+)
+
+
+class TranscriberConfigs(BaseModel):
+    transcriber_configs: List[TranscriberConfig]
+    endpointing_config: Optional[EndpointingConfig] = None
+    untyped: Any = None
+    kwargs: dict = {}
+
+
+def test_parse_obj_looks_up_subtypes():
+    transcriber_config = DeepgramTranscriberConfig(
+        sampling_rate=8000,
+        audio_encoding=AudioEncoding.MULAW,
+        chunk_size=160,
+        endpointing_config=PunctuationEndpointingConfig(),
+    )
+    assert transcriber_config.type == "transcriber_deepgram"
+    assert transcriber_config.dict()["type"] == "transcriber_deepgram"
+
+    parsed = TypedModel.parse_obj(transcriber_config.dict())
+    assert parsed == transcriber_config
+    assert isinstance(parsed.endpointing_config, PunctuationEndpointingConfig)
+    assert TranscriberConfig.parse_obj(transcriber_config.dict()) == transcriber_config
+
+    assert TypedModel.get_type("DeepgramTranscriberConfig") == "transcriber_deepgram"
+    with pytest.raises(ValueError):
+        TypedModel.get_cls("transcriber_unknown")
+
+
+def test_nested_fields_are_parsed_polymorphically():
+    endpointing_config = PunctuationEndpointingConfig().dict()
+    configs = TranscriberConfigs(
+        transcriber_configs=[
+            DeepgramTranscriberConfig(
+                sampling_rate=8000, audio_encoding=AudioEncoding.MULAW, chunk_size=160
+            ).dict()
+        ],
+        endpointing_config=endpointing_config,
+        untyped=endpointing_config,
+        kwargs={"type": "not_a_typed_model"},
+    )
+    assert isinstance(configs.transcriber_configs[0], DeepgramTranscriberConfig)
+    assert isinstance(configs.endpointing_config, PunctuationEndpointingConfig)
+    assert isinstance(configs.untyped, PunctuationEndpointingConfig)
+    # fields that can't hold a TypedModel are left alone
+    assert configs.kwargs == {"type": "not_a_typed_model"}
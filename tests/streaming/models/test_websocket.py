@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.events import Sender
+from vocode.streaming.models.transcript import TranscriptEvent
+from vocode.streaming.models.websocket import (
+    AudioFraming,
+    AudioMessage,
+    BINARY_AUDIO_FRAME_HEADER,
+    TranscriptMessage,
+    WebSocketMessage,
+    decode_binary_audio_frame,
+    encode_binary_audio_frame,
+)
+from vocode.streaming.output_device.websocket_output_device import (
+    WebsocketOutputDevice,
+)
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+    async def send_bytes(self, message: bytes):
+        self.sent.append(message)
+
+
+def test_binary_audio_frame_round_trip():
+    frame = encode_binary_audio_frame(b"\x01\x02\x03", 2**32 + 5)
+    assert len(frame) == BINARY_AUDIO_FRAME_HEADER.size + 3
+    assert decode_binary_audio_frame(frame) == (5, b"\x01\x02\x03")
+
+    with pytest.raises(ValueError):
+        decode_binary_audio_frame(b"\x02" + frame[1:])
+    with pytest.raises(ValueError):
+        decode_binary_audio_frame(frame[:2])
+
+
+@pytest.mark.asyncio
+async def test_websocket_output_device_framing():
+    for audio_framing in AudioFraming:
+        ws = RecordingWebSocket()
+        output_device = WebsocketOutputDevice(
+            ws, 16000, AudioEncoding.LINEAR16, audio_framing=audio_framing
+        )
+        output_device.start()
+        output_device.consume_nonblocking(b"\x00\x01")
+        output_device.consume_nonblocking(b"\x02\x03")
+        await asyncio.sleep(0)
+        output_device.terminate()
+
+        if audio_framing == AudioFraming.BINARY:
+            assert [decode_binary_audio_frame(frame) for frame in ws.sent] == [
+                (0, b"\x00\x01"),
+                (1, b"\x02\x03"),
+            ]
+        else:
+            assert [WebSocketMessage.parse_raw(message) for message in ws.sent] == [
+                AudioMessage.from_bytes(b"\x00\x01"),
+                AudioMessage.from_bytes(b"\x02\x03"),
+            ]
+
+
+@pytest.mark.asyncio
+async def test_websocket_output_device_drops_audio_but_not_transcripts():
+    ws = RecordingWebSocket()
+    output_device = WebsocketOutputDevice(
+        ws,
+        16000,
+        AudioEncoding.LINEAR16,
+        audio_framing=AudioFraming.BINARY,
+        max_queue_size=2,
+    )
+    output_device.start()
+    transcript_event = TranscriptEvent(
+        conversation_id="conversation", text="hi", sender=Sender.BOT, timestamp=1.0
+    )
+    output_device.consume_transcript(transcript_event)
+    for i in range(4):
+        output_device.consume_nonblocking(bytes([i]))
+    await asyncio.sleep(0)
+    output_device.terminate()
+
+    assert TranscriptMessage.parse_raw(ws.sent[0]) == TranscriptMessage.from_event(
+        transcript_event
+    )
+    assert [decode_binary_audio_frame(frame) for frame in ws.sent[1:]] == [
+        (2, b"\x02"),
+        (3, b"\x03"),
+    ]
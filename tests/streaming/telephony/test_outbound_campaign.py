@@ -0,0 +1,122 @@
+import asyncio
+from typing import List, Set
+
+import pytest
+
+from vocode.streaming.models.agent import EchoAgentConfig
+from vocode.streaming.models.events import PhoneCallEndedEvent
+from vocode.streaming.models.telephony import TwilioConfig
+from vocode.streaming.telephony.client.twilio_client import TwilioClient
+from vocode.streaming.telephony.config_manager.in_memory_config_manager import (
+    InMemoryConfigManager,
+)
+from vocode.streaming.telephony.conversation import outbound_campaign
+from vocode.streaming.telephony.conversation.outbound_campaign import (
+    OutboundCampaign,
+    OutboundCampaignTarget,
+)
+from vocode.streaming.utils.rate_limiter import RateLimiter
+
+
+class FakeTwilioClient(TwilioClient):
+    def __init__(self, twilio_config: TwilioConfig):
+        super().__init__("example.com", twilio_config)
+        self.calls: List[str] = []
+        self.ended_calls: Set[str] = set()
+
+    async def get_line_type(self, phone: str):
+        return "landline" if phone.endswith("0") else "mobile"
+
+    async def create_call(self, conversation_id, to_phone, from_phone, **kwargs):
+        self.calls.append(from_phone)
+        return f"CA{len(self.calls)}"
+
+    async def end_call(self, twilio_sid):
+        self.ended_calls.add(twilio_sid)
+        return True
+
+    async def is_call_ended(self, twilio_sid):
+        return twilio_sid in self.ended_calls
+
+
+class FailingConfigManager(InMemoryConfigManager):
+    async def save_config(self, conversation_id, config):
+        raise RuntimeError("config store is down")
+
+
+def create_campaign(config_manager, max_concurrent_calls=2) -> OutboundCampaign:
+    campaign = OutboundCampaign(
+        base_url="example.com",
+        from_phones=["+15550100", "+15550200"],
+        config_manager=config_manager,
+        agent_config=EchoAgentConfig(),
+        twilio_config=TwilioConfig(account_sid="AC123", auth_token="token"),
+        max_concurrent_calls=max_concurrent_calls,
+        account_calls_per_second=1000,
+        number_calls_per_second=1000,
+    )
+    campaign.telephony_client = FakeTwilioClient(campaign.twilio_config)
+    return campaign
+
+
+def test_rate_limiter_spaces_out_waiters():
+    rate_limiter = RateLimiter(calls_per_second=4, get_time=lambda: 10.0)
+    assert [rate_limiter.reserve() for _ in range(3)] == [0, 0.25, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_campaign_respects_concurrent_call_cap():
+    config_manager = InMemoryConfigManager()
+    campaign = create_campaign(config_manager)
+    telephony_client = campaign.telephony_client
+    targets = [
+        OutboundCampaignTarget(to_phone=to_phone)
+        for to_phone in ["+15551111", "+15552220", "+15553333", "+15554444"]
+    ]
+    run_task = asyncio.create_task(campaign.run(targets))
+    await asyncio.sleep(0.05)
+    # the landline didn't take a slot
+    assert campaign.get_metrics().num_calls_placed == 2
+    assert campaign.get_metrics().num_targets_rejected == 1
+    assert not run_task.done()
+
+    campaign.on_event(
+        PhoneCallEndedEvent(conversation_id=next(iter(campaign.active_calls)))
+    )
+    metrics = await asyncio.wait_for(run_task, timeout=1)
+    assert metrics.num_targets == 4
+    assert metrics.num_calls_placed == 3
+    assert metrics.num_active_calls == 2
+    # from numbers are used in turn
+    assert telephony_client.calls == ["+15550100", "+15550100", "+15550200"]
+    assert len(config_manager.configs) == 3
+
+
+@pytest.mark.asyncio
+async def test_calls_the_provider_reports_over_free_their_slot(monkeypatch):
+    monkeypatch.setattr(
+        outbound_campaign, "OUTBOUND_CAMPAIGN_CALL_ENDED_POLL_SECONDS", 0.01
+    )
+    campaign = create_campaign(InMemoryConfigManager(), max_concurrent_calls=1)
+    targets = [
+        OutboundCampaignTarget(to_phone=to_phone) for to_phone in ["+15551111", "+15553333"]
+    ]
+    run_task = asyncio.create_task(campaign.run(targets))
+    await asyncio.sleep(0.05)
+    assert campaign.get_metrics().num_calls_placed == 1
+
+    # e.g. not answered: the call never connects, so no events and no config deletion
+    campaign.telephony_client.ended_calls.add("CA1")
+    metrics = await asyncio.wait_for(run_task, timeout=1)
+    assert metrics.num_calls_placed == 2
+    assert list(campaign.active_calls.values())[0].telephony_id == "CA2"
+
+
+@pytest.mark.asyncio
+async def test_calls_whose_config_cant_be_saved_are_hung_up():
+    campaign = create_campaign(FailingConfigManager())
+    metrics = await campaign.run([OutboundCampaignTarget(to_phone="+15551111")])
+    assert metrics.num_calls_placed == 0
+    assert metrics.num_calls_failed == 1
+    assert campaign.telephony_client.ended_calls == {"CA1"}
+    assert not campaign.call_slots.locked()
@@ -0,0 +1,43 @@
+import pytest
+
+from vocode.streaming.telephony.server.telephony_worker import TelephonyWorker
+from vocode.streaming.telephony.worker_registry.in_memory_worker_registry import (
+    InMemoryWorkerRegistry,
+)
+
+
+def create_worker(
+    worker_id: str, registry: InMemoryWorkerRegistry, num_calls: int
+) -> TelephonyWorker:
+    worker = TelephonyWorker(worker_id, f"example.com/worker/{worker_id}", registry)
+    worker.get_num_calls = lambda: num_calls
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_calls_go_to_least_loaded_worker():
+    registry = InMemoryWorkerRegistry()
+    worker = create_worker("0", registry, num_calls=2)
+    other_worker = create_worker("1", registry, num_calls=0)
+    await registry.report_load(other_worker.get_load(), ttl_seconds=10)
+
+    chosen_load = await worker.choose_worker()
+    assert chosen_load.worker_id == "1"
+    assert chosen_load.base_url == "example.com/worker/1"
+    # calls already sent there count until it reports again
+    assert (await worker.choose_worker()).worker_id == "1"
+    assert (await worker.choose_worker()).worker_id == "0"
+
+    await registry.report_load(other_worker.get_load(), ttl_seconds=10)
+    assert (await worker.choose_worker()).worker_id == "1"
+
+
+@pytest.mark.asyncio
+async def test_stale_workers_are_not_chosen():
+    registry = InMemoryWorkerRegistry()
+    worker = create_worker("0", registry, num_calls=5)
+    await registry.report_load(
+        create_worker("1", registry, num_calls=0).get_load(), ttl_seconds=0
+    )
+    assert (await worker.choose_worker()).worker_id == "0"
+    assert [load.worker_id for load in await worker.get_loads()] == ["0"]
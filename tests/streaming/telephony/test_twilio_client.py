@@ -0,0 +1,64 @@
+from typing import List, Tuple
+
+import pytest
+
+from vocode.streaming.models.telephony import TwilioConfig
+from vocode.streaming.telephony.client import twilio_client
+from vocode.streaming.telephony.client.twilio_client import (
+    TwilioClient,
+    to_twilio_params,
+)
+
+
+class RecordingTwilioClient(TwilioClient):
+    def __init__(self, twilio_config: TwilioConfig):
+        super().__init__("example.com", twilio_config)
+        self.requests: List[Tuple[str, str, dict]] = []
+
+    async def request(self, method, url, action, params=None, data=None):
+        self.requests.append((method, url, data))
+        if url.endswith("/Calls.json"):
+            return {"sid": "CA123"}
+        return {"status": "completed"}
+
+
+def test_to_twilio_params():
+    assert to_twilio_params(
+        {
+            "machine_detection": "Enable",
+            "status_callback_event": ["initiated", "answered"],
+            "record": False,
+            "send_digits": None,
+        }
+    ) == {
+        "MachineDetection": "Enable",
+        "StatusCallbackEvent": ["initiated", "answered"],
+        "Record": "false",
+    }
+
+
+@pytest.mark.asyncio
+async def test_credentials_are_checked_once(monkeypatch):
+    monkeypatch.setattr(twilio_client, "validated_credentials", set())
+    twilio_config = TwilioConfig(
+        account_sid="AC123",
+        auth_token="token",
+        extra_params={"time_limit": 60, "recordings_create_params": {}},
+    )
+    client = RecordingTwilioClient(twilio_config)
+    assert await client.create_call("conversation", "+15550001", "+15550002") == "CA123"
+    other_client = RecordingTwilioClient(twilio_config)
+    assert await other_client.end_call("CA123")
+    assert len(other_client.requests) == 1
+
+    account_url = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+    assert [(method, url) for method, url, _ in client.requests] == [
+        ("GET", f"{account_url}.json"),
+        ("POST", f"{account_url}/Calls.json"),
+    ]
+    call_params = client.requests[1][2]
+    assert call_params["To"] == "+15550001"
+    assert call_params["From"] == "+15550002"
+    assert call_params["TimeLimit"] == "60"
+    assert "RecordingsCreateParams" not in call_params
+    assert "connect_call/conversation" in call_params["Twiml"]
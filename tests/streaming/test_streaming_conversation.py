@@ -11,7 +11,9 @@ from vocode.streaming.agent.echo_agent import EchoAgent
 from vocode.streaming.models.agent import EchoAgentConfig
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.events import Event, EventType
 from vocode.streaming.streaming_conversation import StreamingConversation
+from vocode.streaming.utils.events_manager import EventsManager
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -49,3 +51,104 @@ async def test_streaming_conversation():
     await conversation.start()
     await asyncio.sleep(1)
     await conversation.terminate()
+
+
+@pytest.mark.asyncio
+async def test_streaming_conversation_follows_up_when_idle():
+    sampling_rate = 16000
+    audio_encoding = AudioEncoding.LINEAR16
+    chunk_size = 2048
+    silent_output_device = SilentOutputDevice(
+        sampling_rate=sampling_rate, audio_encoding=audio_encoding
+    )
+
+    conversation = StreamingConversation(
+        output_device=silent_output_device,
+        transcriber=TestAsyncTranscriber(
+            TestTranscriberConfig(
+                sampling_rate=sampling_rate,
+                audio_encoding=audio_encoding,
+                chunk_size=chunk_size,
+            )
+        ),
+        agent=EchoAgent(EchoAgentConfig(idle_time_before_follow_up=0.2)),
+        synthesizer=TestSynthesizer(
+            TestSynthesizerConfig.from_output_device(silent_output_device)
+        ),
+        logger=logger,
+    )
+    await conversation.start()
+    await asyncio.sleep(0.3)
+    assert conversation.follow_up_message_count == 1
+    assert conversation.is_active()
+    await asyncio.sleep(1)
+    assert conversation.follow_up_message_count == 2
+    assert not conversation.is_active()
+
+
+class RecordingEventsManager(EventsManager):
+    def __init__(self):
+        super().__init__(subscriptions=list(EventType))
+        self.published_events: list = []
+
+    def publish_event(self, event: Event):
+        self.published_events.append(event)
+
+
+class FailingWarmupSynthesizer(TestSynthesizer):
+    def ready_synthesizer(self):
+        raise RuntimeError("connection refused")
+
+
+def create_conversation(synthesizer_class=TestSynthesizer, events_manager=None):
+    sampling_rate = 16000
+    audio_encoding = AudioEncoding.LINEAR16
+    silent_output_device = SilentOutputDevice(
+        sampling_rate=sampling_rate, audio_encoding=audio_encoding
+    )
+    return StreamingConversation(
+        output_device=silent_output_device,
+        transcriber=TestAsyncTranscriber(
+            TestTranscriberConfig(
+                sampling_rate=sampling_rate,
+                audio_encoding=audio_encoding,
+                chunk_size=2048,
+            )
+        ),
+        agent=EchoAgent(EchoAgentConfig()),
+        synthesizer=synthesizer_class(
+            TestSynthesizerConfig.from_output_device(silent_output_device)
+        ),
+        events_manager=events_manager,
+        logger=logger,
+    )
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_warmup_failure_falls_back_to_cold_start():
+    conversation = create_conversation(synthesizer_class=FailingWarmupSynthesizer)
+    conversation.start_prewarm()
+    assert conversation.prewarm_task is not None
+    await conversation.prewarm_task
+
+    await conversation.start()
+    assert conversation.is_active()
+    await conversation.terminate()
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_conversation_is_torn_down_without_events():
+    events_manager = RecordingEventsManager()
+    conversation = create_conversation(events_manager=events_manager)
+    conversation.start_prewarm()
+    assert conversation.prewarm_task is not None
+    await conversation.prewarm_task
+
+    await conversation.terminate(publish_events=False)
+    assert events_manager.published_events == []
+    assert not conversation.is_active()
+
+    await conversation.terminate()
+    assert [event.type for event in events_manager.published_events] == [
+        EventType.TRANSCRIPT_COMPLETE
+    ]
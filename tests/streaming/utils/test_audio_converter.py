@@ -0,0 +1,41 @@
+import audioop
+import os
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.utils.audio_converter import StreamingAudioConverter
+
+
+def convert_in_chunks(converter: StreamingAudioConverter, audio: bytes, chunk_size: int):
+    return b"".join(
+        converter.convert(audio[i : i + chunk_size])
+        for i in range(0, len(audio), chunk_size)
+    )
+
+
+def test_chunked_resampling_matches_one_shot_resampling():
+    audio = os.urandom(48000 * 2)
+    expected, _ = audioop.ratecv(audio, 2, 1, 48000, 16000, None)
+
+    # odd chunk sizes split samples across chunks
+    for chunk_size in (320, 4097):
+        converter = StreamingAudioConverter(
+            input_sampling_rate=48000, output_sampling_rate=16000
+        )
+        assert convert_in_chunks(converter, audio, chunk_size) == expected
+
+
+def test_converts_between_encodings():
+    audio = os.urandom(8000 * 2)
+    converter = StreamingAudioConverter(
+        input_sampling_rate=8000,
+        output_sampling_rate=8000,
+        output_encoding=AudioEncoding.MULAW,
+    )
+    assert converter.convert(audio) == audioop.lin2ulaw(audio, 2)
+
+    converter = StreamingAudioConverter(
+        input_sampling_rate=8000,
+        output_sampling_rate=8000,
+        input_encoding=AudioEncoding.MULAW,
+    )
+    assert converter.convert(audio) == audioop.ulaw2lin(audio, 2)
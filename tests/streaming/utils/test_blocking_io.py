@@ -0,0 +1,42 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+from vocode.streaming.utils.blocking_io import iterate_blocking_reads
+
+
+@pytest.mark.asyncio
+async def test_reads_run_off_the_loop_until_a_short_read():
+    stream = io.BytesIO(bytes(range(10)))
+    read_threads = set()
+
+    def read() -> bytes:
+        read_threads.add(threading.get_ident())
+        return stream.read(4)
+
+    chunks = [chunk async for chunk in iterate_blocking_reads(read, chunk_size=4)]
+    assert chunks == [bytes(range(4)), bytes(range(4, 8)), bytes(range(8, 10))]
+    assert threading.get_ident() not in read_threads
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_read_ahead_and_errors_passed_on():
+    num_reads = 0
+
+    def read() -> bytes:
+        nonlocal num_reads
+        num_reads += 1
+        if num_reads == 3:
+            raise RuntimeError("stream broke")
+        return b"ab"
+
+    chunks = iterate_blocking_reads(read, chunk_size=2, prefetch_chunks=2)
+    assert await chunks.__anext__() == b"ab"
+    await asyncio.sleep(0.05)
+    # the next chunk and the error were read while the consumer was busy
+    assert num_reads == 3
+    assert await chunks.__anext__() == b"ab"
+    with pytest.raises(RuntimeError):
+        await chunks.__anext__()
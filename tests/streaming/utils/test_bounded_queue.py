@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from vocode.streaming.utils.bounded_queue import (
+    BoundedQueue,
+    QueueOverflowPolicy,
+    get_queue_metrics,
+)
+from vocode.streaming.utils.worker import AsyncWorker
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_newest_items():
+    queue: BoundedQueue[int] = BoundedQueue(
+        3, QueueOverflowPolicy.DROP_OLDEST, name="audio"
+    )
+    for i in range(5):
+        queue.put_nowait(i)
+    await queue.put(5)
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [3, 4, 5]
+    metrics = queue.get_metrics()
+    assert metrics.name == "audio"
+    assert metrics.depth == 0
+    assert metrics.max_depth == 3
+    assert metrics.num_dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_only_bounds_and_drops_droppable_items():
+    queue: BoundedQueue[object] = BoundedQueue(
+        2,
+        QueueOverflowPolicy.DROP_OLDEST,
+        is_droppable=lambda item: isinstance(item, bytes),
+    )
+    for item in [b"0", "mark 0", b"1", "mark 1", "mark 2", b"2", b"3"]:
+        queue.put_nowait(item)
+    await queue.put("mark 3")
+    assert queue.get_metrics().num_dropped == 2
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        "mark 0",
+        "mark 1",
+        "mark 2",
+        b"2",
+        b"3",
+        "mark 3",
+    ]
+    # getting frees room for droppable items again
+    queue.put_nowait(b"4")
+    queue.put_nowait(b"5")
+    assert queue.get_metrics().num_dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_room():
+    queue: BoundedQueue[int] = BoundedQueue(1, QueueOverflowPolicy.BLOCK)
+    await queue.put(0)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(1)
+    put_task = asyncio.create_task(queue.put(1))
+    await asyncio.sleep(0)
+    assert not put_task.done()
+    assert queue.get_nowait() == 0
+    await put_task
+    assert queue.get_nowait() == 1
+    assert queue.get_metrics().num_blocked_puts == 1
+
+    assert get_queue_metrics([queue, asyncio.Queue(), None]) == [queue.get_metrics()]
+
+
+@pytest.mark.asyncio
+async def test_workers_get_their_own_output_queue():
+    assert (
+        AsyncWorker(asyncio.Queue()).output_queue
+        is not AsyncWorker(asyncio.Queue()).output_queue
+    )
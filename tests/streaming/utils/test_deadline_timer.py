@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from vocode.streaming.utils.deadline_timer import DeadlineTimer
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_waits_for_latest_deadline():
+    deadline = time.time() + 0.05
+    fired_at = []
+    timer = DeadlineTimer(lambda: fired_at.append(time.time()), lambda: deadline)
+    timer.start()
+    await asyncio.sleep(0.03)
+    # pushed back without re-arming
+    deadline = time.time() + 0.05
+    await asyncio.sleep(0.04)
+    assert not fired_at
+    assert timer.is_armed()
+    await asyncio.sleep(0.05)
+    assert len(fired_at) == 1
+    assert fired_at[0] >= deadline
+    assert not timer.is_armed()
+
+
+@pytest.mark.asyncio
+async def test_deadline_timer_cancel_and_no_deadline():
+    fired = []
+    deadline = None
+    timer = DeadlineTimer(lambda: fired.append(True), lambda: deadline)
+    timer.start()
+    assert not timer.is_armed()
+
+    deadline = time.time() + 0.02
+    timer.start()
+    timer.cancel()
+    await asyncio.sleep(0.04)
+    assert not fired
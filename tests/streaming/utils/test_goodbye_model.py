@@ -0,0 +1,50 @@
+import pytest
+
+from vocode.streaming.utils.goodbye_model import GoodbyeModel
+
+
+@pytest.mark.asyncio
+async def test_local_goodbye_model():
+    goodbye_model = GoodbyeModel(
+        use_local_model=True, utterance_embeddings_cache_size=2
+    )
+    await goodbye_model.initialize_embeddings()
+    for text in [
+        "Bye!",
+        "Okay, talk to you later",
+        "Alright, have a good night.",
+        "Thanks, have a great day!",
+        "See you soon",
+        # the goodbye is one clause of the utterance
+        "thanks, you too, have a great day!",
+        "alright, cheers mate, see you later",
+        "Okay, thanks again, take care now",
+        "Great, talk to you next week",
+    ]:
+        assert await goodbye_model.is_goodbye(text), text
+    for text in [
+        "Hello, I'd like to book an appointment",
+        "See you on Monday at 9am for your appointment?",
+        "I had a good day",
+        "Can I talk to you about my bill?",
+        "Take a seat",
+        # goodbye wording that isn't a goodbye
+        "do you have a good day on tuesday?",
+        "Did you have a nice weekend?",
+        "See you tomorrow?",
+        "You have a good day on Tuesday then",
+        "Let me take care of that for you",
+    ]:
+        assert not await goodbye_model.is_goodbye(text), text
+
+
+@pytest.mark.asyncio
+async def test_local_goodbye_model_caches_recent_utterances():
+    goodbye_model = GoodbyeModel(
+        use_local_model=True, utterance_embeddings_cache_size=2
+    )
+    await goodbye_model.is_goodbye("hello")
+    await goodbye_model.is_goodbye("how are you")
+    await goodbye_model.is_goodbye("hello")
+    await goodbye_model.is_goodbye("see you later")
+    assert list(goodbye_model.utterance_embeddings) == ["hello", "see you later"]
@@ -0,0 +1,20 @@
+import pytest
+
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_until_closed():
+    pool = HTTPResourcePool()
+    session = pool.get_aiohttp_session()
+    assert pool.get_aiohttp_session() is session
+
+    client = pool.get_openai_client("api_key")
+    assert pool.get_openai_client("api_key") is client
+    assert pool.get_openai_client("other_api_key") is not client
+    assert pool.get_stats()["openai_clients_reused"] == 1
+
+    await pool.close()
+    assert session.closed
+    assert pool.get_openai_client("api_key") is not client
+    await pool.close()
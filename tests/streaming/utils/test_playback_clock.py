@@ -0,0 +1,46 @@
+from vocode.streaming.utils.playback_clock import PlaybackClock
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pacing_does_not_drift():
+    fake_time = FakeTime()
+    playback_clock = PlaybackClock(lead_seconds=0.01, get_time=fake_time)
+    for _ in range(50):
+        playback_clock.on_sent(0.02)
+        # sending takes a little time, which isn't lost from the next delay
+        fake_time.now += 0.005
+        delay = playback_clock.get_send_delay()
+        fake_time.now += delay
+    assert abs(fake_time.now - (100.0 + 50 * 0.02 - 0.01)) < 1e-9
+    assert abs(playback_clock.get_seconds_played() - (1 - 0.01)) < 1e-9
+
+
+def test_playback_restarts_after_running_dry():
+    fake_time = FakeTime()
+    playback_clock = PlaybackClock(get_time=fake_time)
+    playback_clock.on_sent(0.5)
+    fake_time.now += 2
+    assert playback_clock.get_seconds_played() == 0.5
+    playback_clock.on_sent(0.5)
+    assert playback_clock.get_seconds_buffered() == 0.5
+    assert playback_clock.get_send_delay() == 0.5
+
+
+def test_playback_marks_correct_the_clock():
+    fake_time = FakeTime()
+    playback_clock = PlaybackClock(get_time=fake_time)
+    playback_clock.on_sent(0.1)
+    on_first_chunk_played = playback_clock.create_on_played()
+    playback_clock.on_sent(0.1)
+    # the first chunk took a while to reach the device
+    fake_time.now += 0.15
+    on_first_chunk_played()
+    assert abs(playback_clock.get_seconds_played() - 0.1) < 1e-9
+    assert abs(playback_clock.get_send_delay() - 0.1) < 1e-9
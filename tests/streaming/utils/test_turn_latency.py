@@ -0,0 +1,47 @@
+from vocode.streaming.models.transcript import Transcript
+from vocode.streaming.utils import turn_latency
+from vocode.streaming.utils.turn_latency import TurnLatencyTracker
+
+
+def test_turn_latency_tracker(monkeypatch):
+    monkeypatch.setattr(turn_latency.time, "time", iter(range(100)).__next__)
+    transcript = Transcript()
+    tracker = TurnLatencyTracker(transcript)
+
+    turn_id = tracker.start_turn()
+    for mark in [
+        tracker.mark_agent_first_token,
+        tracker.mark_synthesis_complete,
+        tracker.mark_first_audio,
+    ]:
+        mark(turn_id)
+        # only the first mark of each stage counts
+        mark(turn_id)
+        mark(None)
+        mark("unknown")
+
+    assert len(transcript.turn_latencies) == 1
+    latency = transcript.turn_latencies[0]
+    assert latency.turn_id == turn_id
+    assert latency.transcription_time == 0
+    assert latency.agent_first_token_time == 1
+    assert latency.synthesis_time == 2
+    assert latency.first_audio_time == 3
+    assert tracker.turns == {}
+
+
+def test_turn_latency_tracker_tracks_turns_until_first_audio():
+    transcript = Transcript()
+    tracker = TurnLatencyTracker(transcript)
+
+    first_turn_id = tracker.start_turn()
+    second_turn_id = tracker.start_turn()
+    tracker.mark_agent_first_token(first_turn_id)
+    tracker.mark_first_audio(second_turn_id)
+
+    assert list(tracker.turns) == [first_turn_id]
+    assert [latency.turn_id for latency in transcript.turn_latencies] == [
+        first_turn_id,
+        second_turn_id,
+    ]
+    assert transcript.turn_latencies[0].first_audio_time is None
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from vocode.streaming.utils.worker import InterruptibleEvent, InterruptibleWorker
+
+
+class SleepingWorker(InterruptibleWorker):
+    async def process(self, item: InterruptibleEvent):
+        delay, output = item.payload
+        await asyncio.sleep(delay)
+        self.produce_nonblocking(output)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_outputs_in_input_order():
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = SleepingWorker(input_queue, output_queue, max_concurrency=3)
+    worker.start()
+    start = asyncio.get_running_loop().time()
+    for delay, output in [(0.3, "first"), (0.1, "second"), (0.2, "third")]:
+        worker.consume_nonblocking(InterruptibleEvent((delay, output)))
+
+    outputs = [await asyncio.wait_for(output_queue.get(), 1) for _ in range(3)]
+
+    assert outputs == ["first", "second", "third"]
+    # all three ran at once, so the total time is bounded by the slowest item
+    assert asyncio.get_running_loop().time() - start < 0.5
+    worker.terminate()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_cancels_all_in_flight_tasks():
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = SleepingWorker(input_queue, output_queue, max_concurrency=2)
+    worker.start()
+    worker.consume_nonblocking(InterruptibleEvent((10, "interruptible")))
+    worker.consume_nonblocking(
+        InterruptibleEvent((0.1, "not interruptible"), is_interruptible=False)
+    )
+    await asyncio.sleep(0.05)
+
+    assert len(worker.in_flight_tasks) == 2
+    assert worker.cancel_current_task()
+
+    assert await asyncio.wait_for(output_queue.get(), 1) == "not interruptible"
+    assert not worker.in_flight_tasks
+    worker.terminate()
+
+
+class BackgroundProducingWorker(InterruptibleWorker):
+    async def process(self, item: InterruptibleEvent):
+        delay, output = item.payload
+        self.produce_nonblocking(output)
+        self.create_producer_task(self.produce_later(delay, f"{output} (background)"))
+
+    async def produce_later(self, delay: float, output: str):
+        await asyncio.sleep(delay)
+        self.produce_nonblocking(output)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_keeps_slot_open_for_producer_tasks():
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = BackgroundProducingWorker(input_queue, output_queue, max_concurrency=2)
+    worker.start()
+    for delay, output in [(0.2, "first"), (0, "second")]:
+        worker.consume_nonblocking(InterruptibleEvent((delay, output)))
+
+    outputs = [await asyncio.wait_for(output_queue.get(), 1) for _ in range(4)]
+
+    assert outputs == [
+        "first",
+        "first (background)",
+        "second",
+        "second (background)",
+    ]
+    worker.terminate()
+
+
+class SideEffectWorker(InterruptibleWorker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.side_effects: list = []
+
+    async def process(self, item: InterruptibleEvent):
+        delay, output = item.payload
+        if output is None:
+            await self.wait_for_output_turn()
+            self.side_effects.append(self.output_queue.qsize())
+            return
+        await asyncio.sleep(delay)
+        self.produce_nonblocking(output)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_side_effects_wait_for_earlier_outputs():
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = SideEffectWorker(input_queue, output_queue, max_concurrency=3)
+    worker.start()
+    for delay, output in [(0.2, "first"), (0.1, "second"), (0, None)]:
+        worker.consume_nonblocking(InterruptibleEvent((delay, output)))
+    await asyncio.sleep(0.3)
+
+    # the side effect ran only once both earlier items had published their outputs
+    assert worker.side_effects == [2]
+    worker.terminate()
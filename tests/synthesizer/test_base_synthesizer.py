@@ -0,0 +1,48 @@
+import io
+import struct
+import wave
+
+import pytest
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
+from vocode.streaming.synthesizer.base_synthesizer import (
+    decode_wav_chunk,
+    encode_as_wav,
+)
+
+AUDIO = bytes(range(256)) * 4
+
+
+def test_decode_wav_chunk_strips_a_plain_header():
+    synthesizer_config = AzureSynthesizerConfig(
+        sampling_rate=16000, audio_encoding=AudioEncoding.LINEAR16
+    )
+    assert bytes(decode_wav_chunk(encode_as_wav(AUDIO, synthesizer_config))) == AUDIO
+
+    wav_file = io.BytesIO()
+    with wave.open(wav_file, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(AUDIO)
+    assert bytes(decode_wav_chunk(wav_file.getvalue())) == AUDIO
+
+
+def test_decode_wav_chunk_skips_extra_chunks():
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+    # odd sized, so it's followed by a pad byte
+    info = b"INFOISFT\x07\x00\x00\x00Lavf58\x00"
+    chunks = (
+        b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", len(info)) + info + b"\x00"
+        + b"data" + struct.pack("<I", len(AUDIO)) + AUDIO
+    )
+    wav = b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks
+
+    assert bytes(decode_wav_chunk(wav)) == AUDIO
+
+
+def test_decode_wav_chunk_rejects_audio_without_a_header():
+    with pytest.raises(ValueError):
+        decode_wav_chunk(AUDIO)
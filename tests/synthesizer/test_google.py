@@ -0,0 +1,141 @@
+import io
+import wave
+from typing import List
+
+import pytest
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import GoogleSynthesizerConfig
+from vocode.streaming.synthesizer.google_synthesizer import (
+    GOOGLE_SAMPLING_RATE,
+    GoogleSynthesizer,
+    create_ssml_with_marks,
+    get_message_up_to_from_timepoints,
+)
+
+AUDIO = bytes(range(256)) * 20
+
+
+def encode_wav(audio: bytes) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(GOOGLE_SAMPLING_RATE)
+        wav.writeframes(audio)
+    return output.getvalue()
+
+
+class FakeTextToSpeechAsyncClient:
+    def __init__(self):
+        self.requests: List = []
+
+    async def synthesize_speech(self, request):
+        from google.cloud import texttospeech_v1beta1 as tts
+
+        self.requests.append(request)
+        return tts.SynthesizeSpeechResponse(
+            audio_content=encode_wav(AUDIO),
+            timepoints=[
+                tts.Timepoint(mark_name="0", time_seconds=0.0),
+                tts.Timepoint(mark_name="6", time_seconds=0.5),
+            ],
+        )
+
+    async def streaming_synthesize(self, requests):
+        self.requests.extend([request async for request in requests])
+
+        async def responses():
+            for i in range(0, len(AUDIO), 1000):
+                yield type("Response", (), {"audio_content": AUDIO[i : i + 1000]})
+
+        return responses()
+
+
+@pytest.fixture
+def tts(monkeypatch):
+    tts = pytest.importorskip("google.cloud.texttospeech_v1beta1")
+    import google.auth
+
+    monkeypatch.setattr(google.auth, "default", lambda: (None, None))
+    monkeypatch.setattr(tts, "TextToSpeechAsyncClient", FakeTextToSpeechAsyncClient)
+    return tts
+
+
+def create_synthesizer(experimental_streaming: bool) -> GoogleSynthesizer:
+    return GoogleSynthesizer(
+        GoogleSynthesizerConfig(
+            sampling_rate=GOOGLE_SAMPLING_RATE,
+            audio_encoding=AudioEncoding.LINEAR16,
+            experimental_streaming=experimental_streaming,
+        )
+    )
+
+
+async def synthesize(synthesizer: GoogleSynthesizer, text: str):
+    synthesis_result = await synthesizer.create_speech(
+        BaseMessage(text=text), chunk_size=2048
+    )
+    chunks = [chunk async for chunk in synthesis_result.chunk_generator]
+    return synthesis_result, chunks
+
+
+def test_ssml_marks_each_word_by_its_offset():
+    assert (
+        create_ssml_with_marks("Hi, Tom & Jerry ")
+        == '<speak><mark name="0"/>Hi, <mark name="4"/>Tom <mark name="8"/>&amp; '
+        '<mark name="10"/>Jerry </speak>'
+    )
+
+
+def test_message_is_cut_at_the_first_word_not_yet_spoken():
+    message = "Hi, Tom & Jerry"
+    timepoints = [("0", 0.0), ("4", 0.4), ("8", 0.7), ("10", 0.9)]
+
+    assert get_message_up_to_from_timepoints(message, 0.5, timepoints) == "Hi, Tom "
+    assert get_message_up_to_from_timepoints(message, 1.5, timepoints) == message
+    assert get_message_up_to_from_timepoints(message, 0.5, []) == message
+
+
+@pytest.mark.asyncio
+async def test_synthesize_speech_cuts_off_at_the_marks(tts):
+    synthesizer = create_synthesizer(experimental_streaming=False)
+    synthesis_result, chunks = await synthesize(synthesizer, "Hello there")
+
+    (request,) = synthesizer.client.requests
+    assert request.input.ssml == create_ssml_with_marks("Hello there")
+    # the WAV header is stripped
+    assert b"".join(chunk.chunk for chunk in chunks) == AUDIO
+    assert [chunk.is_last_chunk for chunk in chunks] == [False, False, True]
+    assert synthesis_result.get_message_up_to(0.2) == "Hello "
+
+
+@pytest.mark.asyncio
+async def test_streaming_falls_back_without_streaming_api(tts, monkeypatch):
+    monkeypatch.delattr(tts, "StreamingSynthesizeRequest", raising=False)
+    synthesizer = create_synthesizer(experimental_streaming=True)
+    assert not synthesizer.experimental_streaming
+
+    _, chunks = await synthesize(synthesizer, "Hello there")
+    assert b"".join(chunk.chunk for chunk in chunks) == AUDIO
+
+
+@pytest.mark.asyncio
+async def test_streaming_synthesize_holds_back_the_last_chunk(tts, monkeypatch):
+    if not hasattr(tts, "StreamingSynthesizeRequest"):
+        # stand-ins for the request types of releases that have them
+        for name in [
+            "StreamingSynthesizeRequest",
+            "StreamingSynthesizeConfig",
+            "StreamingSynthesisInput",
+        ]:
+            monkeypatch.setattr(tts, name, dict, raising=False)
+    synthesizer = create_synthesizer(experimental_streaming=True)
+    assert synthesizer.experimental_streaming
+
+    _, chunks = await synthesize(synthesizer, "Hello there")
+    assert len(synthesizer.client.requests) == 2
+    assert b"".join(chunk.chunk for chunk in chunks) == AUDIO
+    assert [len(chunk.chunk) for chunk in chunks] == [2048, 2048, 1024]
+    assert [chunk.is_last_chunk for chunk in chunks] == [False, False, True]
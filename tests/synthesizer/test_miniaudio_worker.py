@@ -0,0 +1,143 @@
+import asyncio
+import audioop
+
+import miniaudio
+import pytest
+
+from tests.streaming.data.loader import get_audio_path
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
+from vocode.streaming.synthesizer.miniaudio_worker import MiniaudioWorker
+from vocode.streaming.utils import convert_linear_audio
+from vocode.streaming.utils.mp3_helper import (
+    get_id3_tag_size,
+    get_mp3_stream_info,
+    parse_mp3_frame_header,
+)
+
+
+def get_fake_audio_mp3() -> bytes:
+    with open(get_audio_path("fake_audio.mp3"), "rb") as f:
+        return f.read()
+
+
+def get_first_audible_sample(audio: bytes, audio_encoding: AudioEncoding) -> int:
+    if audio_encoding == AudioEncoding.MULAW:
+        audio = audioop.ulaw2lin(audio, 2)
+    samples = memoryview(audio).cast("h")
+    return next(i for i, sample in enumerate(samples) if abs(sample) > 100)
+
+
+def decode_complete(
+    synthesizer_config: AzureSynthesizerConfig, mp3: bytes
+) -> bytes:
+    # trimmed here, since whether miniaudio.decode trims depends on its version
+    stream_info = get_mp3_stream_info(mp3)
+    assert stream_info is not None and stream_info.num_samples is not None
+    samples = miniaudio.decode(
+        mp3[stream_info.audio_offset :],
+        nchannels=1,
+        sample_rate=stream_info.sample_rate,
+    ).samples
+    start = stream_info.num_leading_samples
+    return convert_linear_audio(
+        samples[start : start + stream_info.num_samples].tobytes(),
+        input_sample_rate=stream_info.sample_rate,
+        output_sample_rate=synthesizer_config.sampling_rate,
+        output_encoding=synthesizer_config.audio_encoding,
+    )
+
+
+async def decode_streamed(
+    synthesizer_config: AzureSynthesizerConfig, mp3: bytes, network_chunk_size: int
+) -> bytes:
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = MiniaudioWorker(synthesizer_config, 400, input_queue, output_queue)
+    worker.start()
+    audio = bytearray()
+    try:
+        for _ in range(2):  # back to back utterances don't bleed into each other
+            for i in range(0, len(mp3), network_chunk_size):
+                worker.consume_nonblocking(mp3[i : i + network_chunk_size])
+            worker.consume_nonblocking(None)
+            utterance = bytearray()
+            while True:
+                chunk, is_last = await asyncio.wait_for(output_queue.get(), 10)
+                utterance.extend(chunk)
+                if is_last:
+                    break
+            if audio:
+                assert utterance == audio
+            audio = utterance
+    finally:
+        worker.terminate()
+    return bytes(audio)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "audio_encoding,sampling_rate",
+    [(AudioEncoding.MULAW, 8000), (AudioEncoding.LINEAR16, 16000)],
+)
+@pytest.mark.parametrize("network_chunk_size", [97, 4096])
+async def test_streamed_decode_matches_complete_decode(
+    audio_encoding, sampling_rate, network_chunk_size
+):
+    synthesizer_config = AzureSynthesizerConfig(
+        sampling_rate=sampling_rate, audio_encoding=audio_encoding
+    )
+    mp3 = get_fake_audio_mp3()
+    expected = decode_complete(synthesizer_config, mp3)
+
+    audio = await decode_streamed(synthesizer_config, mp3, network_chunk_size)
+
+    bytes_per_sample = 1 if audio_encoding == AudioEncoding.MULAW else 2
+    # the encoder delay and padding are trimmed like for the complete file
+    assert abs(len(audio) - len(expected)) <= bytes_per_sample
+    assert (
+        abs(
+            get_first_audible_sample(audio, audio_encoding)
+            - get_first_audible_sample(expected, audio_encoding)
+        )
+        <= 2
+    )
+
+
+def test_frame_sizes_split_the_stream():
+    mp3 = get_fake_audio_mp3()
+    offset = get_id3_tag_size(mp3)
+    assert offset
+    num_frames = 0
+    while offset < len(mp3):
+        offset += parse_mp3_frame_header(mp3[offset : offset + 4]).frame_size
+        num_frames += 1
+    assert offset == len(mp3)
+    assert num_frames == 59
+
+
+@pytest.mark.asyncio
+async def test_decodes_before_the_utterance_ends():
+    synthesizer_config = AzureSynthesizerConfig(
+        sampling_rate=8000, audio_encoding=AudioEncoding.MULAW
+    )
+    mp3 = get_fake_audio_mp3()
+    input_queue: asyncio.Queue = asyncio.Queue()
+    output_queue: asyncio.Queue = asyncio.Queue()
+    worker = MiniaudioWorker(synthesizer_config, 400, input_queue, output_queue)
+    worker.start()
+    try:
+        # far less than the decoder asks for at once
+        for i in range(0, len(mp3) // 2, 1024):
+            worker.consume_nonblocking(mp3[i : i + 1024])
+        chunk, is_last = await asyncio.wait_for(output_queue.get(), 10)
+        assert chunk
+        assert not is_last
+
+        for i in range(len(mp3) // 2, len(mp3), 1024):
+            worker.consume_nonblocking(mp3[i : i + 1024])
+        worker.consume_nonblocking(None)
+        while not is_last:
+            _, is_last = await asyncio.wait_for(output_queue.get(), 10)
+    finally:
+        worker.terminate()
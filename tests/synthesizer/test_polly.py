@@ -0,0 +1,56 @@
+import asyncio
+import io
+import json
+import threading
+
+import pytest
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import PollySynthesizerConfig
+from vocode.streaming.synthesizer import polly_synthesizer
+from vocode.streaming.synthesizer.polly_synthesizer import PollySynthesizer
+
+WORD_EVENTS = [
+    {"time": 0, "type": "word", "start": 0, "end": 5, "value": "Hello"},
+    {"time": 500, "type": "word", "start": 6, "end": 11, "value": "there"},
+]
+
+
+class FakePollyClient:
+    def __init__(self):
+        self.speech_marks_requested = threading.Event()
+        self.release_speech_marks = threading.Event()
+
+    def synthesize_speech(self, OutputFormat, **kwargs):
+        if OutputFormat == "json":
+            self.speech_marks_requested.set()
+            self.release_speech_marks.wait(timeout=5)
+            speech_marks = "\n".join(json.dumps(event, separators=(",", ":")) for event in WORD_EVENTS)
+            return {"AudioStream": io.BytesIO(speech_marks.encode())}
+        # the audio request is made while the speech marks request is still in flight
+        assert self.speech_marks_requested.wait(timeout=5)
+        return {"AudioStream": io.BytesIO(b"\x00" * 2500)}
+
+
+@pytest.mark.asyncio
+async def test_streams_audio_without_waiting_for_speech_marks(monkeypatch):
+    client = FakePollyClient()
+    monkeypatch.setattr(polly_synthesizer, "_polly_client", client)
+    synthesizer = PollySynthesizer(
+        PollySynthesizerConfig(sampling_rate=8000, audio_encoding=AudioEncoding.LINEAR16)
+    )
+    synthesis_result = await synthesizer.create_speech(
+        BaseMessage(text="Hello there"), chunk_size=1000
+    )
+    chunks = [chunk.chunk async for chunk in synthesis_result.chunk_generator]
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    # no speech marks yet: the whole message counts as said
+    assert synthesis_result.get_message_up_to(0.1) == "Hello there"
+
+    client.release_speech_marks.set()
+    for _ in range(100):
+        if synthesis_result.get_message_up_to(0.1) != "Hello there":
+            break
+        await asyncio.sleep(0.01)
+    assert synthesis_result.get_message_up_to(0.1) == "Hello "
@@ -0,0 +1,79 @@
+import pytest
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.models.synthesizer import AzureSynthesizerConfig
+from vocode.streaming.synthesizer.synthesis_cache import SynthesisCache
+
+
+def create_config(**kwargs) -> AzureSynthesizerConfig:
+    return AzureSynthesizerConfig(
+        sampling_rate=8000, audio_encoding=AudioEncoding.MULAW, **kwargs
+    )
+
+
+def test_cache_key_depends_on_audio_affecting_fields_only():
+    message = BaseMessage(text="Are you still there?")
+    key = SynthesisCache.get_key(create_config(), message)
+
+    assert key == SynthesisCache.get_key(create_config(synthesis_lookahead=2), message)
+    assert key != SynthesisCache.get_key(create_config(rate=10), message)
+    assert key != SynthesisCache.get_key(
+        create_config(), BaseMessage(text="Are you there?")
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used():
+    cache = SynthesisCache(max_memory_bytes=8)
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    assert await cache.get("a") == b"aaaa"
+    await cache.put("c", b"cccc")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"aaaa"
+    assert await cache.get("c") == b"cccc"
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_cache(tmp_path):
+    await SynthesisCache(disk_cache_path=str(tmp_path)).put("key", b"audio")
+
+    cache = SynthesisCache(disk_cache_path=str(tmp_path))
+    assert await cache.get("key") == b"audio"
+    assert cache.memory_cache["key"] == b"audio"
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_prunes_oldest_entries(tmp_path):
+    cache = SynthesisCache(disk_cache_path=str(tmp_path), max_disk_bytes=8)
+    await cache.put("old", b"1234")
+    await cache.put("new", b"5678")
+    await cache.put("newest", b"9")
+
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 8
+    assert await cache.get("newest") == b"9"
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_scanned_only_on_first_write_and_when_full(tmp_path):
+    cache = SynthesisCache(disk_cache_path=str(tmp_path), max_disk_bytes=8)
+    scan_disk = cache.scan_disk
+    num_scans = 0
+
+    def counting_scan_disk():
+        nonlocal num_scans
+        num_scans += 1
+        return scan_disk()
+
+    cache.scan_disk = counting_scan_disk  # type: ignore
+    await cache.put("a", b"12")
+    await cache.put("b", b"34")
+    await cache.put("a", b"56")
+    assert num_scans == 1
+    assert cache.disk_bytes == 4
+
+    await cache.put("c", b"7890123")
+    assert num_scans == 2
+    assert cache.disk_bytes <= 8
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from typing import Optional
+
+import pytest
+
+from vocode.streaming.synthesizer.base_synthesizer import (
+    SynthesisResult,
+    SynthesisResultPrefetcher,
+)
+
+
+class FakeSource:
+    def __init__(self, num_chunks: int = 2, error: Optional[Exception] = None):
+        self.num_chunks = num_chunks
+        self.error = error
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.closed = False
+
+    async def chunk_generator(self):
+        self.started.set()
+        try:
+            for i in range(self.num_chunks):
+                await self.release.wait()
+                yield SynthesisResult.ChunkResult(
+                    bytes([i]), i == self.num_chunks - 1 and self.error is None
+                )
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.closed = True
+
+    def create_synthesis_result(self) -> SynthesisResult:
+        return SynthesisResult(self.chunk_generator(), lambda seconds: "")
+
+
+def create_prefetcher(source: FakeSource, semaphore: asyncio.Semaphore):
+    return SynthesisResultPrefetcher(
+        source.create_synthesis_result(), threading.Event(), semaphore
+    )
+
+
+async def consume(synthesis_result: SynthesisResult):
+    return [
+        chunk_result.chunk async for chunk_result in synthesis_result.chunk_generator
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_prefetching_and_ends_playback():
+    source = FakeSource()
+    semaphore = asyncio.Semaphore(1)
+    prefetcher = create_prefetcher(source, semaphore)
+    await source.started.wait()
+
+    prefetcher.cancel()
+    assert await consume(prefetcher.get_synthesis_result()) == []
+    assert prefetcher.task.cancelled()
+    assert source.closed
+    assert prefetcher.is_done()
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_to_the_consumer_after_the_chunks_before_it():
+    source = FakeSource(num_chunks=1, error=RuntimeError("synthesis failed"))
+    source.release.set()
+    prefetcher = create_prefetcher(source, asyncio.Semaphore(1))
+
+    chunks = []
+    with pytest.raises(RuntimeError, match="synthesis failed"):
+        async for chunk_result in prefetcher.get_synthesis_result().chunk_generator:
+            chunks.append(chunk_result.chunk)
+    assert chunks == [b"\x00"]
+    assert source.closed
+
+
+@pytest.mark.asyncio
+async def test_buffered_results_are_bounded_by_the_semaphore():
+    first_source, second_source = FakeSource(), FakeSource()
+    first_source.release.set()
+    second_source.release.set()
+    semaphore = asyncio.Semaphore(1)
+    first_prefetcher = create_prefetcher(first_source, semaphore)
+    second_prefetcher = create_prefetcher(second_source, semaphore)
+
+    await first_prefetcher.task
+    await asyncio.sleep(0.01)
+    # the first result is fully downloaded but not played yet, so it still holds the slot
+    assert not second_source.started.is_set()
+
+    assert await consume(first_prefetcher.get_synthesis_result()) == [
+        b"\x00",
+        b"\x01",
+    ]
+    assert await consume(second_prefetcher.get_synthesis_result()) == [
+        b"\x00",
+        b"\x01",
+    ]
+    assert not semaphore.locked()
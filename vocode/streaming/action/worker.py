@@ -23,11 +23,13 @@ class ActionsWorker(InterruptibleWorker):
         output_queue: asyncio.Queue[InterruptibleEvent[AgentInput]],
         interruptible_event_factory: InterruptibleEventFactory = InterruptibleEventFactory(),
         action_factory: ActionFactory = ActionFactory(),
+        max_concurrency: int = 1,
     ):
         super().__init__(
             input_queue=input_queue,
             output_queue=output_queue,
             interruptible_event_factory=interruptible_event_factory,
+            max_concurrency=max_concurrency,
         )
         self.action_factory = action_factory
 
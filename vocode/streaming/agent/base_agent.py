@@ -42,6 +42,7 @@ from vocode.streaming.models.message import BaseMessage
 from vocode.streaming.models.model import BaseModel, TypedModel
 from vocode.streaming.transcriber.base_transcriber import Transcription
 from vocode.streaming.utils import remove_non_letters_digits
+from vocode.streaming.utils.bounded_queue import BoundedQueue
 from vocode.streaming.utils.goodbye_model import GoodbyeModel
 from vocode.streaming.models.transcript import Transcript
 from vocode.streaming.utils.worker import (
@@ -53,6 +54,7 @@ from vocode.streaming.utils.worker import (
 
 if TYPE_CHECKING:
     from vocode.streaming.utils.state_manager import ConversationStateManager
+    from vocode.streaming.utils.turn_latency import TurnLatencyTracker
 
 tracer = trace.get_tracer(__name__)
 AGENT_TRACE_NAME = "agent"
@@ -69,6 +71,7 @@ class AgentInput(TypedModel, type=AgentInputType.BASE.value):
     vonage_uuid: Optional[str]
     twilio_sid: Optional[str]
     agent_response_tracker: Optional[asyncio.Event] = None
+    turn_id: Optional[str] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -98,6 +101,7 @@ class AgentResponse(TypedModel, type=AgentResponseType.BASE.value):
 class AgentResponseMessage(AgentResponse, type=AgentResponseType.MESSAGE.value):
     message: BaseMessage
     is_interruptible: bool = True
+    turn_id: Optional[str] = None
 
 
 class AgentResponseStop(AgentResponse, type=AgentResponseType.STOP.value):
@@ -147,12 +151,13 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
         interruptible_event_factory: InterruptibleEventFactory = InterruptibleEventFactory(),
         logger: Optional[logging.Logger] = None,
     ):
+        # fed by sync producers (put_nowait) that can't wait for room, so unbounded
         self.input_queue: asyncio.Queue[
             InterruptibleEvent[AgentInput]
-        ] = asyncio.Queue()
+        ] = BoundedQueue(name="agent_input")
         self.output_queue: asyncio.Queue[
             InterruptibleAgentResponseEvent[AgentResponse]
-        ] = asyncio.Queue()
+        ] = BoundedQueue(name="agent_output")
         AbstractAgent.__init__(self, agent_config=agent_config)
         InterruptibleWorker.__init__(
             self,
@@ -167,11 +172,14 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
         self.logger = logger or logging.getLogger(__name__)
         self.goodbye_model = None
         if self.agent_config.end_conversation_on_goodbye:
-            self.goodbye_model = GoodbyeModel()
+            self.goodbye_model = GoodbyeModel(
+                use_local_model=self.agent_config.use_local_goodbye_model
+            )
             self.goodbye_model_initialize_task = asyncio.create_task(
                 self.goodbye_model.initialize_embeddings()
             )
         self.transcript: Optional[Transcript] = None
+        self.turn_latency_tracker: Optional[TurnLatencyTracker] = None
 
         self.functions = self.get_functions() if self.agent_config.actions else None
         self.is_muted = False
@@ -187,6 +195,13 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
     ):
         self.conversation_state_manager = conversation_state_manager
 
+    def attach_turn_latency_tracker(self, turn_latency_tracker: TurnLatencyTracker):
+        self.turn_latency_tracker = turn_latency_tracker
+
+    def mark_agent_first_token(self, turn_id: Optional[str]):
+        if self.turn_latency_tracker is not None:
+            self.turn_latency_tracker.mark_agent_first_token(turn_id)
+
     def set_interruptible_event_factory(self, factory: InterruptibleEventFactory):
         self.interruptible_event_factory = factory
 
@@ -230,9 +245,12 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                 continue
             if is_first_response:
                 agent_span_first.end()
+                self.mark_agent_first_token(agent_input.turn_id)
                 is_first_response = False
             self.produce_interruptible_agent_response_event_nonblocking(
-                AgentResponseMessage(message=BaseMessage(text=response)),
+                AgentResponseMessage(
+                    message=BaseMessage(text=response), turn_id=agent_input.turn_id
+                ),
                 is_interruptible=self.agent_config.allow_agent_to_be_cut_off
                 and is_interruptible,
                 agent_response_tracker=agent_input.agent_response_tracker,
@@ -244,7 +262,10 @@ class RespondAgent(BaseAgent[AgentConfigType]):
         return False
 
     async def handle_respond(
-        self, transcription: Transcription, conversation_id: str
+        self,
+        transcription: Transcription,
+        conversation_id: str,
+        turn_id: Optional[str] = None,
     ) -> bool:
         try:
             tracer_name_start = await self.get_tracer_name_start()
@@ -259,8 +280,9 @@ class RespondAgent(BaseAgent[AgentConfigType]):
             response = None
             return True
         if response:
+            self.mark_agent_first_token(turn_id)
             self.produce_interruptible_agent_response_event_nonblocking(
-                AgentResponseMessage(message=BaseMessage(text=response)),
+                AgentResponseMessage(message=BaseMessage(text=response), turn_id=turn_id),
                 is_interruptible=self.agent_config.allow_agent_to_be_cut_off,
             )
             return should_stop
@@ -326,7 +348,7 @@ class RespondAgent(BaseAgent[AgentConfigType]):
                 )
             else:
                 should_stop = await self.handle_respond(
-                    transcription, agent_input.conversation_id
+                    transcription, agent_input.conversation_id, agent_input.turn_id
                 )
 
             if should_stop:
@@ -0,0 +1,236 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from vocode.streaming.models.agent import ContextWindowConfig, ContextWindowStrategy
+from vocode.streaming.utils.blocking_io import run_blocking
+
+DEFAULT_ENCODING_NAME = "cl100k_base"
+# https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+TOKENS_PER_REPLY = 3
+# rough ratio for when tiktoken can't be used
+CHARACTERS_PER_TOKEN = 4
+MAX_CACHED_MESSAGE_TOKEN_COUNTS = 4096
+
+SUMMARY_PROMPT = (
+    "Summarize the conversation below for the assistant that is continuing it. "
+    "Keep names, dates, times, numbers and anything the user asked for or agreed to. "
+    "If a previous summary is included, fold it into the new one."
+)
+
+logger = logging.getLogger(__name__)
+
+# model name -> its token counter, estimate_text_tokens if its tokenizer couldn't be loaded
+_text_token_counters: Dict[Optional[str], Callable[[str], int]] = {}
+
+
+def get_summary_chat_messages(messages: List[dict]) -> List[dict]:
+    lines = []
+    for message in messages:
+        function_call = message.get("function_call")
+        if function_call:
+            lines.append(
+                f"assistant called {function_call['name']}({function_call['arguments']})"
+            )
+        elif message["role"] == "function":
+            lines.append(f"{message.get('name')} returned {message['content']}")
+        elif message["role"] == "system":
+            lines.append(f"previous summary: {message['content']}")
+        else:
+            lines.append(f"{message['role']}: {message['content']}")
+    return [
+        {"role": "system", "content": SUMMARY_PROMPT},
+        {"role": "user", "content": "\n".join(lines)},
+    ]
+
+
+def get_encoding(model_name: Optional[str] = None):
+    import tiktoken
+
+    if model_name:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding(DEFAULT_ENCODING_NAME)
+
+
+def estimate_text_tokens(text: str) -> int:
+    return (len(text) + CHARACTERS_PER_TOKEN - 1) // CHARACTERS_PER_TOKEN
+
+
+def load_text_token_counter(model_name: Optional[str] = None) -> Callable[[str], int]:
+    """Loads the tokenizer for model_name, which blocks (tiktoken may download its tables)
+
+    Failures are cached too, so a missing tokenizer is only tried once per process.
+    """
+    text_token_counter = _text_token_counters.get(model_name)
+    if text_token_counter is not None:
+        return text_token_counter
+    try:
+        encoding = get_encoding(model_name)
+        text_token_counter = lambda text: len(
+            encoding.encode(text, disallowed_special=())
+        )
+    except Exception as e:
+        logger.warning(
+            f"Could not load tokenizer for {model_name}, estimating token counts: {e}"
+        )
+        text_token_counter = estimate_text_tokens
+    _text_token_counters[model_name] = text_token_counter
+    return text_token_counter
+
+
+class ContextWindow:
+    """Fits chat messages into a token budget for long calls
+
+    Keeps the system prompt and as many of the most recent messages as fit. With the summarize
+    strategy, the messages that no longer fit are summarized in the background and the summary
+    is sent right after the system prompt, so the time to first token doesn't depend on it.
+    The tokenizer is loaded off the event loop on first use; until then tokens are estimated.
+    """
+
+    def __init__(
+        self,
+        context_window_config: ContextWindowConfig,
+        model_name: Optional[str] = None,
+        summarize: Optional[Callable[[List[dict], int], Awaitable[str]]] = None,
+        count_text_tokens: Optional[Callable[[str], int]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.context_window_config = context_window_config
+        self.summarize = summarize
+        self.model_name = model_name
+        self.count_text_tokens = count_text_tokens or _text_token_counters.get(
+            model_name
+        )
+        self.load_tokenizer_task: Optional[asyncio.Task] = None
+        self.logger = logger or logging.getLogger(__name__)
+        self.message_token_counts: Dict[Tuple, int] = {}
+        self.summary: Optional[str] = None
+        # messages after the system prompt that are left out for good, folded into the
+        # summary with the summarize strategy
+        self.num_summarized = 0
+        self.summarize_task: Optional[asyncio.Task] = None
+
+    def count_message_tokens(self, message: dict) -> int:
+        function_call = message.get("function_call") or {}
+        key = (
+            message.get("role"),
+            message.get("content"),
+            message.get("name"),
+            function_call.get("name"),
+            function_call.get("arguments"),
+        )
+        num_tokens = self.message_token_counts.get(key)
+        if num_tokens is None:
+            count_text_tokens = self.get_text_token_counter()
+            num_tokens = TOKENS_PER_MESSAGE
+            for value in key:
+                if value:
+                    num_tokens += count_text_tokens(value)
+            if message.get("name"):
+                num_tokens += TOKENS_PER_NAME
+            if len(self.message_token_counts) >= MAX_CACHED_MESSAGE_TOKEN_COUNTS:
+                self.message_token_counts.clear()
+            self.message_token_counts[key] = num_tokens
+        return num_tokens
+
+    def get_text_token_counter(self) -> Callable[[str], int]:
+        if self.count_text_tokens is not None:
+            return self.count_text_tokens
+        if self.load_tokenizer_task is None:
+            self.load_tokenizer_task = asyncio.create_task(self.load_tokenizer())
+        return estimate_text_tokens
+
+    async def load_tokenizer(self):
+        self.count_text_tokens = await run_blocking(
+            load_text_token_counter, self.model_name
+        )
+        # counts made with estimates are recounted
+        self.message_token_counts.clear()
+
+    def count_tokens(self, messages: List[dict]) -> int:
+        return TOKENS_PER_REPLY + sum(
+            self.count_message_tokens(message) for message in messages
+        )
+
+    def get_summary_message(self) -> Optional[dict]:
+        if not self.summary:
+            return None
+        return {
+            "role": "system",
+            "content": f"Summary of the earlier conversation:\n{self.summary}",
+        }
+
+    def fit(self, messages: List[dict]) -> List[dict]:
+        pinned = messages[:1] if messages and messages[0]["role"] == "system" else []
+        history = messages[len(pinned) :]
+        if self.num_summarized > len(history):
+            # the transcript was replaced
+            self.reset()
+        summary_message = self.get_summary_message()
+        if summary_message:
+            pinned = pinned + [summary_message]
+
+        budget = self.context_window_config.max_prompt_tokens - self.count_tokens(
+            pinned
+        )
+        cut = len(history)
+        while cut > self.num_summarized:
+            num_tokens = self.count_message_tokens(history[cut - 1])
+            if num_tokens > budget and cut < len(history):
+                break
+            budget -= num_tokens
+            cut -= 1
+        # a function result can't be sent without the call that asked for it
+        while cut < len(history) - 1 and history[cut]["role"] == "function":
+            cut += 1
+
+        if cut > self.num_summarized:
+            self.logger.debug(
+                f"Context window leaves out {cut - self.num_summarized} messages"
+            )
+            if (
+                self.context_window_config.strategy == ContextWindowStrategy.SUMMARIZE
+                and self.summarize is not None
+            ):
+                # messages dropped while a summary is in flight are picked up by the next one
+                if not self.summarize_task or self.summarize_task.done():
+                    self.summarize_task = asyncio.create_task(
+                        self.update_summary(history[self.num_summarized : cut], cut)
+                    )
+            else:
+                self.num_summarized = cut
+        return pinned + history[cut:]
+
+    async def update_summary(self, messages: List[dict], num_summarized: int):
+        assert self.summarize is not None
+        if self.summary:
+            messages = [{"role": "system", "content": self.summary}] + messages
+        try:
+            summary = await self.summarize(
+                messages, self.context_window_config.summary_max_tokens
+            )
+        except Exception as e:
+            self.logger.error(f"Error summarizing conversation: {e}", exc_info=True)
+            return
+        self.summary = summary
+        self.num_summarized = num_summarized
+
+    def cancel_summarize_task(self):
+        if self.summarize_task and not self.summarize_task.done():
+            self.summarize_task.cancel()
+        self.summarize_task = None
+
+    def reset(self):
+        self.cancel_summarize_task()
+        self.summary = None
+        self.num_summarized = 0
+
+    def terminate(self):
+        self.cancel_summarize_task()
+        if self.load_tokenizer_task and not self.load_tokenizer_task.done():
+            self.load_tokenizer_task.cancel()
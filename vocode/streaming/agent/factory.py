@@ -24,16 +24,29 @@ from vocode.streaming.models.agent import (
     RESTfulUserImplementedAgentConfig,
     LlamacppAgentConfig
 )
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
+from vocode.streaming.vector_db.factory import VectorDBFactory
 
 
 class AgentFactory:
+    def __init__(self, http_resource_pool: Optional[HTTPResourcePool] = None):
+        self.http_resource_pool = http_resource_pool
+
+    def attach_http_resource_pool(self, http_resource_pool: HTTPResourcePool):
+        self.http_resource_pool = http_resource_pool
+
     def create_agent(
         self, agent_config: AgentConfig, logger: Optional[logging.Logger] = None
     ) -> BaseAgent:
         if isinstance(agent_config, LLMAgentConfig):
             return LLMAgent(agent_config=agent_config, logger=logger)
         elif isinstance(agent_config, ChatGPTAgentConfig):
-            return ChatGPTAgent(agent_config=agent_config, logger=logger)
+            return ChatGPTAgent(
+                agent_config=agent_config,
+                logger=logger,
+                vector_db_factory=VectorDBFactory(self.http_resource_pool),
+                http_resource_pool=self.http_resource_pool,
+            )
         elif isinstance(agent_config, EchoAgentConfig):
             return EchoAgent(agent_config=agent_config, logger=logger)
         elif isinstance(agent_config, InformationRetrievalAgentConfig):
@@ -45,5 +58,10 @@ class AgentFactory:
         elif isinstance(agent_config, LlamacppAgentConfig):
             return LlamacppAgent(agent_config=agent_config, logger=logger)
         elif isinstance(agent_config, LyngoChatGPTAgentConfig):
-            return LyngoChatGPTAgent(agent_config=agent_config, logger=logger)
+            return LyngoChatGPTAgent(
+                agent_config=agent_config,
+                logger=logger,
+                vector_db_factory=VectorDBFactory(self.http_resource_pool),
+                http_resource_pool=self.http_resource_pool,
+            )
         raise Exception("Invalid agent config", agent_config.type)
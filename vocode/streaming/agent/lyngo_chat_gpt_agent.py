@@ -16,10 +16,14 @@ from services.cliniko import ClinikoAPI
 from vocode import getenv
 from vocode.streaming.action.factory import ActionFactory
 from vocode.streaming.agent.base_agent import RespondAgent
+from vocode.streaming.agent.context_window import (
+    ContextWindow,
+    get_summary_chat_messages,
+)
 from vocode.streaming.models.actions import FunctionCall, FunctionFragment
 from vocode.streaming.models.agent import LyngoChatGPTAgentConfig
 from vocode.streaming.agent.utils import (
-    format_openai_chat_messages_from_transcript,
+    OpenAIChatMessagesBuilder,
     collate_response_async,
     openai_get_tokens,
     vector_db_result_to_openai_chat_message,
@@ -27,6 +31,7 @@ from vocode.streaming.agent.utils import (
 from vocode.streaming.models.events import Sender
 from vocode.streaming.models.transcript import Transcript
 from vocode.streaming.telephony.config_manager.redis_config_manager import RedisConfigManager
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 from vocode.streaming.vector_db.factory import VectorDBFactory
 
 
@@ -38,6 +43,7 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
         logger: Optional[logging.Logger] = None,
         openai_api_key: Optional[str] = None,
         vector_db_factory=VectorDBFactory(),
+        http_resource_pool: Optional[HTTPResourcePool] = None,
     ):
         super().__init__(
             agent_config=agent_config, action_factory=action_factory, logger=logger
@@ -47,22 +53,44 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
             api_key = getenv("AZURE_OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
-            self.aclient = AsyncAzureOpenAI(
-            api_key=api_key,
-            azure_endpoint=getenv("AZURE_OPENAI_API_BASE"),
-            api_version=agent_config.azure_params.api_version)
+            if http_resource_pool is not None:
+                self.aclient = http_resource_pool.get_openai_client(
+                    api_key,
+                    azure_endpoint=getenv("AZURE_OPENAI_API_BASE"),
+                    api_version=agent_config.azure_params.api_version,
+                )
+            else:
+                self.aclient = AsyncAzureOpenAI(
+                    api_key=api_key,
+                    azure_endpoint=getenv("AZURE_OPENAI_API_BASE"),
+                    api_version=agent_config.azure_params.api_version,
+                )
         else:
             print("IN OPENAI!!!")
             api_key = openai_api_key or getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
-            self.aclient = AsyncOpenAI(api_key=api_key)
+            if http_resource_pool is not None:
+                self.aclient = http_resource_pool.get_openai_client(api_key)
+            else:
+                self.aclient = AsyncOpenAI(api_key=api_key)
         self.first_response = (
             self.create_first_response(agent_config.expected_first_prompt)
             if agent_config.expected_first_prompt
             else None
         )
         self.is_first_response = True
+        self.chat_messages_builder = OpenAIChatMessagesBuilder()
+        self.context_window = (
+            ContextWindow(
+                agent_config.context_window_config,
+                model_name=self.get_model_name(),
+                summarize=self.summarize_chat_messages,
+                logger=self.logger,
+            )
+            if agent_config.context_window_config
+            else None
+        )
 
         if self.agent_config.vector_db_config:
             self.vector_db = vector_db_factory.create_vector_db(
@@ -142,11 +170,35 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
             for action_config in self.agent_config.actions
         ]
 
-    def get_chat_parameters(self, messages: Optional[List] = None):
+    def get_model_name(self) -> str:
+        if self.agent_config.azure_params is not None:
+            return self.agent_config.azure_params.model
+        return self.agent_config.model_name
+
+    def get_transcript_chat_messages(self) -> List[dict]:
         assert self.transcript is not None
-        messages = messages or format_openai_chat_messages_from_transcript(
+        messages = self.chat_messages_builder.build(
             self.transcript, self.agent_config.prompt_preamble
         )
+        if self.context_window:
+            messages = self.context_window.fit(messages)
+        return messages
+
+    async def summarize_chat_messages(self, messages: List[dict], max_tokens: int) -> str:
+        summary_parameters: Dict[str, Any] = {
+            "model": self.get_model_name(),
+            "messages": get_summary_chat_messages(messages),
+            "max_tokens": max_tokens,
+            "temperature": 0,
+        }
+        chat_completion = await self.aclient.chat.completions.create(
+            **summary_parameters
+        )
+        return chat_completion.choices[0].message.content or ""
+
+    def get_chat_parameters(self, messages: Optional[List] = None):
+        assert self.transcript is not None
+        messages = messages or self.get_transcript_chat_messages()
         # print("MESSAGES")
         # print(messages)
         parameters: Dict[str, Any] = {
@@ -156,10 +208,7 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
         }
         print("TEMP", self.agent_config.temperature)
 
-        if self.agent_config.azure_params is not None:
-            parameters["model"] = self.agent_config.azure_params.model
-        else:
-            parameters["model"] = self.agent_config.model_name
+        parameters["model"] = self.get_model_name()
 
         if self.functions:
             updated_functions_list = [{"type": "function", "function": func} for func in self.functions]
@@ -184,6 +233,11 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
     def attach_transcript(self, transcript: Transcript):
         self.transcript = transcript
 
+    def terminate(self):
+        if self.context_window:
+            self.context_window.terminate()
+        return super().terminate()
+
     async def respond(
         self,
         human_input,
@@ -234,9 +288,7 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
                     ]
                 )
                 vector_db_result = f"Found {len(docs_with_scores)} similar documents:\n{docs_with_scores_str}"
-                messages = format_openai_chat_messages_from_transcript(
-                    self.transcript, self.agent_config.prompt_preamble
-                )
+                messages = self.get_transcript_chat_messages()
                 messages.insert(
                     -1, vector_db_result_to_openai_chat_message(vector_db_result)
                 )
@@ -249,6 +301,8 @@ class LyngoChatGPTAgent(RespondAgent[LyngoChatGPTAgentConfig]):
         chat_parameters["stream"] = True
         stream = await self.aclient.chat.completions.create(**chat_parameters)
         async for message in collate_response_async(
-            openai_get_tokens(stream), get_functions=True
+            openai_get_tokens(stream),
+            get_functions=True,
+            eager_first_clause=self.agent_config.eager_first_clause,
         ):
             yield message, True
@@ -1,4 +1,10 @@
 class LyngoChatGPTAgentRegistry:
+    """The agents of the conversations running in this process
+
+    When a TelephonyServer runs as several TelephonyWorker processes, an agent is only found in
+    the worker running its call, which is the worker_id saved in the call config.
+    """
+
     _agents = {}
 
     @classmethod
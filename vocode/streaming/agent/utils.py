@@ -1,4 +1,4 @@
-from copy import deepcopy
+import functools
 import re
 from typing import (
     Dict,
@@ -9,6 +9,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -24,58 +25,159 @@ from vocode.streaming.models.transcript import (
 )
 
 SENTENCE_ENDINGS = [".", "!", "?", "\n"]
+# also end the first chunk of a response in eager mode
+CLAUSE_ENDINGS = [",", ";", ":"]
+LIST_ITEM_PATTERN = re.compile(r"\d+[ .]")
+LIST_ITEM_ENDING_PATTERN = re.compile(r"\n")
+MONEY_PATTERN = re.compile(r"\$\d+.$")
+
+
+@functools.lru_cache(maxsize=None)
+def get_endings_pattern(endings: Tuple[str, ...]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, endings)))
+
+
+class SentenceCollator:
+    """Splits streamed LLM tokens into sentences for the synthesizer
+
+    A sentence ends at a sentence ending, once a token starting with whitespace shows the word
+    around it is finished, so emails and decimals aren't split. Amounts like "$5." aren't ended
+    by their period and list items ("1. ...") only end at a newline. With eager_first_clause, the
+    first sentence may also end at a clause ending like a comma, to start speaking sooner.
+
+    Each token is only scanned for what it adds to the buffer, rather than rescanning the buffer.
+    """
+
+    def __init__(
+        self,
+        sentence_endings: List[str] = SENTENCE_ENDINGS,
+        eager_first_clause: bool = False,
+    ):
+        self.sentence_endings_pattern = get_endings_pattern(tuple(sentence_endings))
+        self.first_sentence_endings_pattern = (
+            get_endings_pattern(tuple(sentence_endings) + tuple(CLAUSE_ENDINGS))
+            if eager_first_clause
+            else self.sentence_endings_pattern
+        )
+        # characters of the buffer rescanned with each token, for endings longer than one character
+        self.endings_overlap = (
+            max(map(len, list(sentence_endings) + CLAUSE_ENDINGS), default=1) - 1
+        )
+        self.num_sentences = 0
+        self.ends_with_money = False
+        self.reset_buffer()
+
+    def reset_buffer(self):
+        self.buffer = ""
+        self.buffer_has_ending = False
+        # None until the buffer is more than digits
+        self.is_list_item: Optional[bool] = None
+        self.last_dollar_idx = -1
+        self.second_last_dollar_idx = -1
+
+    def get_endings_pattern(self) -> "re.Pattern[str]":
+        if self.num_sentences == 0:
+            return self.first_sentence_endings_pattern
+        return self.sentence_endings_pattern
+
+    def push(self, token: str) -> List[str]:
+        sentences: List[str] = []
+        token_starts_with_whitespace = token.startswith(" ")
+        # the previous token ended the sentence
+        if token_starts_with_whitespace and (
+            self.ends_with_money or self.buffer_has_ending
+        ):
+            self.flush_buffer(sentences)
+
+        self.append(token)
+        ends_with_money = self.get_ends_with_money()
+        if token_starts_with_whitespace and not ends_with_money:
+            token_ending_pattern = (
+                LIST_ITEM_ENDING_PATTERN
+                if self.is_list_item
+                else self.get_endings_pattern()
+            )
+            if token_ending_pattern.search(token):
+                self.flush_buffer(sentences)
+        self.ends_with_money = ends_with_money
+        return sentences
+
+    def append(self, token: str):
+        token_idx = len(self.buffer)
+        self.buffer += token
+        if not self.buffer_has_ending:
+            self.buffer_has_ending = (
+                self.get_endings_pattern().search(
+                    self.buffer, max(token_idx - self.endings_overlap, 0)
+                )
+                is not None
+            )
+        if self.is_list_item is None:
+            if LIST_ITEM_PATTERN.match(self.buffer):
+                self.is_list_item = True
+            elif not self.buffer.isdecimal():
+                self.is_list_item = False
+        dollar_idx = token.rfind("$")
+        if dollar_idx != -1:
+            second_dollar_idx = token.rfind("$", 0, dollar_idx)
+            self.second_last_dollar_idx = (
+                token_idx + second_dollar_idx
+                if second_dollar_idx != -1
+                else self.last_dollar_idx
+            )
+            self.last_dollar_idx = token_idx + dollar_idx
+
+    def get_ends_with_money(self) -> bool:
+        if self.last_dollar_idx == -1:
+            return False
+        # an amount at the end of the buffer holds at most two dollar signs, as in "$5$"
+        start_idx = (
+            self.second_last_dollar_idx
+            if self.second_last_dollar_idx != -1
+            else self.last_dollar_idx
+        )
+        return MONEY_PATTERN.search(self.buffer, start_idx) is not None
+
+    def flush_buffer(self, sentences: List[str]):
+        sentence = self.buffer.strip()
+        self.reset_buffer()
+        if sentence:
+            sentences.append(sentence)
+            self.num_sentences += 1
+
+    def finish(self) -> Optional[str]:
+        sentence = self.buffer.strip()
+        self.reset_buffer()
+        return sentence or None
 
 
 async def collate_response_async(
     gen: AsyncIterable[Union[str, FunctionFragment]],
     sentence_endings: List[str] = SENTENCE_ENDINGS,
     get_functions: Literal[True, False] = False,
+    eager_first_clause: bool = False,
 ) -> AsyncGenerator[Union[str, FunctionCall], None]:
-    sentence_endings_pattern = "|".join(map(re.escape, sentence_endings))
-    list_item_ending_pattern = r"\n"
-    buffer = ""
+    sentence_collator = SentenceCollator(
+        sentence_endings, eager_first_clause=eager_first_clause
+    )
     function_name_buffer = ""
     function_args_buffer = ""
-    prev_ends_with_money = False
-    
+
     async for token in gen:
         if not token:
             continue
         if isinstance(token, str):
-            token_starts_with_whitespace = token.startswith(" ")
-            
-            if prev_ends_with_money and token_starts_with_whitespace:
-                yield buffer.strip()
-                buffer = ""
-            # Return if the current token has leading whitespace and the pre-buffer contains the end of a sentence.
-            elif token_starts_with_whitespace and bool(re.findall(sentence_endings_pattern, buffer)):
-                to_return = buffer.strip()
-                if to_return:
-                    yield to_return
-                buffer = ""
-
-            buffer += token
-                
-            possible_list_item = bool(re.match(r"^\d+[ .]", buffer))
-            ends_with_money = bool(re.findall(r"\$\d+.$", buffer))
-            token_ends_sentence = bool(re.findall(list_item_ending_pattern if possible_list_item else sentence_endings_pattern, token))
-            
-            # Only allow buffers to return if the current token has leading whitespace to avoid streaming partial emails.
-            if token_ends_sentence and not ends_with_money and token_starts_with_whitespace:
-                to_return = buffer.strip()
-                if to_return:
-                    yield to_return
-                buffer = ""
-            prev_ends_with_money = ends_with_money
+            for sentence in sentence_collator.push(token):
+                yield sentence
         elif isinstance(token, FunctionFragment):
             function_name_buffer += token.name
             function_args_buffer += token.arguments
-    to_return = buffer.strip()
-    if to_return:
-        yield to_return
+    last_sentence = sentence_collator.finish()
+    if last_sentence:
+        yield last_sentence
     if function_name_buffer and get_functions:
         yield FunctionCall(name=function_name_buffer, arguments=function_args_buffer)
-        
+
 
 async def openai_get_tokens(gen) -> AsyncGenerator[Union[str, FunctionFragment], None]:
     async for event in gen:
@@ -116,46 +218,47 @@ def get_sentence_from_buffer(buffer: str):
         return None, None
 
 
-def format_openai_chat_messages_from_transcript(
-    transcript: Transcript, prompt_preamble: Optional[str] = None
-) -> List[dict]:
-    chat_messages: List[Dict[str, Optional[Any]]] = (
-        [{"role": "system", "content": prompt_preamble}] if prompt_preamble else []
-    )
+class OpenAIChatMessagesBuilder:
+    """Builds the OpenAI chat messages for a transcript, formatting each event log only once
 
-    # merge consecutive bot messages
-    new_event_logs: List[EventLog] = []
-    idx = 0
-    while idx < len(transcript.event_logs):
-        bot_messages_buffer: List[Message] = []
-        current_log = transcript.event_logs[idx]
-        while isinstance(current_log, Message) and current_log.sender == Sender.BOT:
-            bot_messages_buffer.append(current_log)
-            idx += 1
-            try:
-                current_log = transcript.event_logs[idx]
-            except IndexError:
-                break
-        if bot_messages_buffer:
-            merged_bot_message = deepcopy(bot_messages_buffer[-1])
-            merged_bot_message.text = " ".join(
-                event_log.text for event_log in bot_messages_buffer
-            )
-            new_event_logs.append(merged_bot_message)
-        else:
-            new_event_logs.append(current_log)
-            idx += 1
+    Consecutive bot messages are merged into one chat message. Only the latest bot message of a
+    transcript changes after it's added (as it is spoken, and when it's cut off), so the chat
+    message it's merged into is the only one re-joined on every call.
+    """
+
+    def __init__(self):
+        self.event_logs: Optional[List[EventLog]] = None
+        self.num_event_logs_formatted = 0
+        self.chat_messages: List[Dict[str, Optional[Any]]] = []
+        # the bot messages merged into the latest bot chat message, and its index
+        self.last_bot_messages: List[Message] = []
+        self.last_bot_chat_message_idx: Optional[int] = None
+        self.is_merging_bot_messages = False
+
+    def reset(self, event_logs: List[EventLog]):
+        self.event_logs = event_logs
+        self.num_event_logs_formatted = 0
+        self.chat_messages = []
+        self.last_bot_messages = []
+        self.last_bot_chat_message_idx = None
+        self.is_merging_bot_messages = False
 
-    for event_log in new_event_logs:
+    def add_event_log(self, event_log: EventLog):
+        if isinstance(event_log, Message) and event_log.sender == Sender.BOT:
+            if not self.is_merging_bot_messages:
+                # the previous bot messages won't change anymore
+                self.format_last_bot_chat_message()
+                self.last_bot_messages = []
+                self.last_bot_chat_message_idx = len(self.chat_messages)
+                self.chat_messages.append({"role": "assistant", "content": None})
+            self.last_bot_messages.append(event_log)
+            self.is_merging_bot_messages = True
+            return
+        self.is_merging_bot_messages = False
         if isinstance(event_log, Message):
-            chat_messages.append(
-                {
-                    "role": "assistant" if event_log.sender == Sender.BOT else "user",
-                    "content": event_log.text,
-                }
-            )
+            self.chat_messages.append({"role": "user", "content": event_log.text})
         elif isinstance(event_log, ActionStart):
-            chat_messages.append(
+            self.chat_messages.append(
                 {
                     "role": "assistant",
                     "content": None,
@@ -166,14 +269,48 @@ def format_openai_chat_messages_from_transcript(
                 }
             )
         elif isinstance(event_log, ActionFinish):
-            chat_messages.append(
+            self.chat_messages.append(
                 {
                     "role": "function",
                     "name": event_log.action_type,
                     "content": event_log.action_output.response.json(),
                 }
             )
-    return chat_messages
+
+    def format_last_bot_chat_message(self):
+        if self.last_bot_chat_message_idx is None:
+            return
+        # a new dict, so messages returned by earlier calls don't change
+        self.chat_messages[self.last_bot_chat_message_idx] = {
+            "role": "assistant",
+            "content": " ".join(message.text for message in self.last_bot_messages),
+        }
+
+    def build(
+        self, transcript: Transcript, prompt_preamble: Optional[str] = None
+    ) -> List[dict]:
+        event_logs = transcript.event_logs
+        if (
+            event_logs is not self.event_logs
+            or len(event_logs) < self.num_event_logs_formatted
+        ):
+            self.reset(event_logs)
+        for idx in range(self.num_event_logs_formatted, len(event_logs)):
+            self.add_event_log(event_logs[idx])
+        self.num_event_logs_formatted = len(event_logs)
+
+        self.format_last_bot_chat_message()
+        chat_messages: List[Dict[str, Optional[Any]]] = (
+            [{"role": "system", "content": prompt_preamble}] if prompt_preamble else []
+        )
+        chat_messages.extend(self.chat_messages)
+        return chat_messages
+
+
+def format_openai_chat_messages_from_transcript(
+    transcript: Transcript, prompt_preamble: Optional[str] = None
+) -> List[dict]:
+    return OpenAIChatMessagesBuilder().build(transcript, prompt_preamble)
 
 
 def vector_db_result_to_openai_chat_message(vector_db_result):
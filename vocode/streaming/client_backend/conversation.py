@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Callable, Optional
 import typing
@@ -13,10 +14,12 @@ from vocode.streaming.models.transcriber import (
 )
 from vocode.streaming.models.websocket import (
     AudioConfigStartMessage,
+    AudioFraming,
     AudioMessage,
     ReadyMessage,
     WebSocketMessage,
     WebSocketMessageType,
+    decode_binary_audio_frame,
 )
 
 from vocode.streaming.output_device.websocket_output_device import WebsocketOutputDevice
@@ -55,12 +58,14 @@ class ConversationRouter(BaseRouter):
         ),
         logger: Optional[logging.Logger] = None,
         conversation_endpoint: str = BASE_CONVERSATION_ENDPOINT,
+        allow_binary_audio_framing: bool = True,
     ):
         super().__init__()
         self.transcriber_thunk = transcriber_thunk
         self.agent_thunk = agent_thunk
         self.synthesizer_thunk = synthesizer_thunk
         self.logger = logger or logging.getLogger(__name__)
+        self.allow_binary_audio_framing = allow_binary_audio_framing
         self.router = APIRouter()
         self.router.websocket(conversation_endpoint)(self.conversation)
 
@@ -84,22 +89,49 @@ class ConversationRouter(BaseRouter):
             logger=self.logger,
         )
 
+    def get_audio_framing(self, start_message: AudioConfigStartMessage) -> AudioFraming:
+        if (
+            start_message.audio_framing == AudioFraming.BINARY
+            and not self.allow_binary_audio_framing
+        ):
+            return AudioFraming.JSON
+        return start_message.audio_framing
+
     async def conversation(self, websocket: WebSocket):
         await websocket.accept()
         start_message: AudioConfigStartMessage = AudioConfigStartMessage.parse_obj(
             await websocket.receive_json()
         )
         self.logger.debug(f"Conversation started")
+        # the ready message tells the client which framing was agreed on
+        audio_framing = self.get_audio_framing(start_message)
         output_device = WebsocketOutputDevice(
             websocket,
             start_message.output_audio_config.sampling_rate,
             start_message.output_audio_config.audio_encoding,
+            audio_framing=audio_framing,
         )
         conversation = self.get_conversation(output_device, start_message)
-        await conversation.start(lambda: websocket.send_text(ReadyMessage().json()))
+        await conversation.start(
+            lambda: websocket.send_text(
+                ReadyMessage(audio_framing=audio_framing).json()
+            )
+        )
         while conversation.is_active():
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            # audio is accepted in either framing, the agreed one only decides what we send
+            if frame.get("bytes") is not None:
+                try:
+                    _, chunk = decode_binary_audio_frame(frame["bytes"])
+                except ValueError as e:
+                    self.logger.warning(f"Dropping binary frame: {e}")
+                    continue
+                conversation.receive_audio(chunk)
+                continue
             message: WebSocketMessage = WebSocketMessage.parse_obj(
-                await websocket.receive_json()
+                json.loads(frame["text"])
             )
             if message.type == WebSocketMessageType.STOP:
                 break
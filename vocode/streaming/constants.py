@@ -1,3 +1,15 @@
 TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS = 1
 PER_CHUNK_ALLOWANCE_SECONDS = 0.01
 ALLOWED_IDLE_TIME = 15
+ACTIONS_WORKER_MAX_CONCURRENCY = 2
+MAX_FOLLOW_UP_MESSAGES = 2
+BOT_SENTIMENT_REFRESH_SECONDS = 1
+# 20ms chunks, so about 10 seconds of audio waiting to be transcribed
+TRANSCRIBER_AUDIO_QUEUE_MAX_SIZE = 500
+TRANSCRIPTION_QUEUE_MAX_SIZE = 100
+# chunks of synthesized audio waiting to be sent to the output device
+OUTPUT_AUDIO_QUEUE_MAX_SIZE = 30
+# threads shared by every synthesizer's blocking SDK calls, across conversations
+BLOCKING_IO_MAX_WORKERS = 32
+# chunks read ahead of the consumer from a blocking audio stream
+BLOCKING_STREAM_PREFETCH_CHUNKS = 3
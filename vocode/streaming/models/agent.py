@@ -21,6 +21,8 @@ CHAT_VERTEX_AI_DEFAULT_MODEL_NAME = "chat-bison@001"
 AZURE_OPENAI_DEFAULT_API_TYPE = "azure"
 AZURE_OPENAI_DEFAULT_API_VERSION = "2023-03-15-preview"
 AZURE_OPENAI_DEFAULT_ENGINE = "gpt-35-turbo"
+CONTEXT_WINDOW_DEFAULT_MAX_PROMPT_TOKENS = 3000
+CONTEXT_WINDOW_DEFAULT_SUMMARY_MAX_TOKENS = 256
 
 
 class AgentType(str, Enum):
@@ -72,6 +74,8 @@ class AgentConfig(TypedModel, type=AgentType.BASE.value):
     idle_time_before_follow_up: Optional[float] = None
     allow_agent_to_be_cut_off: bool = True
     end_conversation_on_goodbye: bool = False
+    # detect goodbyes with a local model instead of OpenAI embeddings
+    use_local_goodbye_model: bool = False
     send_filler_audio: Union[bool, FillerAudioConfig] = False
     webhook_config: Optional[WebhookConfig] = None
     track_bot_sentiment: bool = False
@@ -91,6 +95,21 @@ class LLMAgentConfig(AgentConfig, type=AgentType.LLM.value):
     cut_off_response: Optional[CutOffResponse] = None
 
 
+class ContextWindowStrategy(str, Enum):
+    # older turns that don't fit are left out
+    DROP = "drop"
+    # older turns that don't fit are summarized in the background, the summary follows the system prompt
+    SUMMARIZE = "summarize"
+
+
+class ContextWindowConfig(BaseModel):
+    # tokens of messages sent per request, not counting functions. The model's context length
+    # must also fit max_tokens of response
+    max_prompt_tokens: int = CONTEXT_WINDOW_DEFAULT_MAX_PROMPT_TOKENS
+    strategy: ContextWindowStrategy = ContextWindowStrategy.DROP
+    summary_max_tokens: int = CONTEXT_WINDOW_DEFAULT_SUMMARY_MAX_TOKENS
+
+
 class ChatGPTAgentConfig(AgentConfig, type=AgentType.CHAT_GPT.value):
     prompt_preamble: str
     expected_first_prompt: Optional[str] = None
@@ -100,6 +119,9 @@ class ChatGPTAgentConfig(AgentConfig, type=AgentType.CHAT_GPT.value):
     cut_off_response: Optional[CutOffResponse] = None
     azure_params: Optional[AzureOpenAIConfig] = None
     vector_db_config: Optional[VectorDBConfig] = None
+    context_window_config: Optional[ContextWindowConfig] = None
+    # end the first sentence of each response at a comma etc. too, so speech starts sooner
+    eager_first_clause: bool = False
 
 class LyngoChatGPTAgentConfig(AgentConfig, type=AgentType.LYNGO_GPT_AGENT.value):
     customer: Customer
@@ -111,6 +133,9 @@ class LyngoChatGPTAgentConfig(AgentConfig, type=AgentType.LYNGO_GPT_AGENT.value)
     cut_off_response: Optional[CutOffResponse] = None
     azure_params: Optional[AzureOpenAIConfig] = None
     vector_db_config: Optional[VectorDBConfig] = None
+    context_window_config: Optional[ContextWindowConfig] = None
+    # end the first sentence of each response at a comma etc. too, so speech starts sooner
+    eager_first_clause: bool = False
 
 
 class ChatAnthropicAgentConfig(AgentConfig, type=AgentType.CHAT_ANTHROPIC.value):
@@ -1,41 +1,95 @@
-from typing import Any, List, Tuple
+import typing
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import pydantic
 
 
 class BaseModel(pydantic.BaseModel):
+    # set per class by get_typed_fields
+    _typed_fields_: ClassVar[Optional[Dict[str, Optional[typing.Type["TypedModel"]]]]] = None
+
     def __init__(self, **data):
+        typed_fields = self.__class__.get_typed_fields()
         for key, value in data.items():
+            # keys that aren't fields (e.g. extras) are parsed like before
+            typed_model_cls = typed_fields.get(key, TypedModel)
+            if typed_model_cls is None:
+                continue
             if isinstance(value, dict):
                 if "type" in value:
-                    data[key] = TypedModel.parse_obj(value)
+                    data[key] = typed_model_cls.parse_obj(value)
             if isinstance(value, list):
                 for i, v in enumerate(value):
                     if isinstance(v, dict):
                         if "type" in v:
-                            value[i] = TypedModel.parse_obj(v)
+                            value[i] = typed_model_cls.parse_obj(v)
         super().__init__(**data)
 
+    @classmethod
+    def get_typed_fields(cls) -> Dict[str, Optional[typing.Type["TypedModel"]]]:
+        """Maps each field (by name and alias) to the TypedModel class its dicts are parsed with
+
+        None means the field can't hold a TypedModel, so __init__ skips it. Computed once per
+        class, on first instantiation, when forward refs have been resolved.
+        """
+        typed_fields = cls.__dict__.get("_typed_fields_")
+        if typed_fields is None:
+            typed_fields = {}
+            for field in cls.__fields__.values():
+                typed_model_cls = get_typed_model_cls(field.type_)
+                typed_fields[field.name] = typed_model_cls
+                typed_fields[field.alias] = typed_model_cls
+            cls._typed_fields_ = typed_fields
+        return typed_fields
+
+
+def get_typed_model_cls(type_: Any) -> Optional[typing.Type["TypedModel"]]:
+    if typing.get_origin(type_) is typing.Union:
+        typed_model_clses = {
+            get_typed_model_cls(arg)
+            for arg in typing.get_args(type_)
+            if arg is not type(None)
+        } - {None}
+        if not typed_model_clses:
+            return None
+        return typed_model_clses.pop() if len(typed_model_clses) == 1 else TypedModel
+    if isinstance(type_, type) and type_ not in (Any, object):
+        return type_ if issubclass(type_, TypedModel) else None
+    # Any, forward refs, generics etc. could hold anything
+    return TypedModel
+
 
 # Adapted from https://github.com/pydantic/pydantic/discussions/3091
 class TypedModel(BaseModel):
     _subtypes_: List[Tuple[Any, Any]] = []
+    # each TypedModel class indexes itself and its subclasses by type, TypedModel indexes every class
+    _subtypes_by_type_: Dict[Any, Any] = {}
+    _types_by_cls_name_: Dict[str, Any] = {}
+    _type_: Any = None
 
     def __init_subclass__(cls, type=None):
         cls._subtypes_.append((type, cls))
+        cls._type_ = type
+        cls._subtypes_by_type_ = {}
+        for base in cls.__mro__:
+            if issubclass(base, TypedModel):
+                # the first class registered for a type wins, like the linear scan this replaced
+                base._subtypes_by_type_.setdefault(type, cls)
+        cls._types_by_cls_name_.setdefault(cls.__name__, type)
 
     @classmethod
     def get_cls(_cls, type):
-        for t, cls in _cls._subtypes_:
-            if t == type:
-                return cls
-        raise ValueError(f"Unknown type {type}")
+        cls = _cls._subtypes_by_type_.get(type)
+        if cls is None:
+            cls = TypedModel._subtypes_by_type_.get(type)
+        if cls is None:
+            raise ValueError(f"Unknown type {type}")
+        return cls
 
     @classmethod
     def get_type(_cls, cls_name):
-        for t, cls in _cls._subtypes_:
-            if cls.__name__ == cls_name:
-                return t
-        raise ValueError(f"Unknown class {cls_name}")
+        if cls_name not in _cls._types_by_cls_name_:
+            raise ValueError(f"Unknown class {cls_name}")
+        return _cls._types_by_cls_name_[cls_name]
 
     @classmethod
     def parse_obj(cls, obj):
@@ -49,9 +103,9 @@ class TypedModel(BaseModel):
         return sub(**obj)
 
     def _iter(self, **kwargs):
-        yield "type", self.get_type(self.__class__.__name__)
+        yield "type", self._type_
         yield from super()._iter(**kwargs)
 
     @property
     def type(self):
-        return self.get_type(self.__class__.__name__)
+        return self._type_
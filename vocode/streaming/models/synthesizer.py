@@ -43,6 +43,8 @@ class SynthesizerConfig(TypedModel, type=SynthesizerType.BASE.value):
     audio_encoding: AudioEncoding
     should_encode_as_wav: bool = False
     sentiment_config: Optional[SentimentConfig] = None
+    # number of upcoming responses to synthesize while the current one plays, 0 disables lookahead
+    synthesis_lookahead: int = 0
 
     class Config:
         arbitrary_types_allowed = True
@@ -96,6 +98,10 @@ class GoogleSynthesizerConfig(SynthesizerConfig, type=SynthesizerType.GOOGLE.val
     voice_name: str = DEFAULT_GOOGLE_VOICE_NAME
     pitch: float = DEFAULT_GOOGLE_PITCH
     speaking_rate: float = DEFAULT_GOOGLE_SPEAKING_RATE
+    # streams audio as it's synthesized; only Journey and Chirp HD voices support it, and
+    # without SSML marks the message cutoff is estimated from the audio's length. Falls back
+    # to whole messages with google-cloud-texttospeech releases that can't stream
+    experimental_streaming: bool = False
 
 
 ELEVEN_LABS_ADAM_VOICE_ID = "pNInz6obpgDQGcFmaJgB"
@@ -97,6 +97,8 @@ class BaseCallConfig(TypedModel, type=CallConfigType.BASE.value):
     synthesizer_config: SynthesizerConfig
     from_phone: str
     to_phone: str
+    # the TelephonyWorker running the call, when a server runs several
+    worker_id: Optional[str] = None
 
     @staticmethod
     def default_transcriber_config():
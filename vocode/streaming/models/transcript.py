@@ -1,6 +1,6 @@
 import time
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Dict, List, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 from vocode.streaming.models.actions import ActionInput, ActionOutput
 from vocode.streaming.models.events import ActionEvent, Sender, Event, EventType
@@ -47,10 +47,25 @@ class ActionFinish(EventLog):
         return f"{Sender.ACTION_WORKER.name}: action_type='{self.action_type}' response={self.action_output.response.dict()}"
 
 
+class TurnLatency(BaseModel):
+    turn_id: str
+    transcription_time: float
+    agent_first_token_time: Optional[float] = None
+    synthesis_time: Optional[float] = None
+    first_audio_time: Optional[float] = None
+
+    def get_total_latency(self) -> Optional[float]:
+        if self.first_audio_time is None:
+            return None
+        return self.first_audio_time - self.transcription_time
+
+
 class Transcript(BaseModel):
     event_logs: List[EventLog] = []
+    turn_latencies: List[TurnLatency] = []
     start_time: float = Field(default_factory=time.time)
     events_manager: Optional[EventsManager] = None
+    _change_listeners: List[Callable[[], None]] = PrivateAttr(default_factory=list)
 
     class Config:
         arbitrary_types_allowed = True
@@ -58,6 +73,17 @@ class Transcript(BaseModel):
     def attach_events_manager(self, events_manager: EventsManager):
         self.events_manager = events_manager
 
+    def add_change_listener(self, listener: Callable[[], None]):
+        self._change_listeners.append(listener)
+
+    def mark_changed(self):
+        """Notifies listeners, called by whatever edits the transcript (including message text in place)"""
+        for listener in self._change_listeners:
+            listener()
+
+    def add_turn_latency(self, turn_latency: TurnLatency):
+        self.turn_latencies.append(turn_latency)
+
     def to_string(self, include_timestamps: bool = False) -> str:
         return "\n".join(
             event.to_string(include_timestamp=include_timestamps)
@@ -87,6 +113,7 @@ class Transcript(BaseModel):
         timestamp = time.time()
         message = Message(text=text, sender=sender, timestamp=timestamp)
         self.event_logs.append(message)
+        self.mark_changed()
         if publish_to_events_manager:
             self.maybe_publish_transcript_event_from_message(
                 message=message, conversation_id=conversation_id
@@ -99,6 +126,7 @@ class Transcript(BaseModel):
         publish_to_events_manager: bool = True,
     ):
         self.event_logs.append(message)
+        self.mark_changed()
         if publish_to_events_manager:
             self.maybe_publish_transcript_event_from_message(
                 message=message, conversation_id=conversation_id
@@ -132,6 +160,7 @@ class Transcript(BaseModel):
                 timestamp=timestamp,
             )
         )
+        self.mark_changed()
         if self.events_manager is not None:
             self.events_manager.publish_event(
                 ActionEvent(
@@ -154,6 +183,7 @@ class Transcript(BaseModel):
                 timestamp=timestamp,
             )
         )
+        self.mark_changed()
         if self.events_manager is not None:
             self.events_manager.publish_event(
                 ActionEvent(
@@ -168,6 +198,7 @@ class Transcript(BaseModel):
         for event_log in reversed(self.event_logs):
             if isinstance(event_log, Message) and event_log.sender == Sender.BOT:
                 event_log.text = text
+                self.mark_changed()
                 break
 
 
@@ -1,6 +1,7 @@
 import base64
 from enum import Enum
-from typing import Optional
+import struct
+from typing import Optional, Tuple
 
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.models.client_backend import InputAudioConfig, OutputAudioConfig
@@ -22,6 +23,39 @@ class WebSocketMessageType(str, Enum):
     AUDIO_CONFIG_START = "websocket_audio_config_start"
 
 
+class AudioFraming(str, Enum):
+    # audio is sent as AudioMessages, i.e. base64 in JSON text frames
+    JSON = "json"
+    # audio is sent as binary frames of BINARY_AUDIO_FRAME_HEADER followed by the raw audio
+    BINARY = "binary"
+
+
+# version, sequence number of the frame in its direction (wraps around)
+BINARY_AUDIO_FRAME_HEADER = struct.Struct("!BI")
+BINARY_AUDIO_FRAME_VERSION = 1
+
+
+def encode_binary_audio_frame(chunk: bytes, sequence_number: int) -> bytes:
+    return b"".join(
+        (
+            BINARY_AUDIO_FRAME_HEADER.pack(
+                BINARY_AUDIO_FRAME_VERSION, sequence_number & 0xFFFFFFFF
+            ),
+            chunk,
+        )
+    )
+
+
+def decode_binary_audio_frame(frame: bytes) -> Tuple[int, bytes]:
+    """Returns the sequence number and the audio of a binary audio frame"""
+    if len(frame) < BINARY_AUDIO_FRAME_HEADER.size:
+        raise ValueError(f"Binary audio frame too short: {len(frame)} bytes")
+    version, sequence_number = BINARY_AUDIO_FRAME_HEADER.unpack_from(frame)
+    if version != BINARY_AUDIO_FRAME_VERSION:
+        raise ValueError(f"Unsupported binary audio frame version {version}")
+    return sequence_number, frame[BINARY_AUDIO_FRAME_HEADER.size :]
+
+
 class WebSocketMessage(TypedModel, type=WebSocketMessageType.BASE):
     pass
 
@@ -61,10 +95,12 @@ class AudioConfigStartMessage(
     output_audio_config: OutputAudioConfig
     conversation_id: Optional[str] = None
     subscribe_transcript: Optional[bool] = None
+    audio_framing: AudioFraming = AudioFraming.JSON
 
 
 class ReadyMessage(WebSocketMessage, type=WebSocketMessageType.READY):
-    pass
+    # the framing the server will use for audio in both directions, unset means JSON
+    audio_framing: Optional[AudioFraming] = None
 
 
 class StopMessage(WebSocketMessage, type=WebSocketMessageType.STOP):
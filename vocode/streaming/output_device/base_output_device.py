@@ -1,3 +1,5 @@
+from typing import Callable
+
 from vocode.streaming.models.audio_encoding import AudioEncoding
 
 
@@ -15,5 +17,17 @@ class BaseOutputDevice:
     def maybe_send_mark_nonblocking(self, message):
         pass
 
+    def send_playback_mark_nonblocking(self, on_played: Callable[[], None]) -> bool:
+        """Calls on_played once the audio consumed so far has been played
+
+        Returns False if the device can't tell when audio is played, in which case on_played
+        is never called.
+        """
+        return False
+
+    def clear_nonblocking(self) -> bool:
+        """Drops audio that was consumed but hasn't been played yet, returns False if it can't"""
+        return False
+
     def terminate(self):
         pass
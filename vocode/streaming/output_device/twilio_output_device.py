@@ -3,20 +3,27 @@ from __future__ import annotations
 import asyncio
 import json
 import base64
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 from fastapi import WebSocket
 
+from vocode.streaming.constants import OUTPUT_AUDIO_QUEUE_MAX_SIZE
 from vocode.streaming.output_device.base_output_device import BaseOutputDevice
 from vocode.streaming.telephony.constants import (
     DEFAULT_AUDIO_ENCODING,
     DEFAULT_SAMPLING_RATE,
 )
+from vocode.streaming.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy
+
+MEDIA_PAYLOAD_PLACEHOLDER = "__payload__"
 
 
 class TwilioOutputDevice(BaseOutputDevice):
     def __init__(
-        self, ws: Optional[WebSocket] = None, stream_sid: Optional[str] = None
+        self,
+        ws: Optional[WebSocket] = None,
+        stream_sid: Optional[str] = None,
+        max_queue_size: int = OUTPUT_AUDIO_QUEUE_MAX_SIZE,
     ):
         super().__init__(
             sampling_rate=DEFAULT_SAMPLING_RATE, audio_encoding=DEFAULT_AUDIO_ENCODING
@@ -24,21 +31,54 @@ class TwilioOutputDevice(BaseOutputDevice):
         self.ws = ws
         self.stream_sid = stream_sid
         self.active = True
-        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        # media messages are queued serialized, marks and clears as dicts. Audio the websocket
+        # can't take in time is dropped, oldest first, but marks and clears never are
+        self.queue: BoundedQueue[Union[str, Dict[str, Any]]] = BoundedQueue(
+            max_queue_size,
+            QueueOverflowPolicy.DROP_OLDEST,
+            name="twilio_output",
+            is_droppable=lambda message: isinstance(message, str),
+        )
+        # marks Twilio echoes back once the audio sent before them has been played
+        self.pending_playback_marks: Dict[str, Callable[[], None]] = {}
+        self.num_playback_marks = 0
         self.process_task = asyncio.create_task(self.process())
 
     async def process(self):
         while self.active:
             message = await self.queue.get()
+            if not isinstance(message, str):
+                message = json.dumps(message)
             await self.ws.send_text(message)
 
+    @property
+    def stream_sid(self) -> Optional[str]:
+        return self._stream_sid
+
+    @stream_sid.setter
+    def stream_sid(self, stream_sid: Optional[str]):
+        self._stream_sid = stream_sid
+        # everything in the media message except the payload is the same for the whole call,
+        # so it is serialized once here instead of json.dumps-ing a dict for every chunk
+        self.media_message_prefix, self.media_message_suffix = json.dumps(
+            {
+                "event": "media",
+                "streamSid": stream_sid,
+                "media": {"payload": MEDIA_PAYLOAD_PLACEHOLDER},
+            }
+        ).split(MEDIA_PAYLOAD_PLACEHOLDER)
+
     def consume_nonblocking(self, chunk: bytes):
-        twilio_message = {
-            "event": "media",
-            "streamSid": self.stream_sid,
-            "media": {"payload": base64.b64encode(chunk).decode("utf-8")},
-        }
-        self.queue.put_nowait(json.dumps(twilio_message))
+        # base64 never needs escaping in a JSON string
+        self.queue.put_nowait(
+            "".join(
+                (
+                    self.media_message_prefix,
+                    base64.b64encode(chunk).decode("ascii"),
+                    self.media_message_suffix,
+                )
+            )
+        )
 
     def maybe_send_mark_nonblocking(self, message_sent):
         mark_message = {
@@ -48,7 +88,35 @@ class TwilioOutputDevice(BaseOutputDevice):
                 "name": "Sent {}".format(message_sent),
             },
         }
-        self.queue.put_nowait(json.dumps(mark_message))
+        self.queue.put_nowait(mark_message)
+
+    def send_playback_mark_nonblocking(self, on_played: Callable[[], None]) -> bool:
+        self.num_playback_marks += 1
+        mark_name = f"playback_{self.num_playback_marks}"
+        self.pending_playback_marks[mark_name] = on_played
+        self.queue.put_nowait(
+            {
+                "event": "mark",
+                "streamSid": self.stream_sid,
+                "mark": {"name": mark_name},
+            }
+        )
+        return True
+
+    def on_mark(self, mark_name: str):
+        on_played = self.pending_playback_marks.pop(mark_name, None)
+        if on_played is not None:
+            on_played()
+
+    def clear_nonblocking(self) -> bool:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+        # Twilio echoes back the marks of cleared audio straight away, which would look like
+        # it had been played
+        self.pending_playback_marks.clear()
+        self.queue.put_nowait({"event": "clear", "streamSid": self.stream_sid})
+        return True
 
     def terminate(self):
         self.process_task.cancel()
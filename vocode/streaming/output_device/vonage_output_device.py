@@ -3,6 +3,7 @@ from typing import Optional
 import wave
 
 from fastapi import WebSocket
+from vocode.streaming.constants import OUTPUT_AUDIO_QUEUE_MAX_SIZE
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.output_device.base_output_device import BaseOutputDevice
 from vocode.streaming.output_device.speaker_output import SpeakerOutput
@@ -11,6 +12,7 @@ from vocode.streaming.telephony.constants import (
     VONAGE_CHUNK_SIZE,
     VONAGE_SAMPLING_RATE,
 )
+from vocode.streaming.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy
 
 
 class VonageOutputDevice(BaseOutputDevice):
@@ -18,13 +20,17 @@ class VonageOutputDevice(BaseOutputDevice):
         self,
         ws: Optional[WebSocket] = None,
         output_to_speaker: bool = False,
+        max_queue_size: int = OUTPUT_AUDIO_QUEUE_MAX_SIZE,
     ):
         super().__init__(
             sampling_rate=VONAGE_SAMPLING_RATE, audio_encoding=VONAGE_AUDIO_ENCODING
         )
         self.ws = ws
         self.active = True
-        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        # audio the websocket can't take in time is dropped, oldest first
+        self.queue: BoundedQueue[bytes] = BoundedQueue(
+            max_queue_size, QueueOverflowPolicy.DROP_OLDEST, name="vonage_output"
+        )
         self.process_task = asyncio.create_task(self.process())
         self.output_to_speaker = output_to_speaker
         if output_to_speaker:
@@ -1,23 +1,44 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Union
 from fastapi import WebSocket
+from vocode.streaming.constants import OUTPUT_AUDIO_QUEUE_MAX_SIZE
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.output_device.base_output_device import BaseOutputDevice
-from vocode.streaming.models.websocket import AudioMessage
+from vocode.streaming.models.websocket import (
+    AudioFraming,
+    AudioMessage,
+    encode_binary_audio_frame,
+)
 from vocode.streaming.models.websocket import TranscriptMessage
 from vocode.streaming.models.transcript import TranscriptEvent
+from vocode.streaming.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy
 
 
 
 class WebsocketOutputDevice(BaseOutputDevice):
     def __init__(
-        self, ws: WebSocket, sampling_rate: int, audio_encoding: AudioEncoding
+        self,
+        ws: WebSocket,
+        sampling_rate: int,
+        audio_encoding: AudioEncoding,
+        audio_framing: AudioFraming = AudioFraming.JSON,
+        max_queue_size: int = OUTPUT_AUDIO_QUEUE_MAX_SIZE,
     ):
         super().__init__(sampling_rate, audio_encoding)
         self.ws = ws
         self.active = False
-        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.audio_framing = audio_framing
+        self.audio_sequence_number = 0
+        # audio is queued as its frame (JSON text or binary), transcripts as messages. Audio a
+        # slow client can't take in time is dropped, oldest first, but transcripts never are
+        self.queue: BoundedQueue[Union[str, bytes, TranscriptMessage]] = BoundedQueue(
+            max_queue_size,
+            QueueOverflowPolicy.DROP_OLDEST,
+            name="websocket_output",
+            is_droppable=lambda message: not isinstance(message, TranscriptMessage),
+        )
 
     def start(self):
         self.active = True
@@ -29,17 +50,27 @@ class WebsocketOutputDevice(BaseOutputDevice):
     async def process(self):
         while self.active:
             message = await self.queue.get()
-            await self.ws.send_text(message)
+            if isinstance(message, bytes):
+                await self.ws.send_bytes(message)
+            elif isinstance(message, TranscriptMessage):
+                await self.ws.send_text(message.json())
+            else:
+                await self.ws.send_text(message)
 
     def consume_nonblocking(self, chunk: bytes):
         if self.active:
-            audio_message = AudioMessage.from_bytes(chunk)
-            self.queue.put_nowait(audio_message.json())
+            if self.audio_framing == AudioFraming.BINARY:
+                self.queue.put_nowait(
+                    encode_binary_audio_frame(chunk, self.audio_sequence_number)
+                )
+                self.audio_sequence_number += 1
+            else:
+                audio_message = AudioMessage.from_bytes(chunk)
+                self.queue.put_nowait(audio_message.json())
 
     def consume_transcript(self, event: TranscriptEvent):
         if self.active:
-            transcript_message = TranscriptMessage.from_event(event)
-            self.queue.put_nowait(transcript_message.json())
+            self.queue.put_nowait(TranscriptMessage.from_event(event))
 
     def terminate(self):
         self.process_task.cancel()
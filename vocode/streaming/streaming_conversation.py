@@ -4,7 +4,17 @@ import asyncio
 import queue
 import random
 import threading
-from typing import Any, Awaitable, Callable, Generic, Optional, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 import logging
 import time
 import typing
@@ -27,7 +37,14 @@ from vocode.streaming.models.transcript import (
 from vocode.streaming.models.message import BaseMessage
 from vocode.streaming.models.transcriber import EndpointingConfig, TranscriberConfig
 from vocode.streaming.output_device.base_output_device import BaseOutputDevice
+from vocode.streaming.utils.bounded_queue import (
+    BoundedQueue,
+    QueueMetrics,
+    get_queue_metrics,
+)
 from vocode.streaming.utils.conversation_logger_adapter import wrap_logger
+from vocode.streaming.utils.deadline_timer import DeadlineTimer
+from vocode.streaming.utils.playback_clock import PlaybackClock
 from vocode.streaming.utils.events_manager import EventsManager
 from vocode.streaming.utils.goodbye_model import GoodbyeModel
 
@@ -39,6 +56,9 @@ from vocode.streaming.constants import (
     TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
     PER_CHUNK_ALLOWANCE_SECONDS,
     ALLOWED_IDLE_TIME,
+    ACTIONS_WORKER_MAX_CONCURRENCY,
+    MAX_FOLLOW_UP_MESSAGES,
+    BOT_SENTIMENT_REFRESH_SECONDS,
 )
 from vocode.streaming.agent.base_agent import (
     AgentInput,
@@ -53,14 +73,20 @@ from vocode.streaming.agent.base_agent import (
 from vocode.streaming.synthesizer.base_synthesizer import (
     BaseSynthesizer,
     SynthesisResult,
+    SynthesisResultPrefetcher,
     FillerAudio,
 )
-from vocode.streaming.utils import create_conversation_id, get_chunk_size_per_second
+from vocode.streaming.utils import (
+    create_conversation_id,
+    get_chunk_size,
+    get_chunk_size_per_second,
+)
 from vocode.streaming.transcriber.base_transcriber import (
     Transcription,
     BaseTranscriber,
 )
 from vocode.streaming.utils.state_manager import ConversationStateManager
+from vocode.streaming.utils.turn_latency import TurnLatencyTracker
 from vocode.streaming.utils.worker import (
     AsyncQueueWorker,
     InterruptibleAgentResponseWorker,
@@ -152,6 +178,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                         conversation_id=self.conversation.id,
                         vonage_uuid=getattr(self.conversation, "vonage_uuid", None),
                         twilio_sid=getattr(self.conversation, "twilio_sid", None),
+                        turn_id=self.conversation.turn_latency_tracker.start_turn(),
                     )
                 )
                 self.output_queue.put_nowait(event)
@@ -207,7 +234,6 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     filler_audio.message.text,
                     filler_synthesis_result,
                     item.interruption_event,
-                    filler_audio.seconds_per_chunk,
                     started_event=self.filler_audio_started_event,
                 )
                 item.agent_response_tracker.set()
@@ -215,32 +241,60 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 pass
 
     class AgentResponsesWorker(InterruptibleAgentResponseWorker):
-        """Runs Synthesizer.create_speech and sends the SynthesisResult to the output queue"""
+        """Runs Synthesizer.create_speech_with_cache and sends the SynthesisResult to the output queue
+
+        If the synthesizer config sets synthesis_lookahead, up to synthesis_lookahead + 1 responses
+        are synthesized concurrently (SynthesisResults are still output in order) and the audio of
+        each SynthesisResult is prefetched in the background, so that the upcoming responses are
+        synthesized while the current one plays.
+        """
 
         def __init__(
             self,
             input_queue: asyncio.Queue[InterruptibleAgentResponseEvent[AgentResponse]],
             output_queue: asyncio.Queue[
-                InterruptibleAgentResponseEvent[Tuple[BaseMessage, SynthesisResult]]
+                InterruptibleAgentResponseEvent[
+                    Tuple[BaseMessage, SynthesisResult, Optional[str]]
+                ]
             ],
             conversation: "StreamingConversation",
             interruptible_event_factory: InterruptibleEventFactory,
         ):
+            self.synthesis_lookahead = (
+                conversation.synthesizer.get_synthesizer_config().synthesis_lookahead
+            )
             super().__init__(
                 input_queue=input_queue,
                 output_queue=output_queue,
+                max_concurrency=self.synthesis_lookahead + 1,
             )
             self.input_queue = input_queue
             self.output_queue = output_queue
             self.conversation = conversation
             self.interruptible_event_factory = interruptible_event_factory
-            self.chunk_size = (
-                get_chunk_size_per_second(
-                    self.conversation.synthesizer.get_synthesizer_config().audio_encoding,
-                    self.conversation.synthesizer.get_synthesizer_config().sampling_rate,
-                )
-                * TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS
+            self.chunk_size = get_chunk_size(
+                self.conversation.synthesizer.get_synthesizer_config().audio_encoding,
+                self.conversation.synthesizer.get_synthesizer_config().sampling_rate,
+                self.conversation.text_to_speech_chunk_size_seconds,
+            )
+            # the response currently playing holds one of the slots
+            self.lookahead_semaphore = asyncio.Semaphore(self.synthesis_lookahead + 1)
+            self.prefetchers: List[SynthesisResultPrefetcher] = []
+
+        def prefetch_synthesis_result(
+            self, synthesis_result: SynthesisResult, stop_event: threading.Event
+        ) -> SynthesisResult:
+            self.prefetchers = [
+                prefetcher for prefetcher in self.prefetchers if not prefetcher.is_done()
+            ]
+            prefetcher = SynthesisResultPrefetcher(
+                synthesis_result,
+                stop_event,
+                self.lookahead_semaphore,
+                logger=self.conversation.logger,
             )
+            self.prefetchers.append(prefetcher)
+            return prefetcher.get_synthesis_result()
 
         def send_filler_audio(self, agent_response_tracker: Optional[asyncio.Event]):
             assert self.conversation.filler_audio_worker is not None
@@ -269,6 +323,11 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 return
             try:
                 agent_response = item.payload
+                if isinstance(
+                    agent_response, (AgentResponseFillerAudio, AgentResponseStop)
+                ):
+                    # with synthesis lookahead, responses before this one may still be synthesizing
+                    await self.wait_for_output_turn()
                 if isinstance(agent_response, AgentResponseFillerAudio):
                     self.send_filler_audio(item.agent_response_tracker)
                     return
@@ -289,26 +348,50 @@ class StreamingConversation(Generic[OutputDeviceType]):
                         await self.conversation.filler_audio_worker.wait_for_filler_audio_to_finish()
 
                 self.conversation.logger.debug("Synthesizing speech for message")
-                synthesis_result = await self.conversation.synthesizer.create_speech(
+                synthesis_result = await self.conversation.synthesizer.create_speech_with_cache(
                     agent_response_message.message,
                     self.chunk_size,
                     bot_sentiment=self.conversation.bot_sentiment,
                 )
+                self.conversation.turn_latency_tracker.mark_synthesis_complete(
+                    agent_response_message.turn_id
+                )
+                if self.synthesis_lookahead > 0:
+                    synthesis_result = self.prefetch_synthesis_result(
+                        synthesis_result, item.interruption_event
+                    )
                 self.produce_interruptible_agent_response_event_nonblocking(
-                    (agent_response_message.message, synthesis_result),
+                    (
+                        agent_response_message.message,
+                        synthesis_result,
+                        agent_response_message.turn_id,
+                    ),
                     is_interruptible=item.is_interruptible,
                     agent_response_tracker=item.agent_response_tracker,
                 )
             except asyncio.CancelledError:
                 pass
 
+        def cancel_current_task(self):
+            for prefetcher in self.prefetchers:
+                if prefetcher.stop_event.is_set():
+                    prefetcher.cancel()
+            return super().cancel_current_task()
+
+        def terminate(self):
+            for prefetcher in self.prefetchers:
+                prefetcher.cancel()
+            return super().terminate()
+
     class SynthesisResultsWorker(InterruptibleAgentResponseWorker):
         """Plays SynthesisResults from the output queue on the output device"""
 
         def __init__(
             self,
             input_queue: asyncio.Queue[
-                InterruptibleAgentResponseEvent[Tuple[BaseMessage, SynthesisResult]]
+                InterruptibleAgentResponseEvent[
+                    Tuple[BaseMessage, SynthesisResult, Optional[str]]
+                ]
             ],
             conversation: "StreamingConversation",
         ):
@@ -318,10 +401,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
         async def process(
             self,
-            item: InterruptibleAgentResponseEvent[Tuple[BaseMessage, SynthesisResult]],
+            item: InterruptibleAgentResponseEvent[
+                Tuple[BaseMessage, SynthesisResult, Optional[str]]
+            ],
         ):
             try:
-                message, synthesis_result = item.payload
+                message, synthesis_result, turn_id = item.payload
                 # create an empty transcript message and attach it to the transcript
                 transcript_message = Message(
                     text="",
@@ -336,8 +421,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     message.text,
                     synthesis_result,
                     item.interruption_event,
-                    TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
                     transcript_message=transcript_message,
+                    turn_id=turn_id,
                 )
                 # publish the transcript message now that it includes what was said during send_speech_to_output
                 self.conversation.transcript.maybe_publish_transcript_event_from_message(
@@ -375,6 +460,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
         synthesizer: BaseSynthesizer,
         conversation_id: Optional[str] = None,
         per_chunk_allowance_seconds: float = PER_CHUNK_ALLOWANCE_SECONDS,
+        text_to_speech_chunk_size_seconds: float = TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
         events_manager: Optional[EventsManager] = None,
         logger: Optional[logging.Logger] = None,
     ):
@@ -388,6 +474,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.agent = agent
         self.synthesizer = synthesizer
         self.synthesis_enabled = True
+        self.per_chunk_allowance_seconds = per_chunk_allowance_seconds
+        self.text_to_speech_chunk_size_seconds = text_to_speech_chunk_size_seconds
         # Add conversation ID so is available to the agent
         self.agent.set_agent_conversation_id(conversation_id)
         LyngoChatGPTAgentRegistry.register_agent(self.agent)
@@ -398,11 +486,13 @@ class StreamingConversation(Generic[OutputDeviceType]):
         )
         self.agent.set_interruptible_event_factory(self.interruptible_event_factory)
         self.synthesis_results_queue: asyncio.Queue[
-            InterruptibleAgentResponseEvent[Tuple[BaseMessage, SynthesisResult]]
-        ] = asyncio.Queue()
+            InterruptibleAgentResponseEvent[
+                Tuple[BaseMessage, SynthesisResult, Optional[str]]
+            ]
+        ] = BoundedQueue(name="synthesis_results")
         self.filler_audio_queue: asyncio.Queue[
             InterruptibleAgentResponseEvent[FillerAudio]
-        ] = asyncio.Queue()
+        ] = BoundedQueue(name="filler_audio")
         self.state_manager = self.create_state_manager()
         self.transcriptions_worker = self.TranscriptionsWorker(
             input_queue=self.transcriber.output_queue,
@@ -424,6 +514,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 output_queue=self.agent.get_input_queue(),
                 interruptible_event_factory=self.interruptible_event_factory,
                 action_factory=self.agent.action_factory,
+                max_concurrency=ACTIONS_WORKER_MAX_CONCURRENCY,
             )
             self.actions_worker.attach_conversation_state_manager(self.state_manager)
         self.synthesis_results_worker = self.SynthesisResultsWorker(
@@ -438,9 +529,10 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
         self.events_manager = events_manager or EventsManager()
         self.events_task: Optional[asyncio.Task] = None
-        self.per_chunk_allowance_seconds = per_chunk_allowance_seconds
         self.transcript = Transcript()
         self.transcript.attach_events_manager(self.events_manager)
+        self.turn_latency_tracker = TurnLatencyTracker(self.transcript)
+        self.agent.attach_turn_latency_tracker(self.turn_latency_tracker)
         self.bot_sentiment = None
         if self.agent.get_agent_config().track_bot_sentiment:
             self.sentiment_config = (
@@ -457,8 +549,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.mark_last_action_timestamp()
         self.follow_up_message_count = 0
 
-        self.check_for_idle_task: Optional[asyncio.Task] = None
-        self.track_bot_sentiment_task: Optional[asyncio.Task] = None
+        self.prewarm_task: Optional[asyncio.Task] = None
+        self.idle_timer = DeadlineTimer(self.check_for_idle, self.get_idle_deadline)
+        self.is_tracking_bot_sentiment = False
+        self.bot_sentiment_refresh_handle: Optional[asyncio.TimerHandle] = None
+        self.update_bot_sentiment_task: Optional[asyncio.Task] = None
+        self.transcript_changed_since_bot_sentiment = False
 
         self.current_transcription_is_interrupt: bool = False
 
@@ -469,8 +565,51 @@ class StreamingConversation(Generic[OutputDeviceType]):
     def create_state_manager(self) -> ConversationStateManager:
         return ConversationStateManager(conversation=self)
 
-    async def start(self, mark_ready: Optional[Callable[[], Awaitable[None]]] = None):
+    def start_prewarm(self):
+        """Starts connecting to upstream services before the conversation starts, see prewarm()
+
+        Safe to call more than once, start() waits for the same prewarm.
+        """
+        if self.prewarm_task is None:
+            self.prewarm_task = asyncio.create_task(self.prewarm())
+
+    async def prewarm(self):
+        """Opens the transcriber connection, readies the synthesizer and generates filler audio concurrently
+
+        None of this needs the output device, so telephony calls kick it off as soon as the call
+        config is saved instead of waiting for the media websocket to connect.
+        """
         self.transcriber.start()
+
+        async def ready_transcriber():
+            is_ready = await self.transcriber.ready()
+            if not is_ready:
+                raise Exception("Transcriber startup failed")
+
+        async def ready_synthesizer():
+            try:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, self.warmup_synthesizer
+                )
+            except Exception:
+                # the synthesizer still works cold, it just connects on the first message
+                self.logger.exception("Failed to warm up synthesizer")
+            if self.agent.get_agent_config().send_filler_audio:
+                if not isinstance(
+                    self.agent.get_agent_config().send_filler_audio, FillerAudioConfig
+                ):
+                    self.filler_audio_config = FillerAudioConfig()
+                else:
+                    self.filler_audio_config = typing.cast(
+                        FillerAudioConfig,
+                        self.agent.get_agent_config().send_filler_audio,
+                    )
+                await self.synthesizer.set_filler_audios(self.filler_audio_config)
+
+        await asyncio.gather(ready_transcriber(), ready_synthesizer())
+
+    async def start(self, mark_ready: Optional[Callable[[], Awaitable[None]]] = None):
+        self.start_prewarm()
         self.transcriptions_worker.start()
         self.agent_responses_worker.start()
         self.synthesis_results_worker.start()
@@ -479,19 +618,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
             self.filler_audio_worker.start()
         if self.actions_worker is not None:
             self.actions_worker.start()
-        is_ready = await self.transcriber.ready()
-        if not is_ready:
-            raise Exception("Transcriber startup failed")
-        if self.agent.get_agent_config().send_filler_audio:
-            if not isinstance(
-                self.agent.get_agent_config().send_filler_audio, FillerAudioConfig
-            ):
-                self.filler_audio_config = FillerAudioConfig()
-            else:
-                self.filler_audio_config = typing.cast(
-                    FillerAudioConfig, self.agent.get_agent_config().send_filler_audio
-                )
-            await self.synthesizer.set_filler_audios(self.filler_audio_config)
+        assert self.prewarm_task is not None
+        await self.prewarm_task
 
         self.agent.start()
         initial_message = self.agent.get_agent_config().initial_message
@@ -504,10 +632,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
             await self.update_bot_sentiment()
         self.active = True
         if self.synthesizer.get_synthesizer_config().sentiment_config:
-            self.track_bot_sentiment_task = asyncio.create_task(
-                self.track_bot_sentiment()
-            )
-        self.check_for_idle_task = asyncio.create_task(self.check_for_idle())
+            self.track_bot_sentiment()
+        self.idle_timer.start()
         if len(self.events_manager.subscriptions) > 0:
             self.events_task = asyncio.create_task(self.events_manager.start())
 
@@ -538,34 +664,69 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.agent_responses_worker.consume_nonblocking(agent_response_event)
         await initial_message_tracker.wait()
 
-    async def check_for_idle(self):
-        """Terminates the conversation after 15 seconds if no activity is detected"""
-        while self.is_active():
-            if self.agent.get_agent_config().idle_time_before_follow_up:
-                if time.time() - self.last_action_timestamp > self.agent.get_agent_config().idle_time_before_follow_up:
-                    if self.follow_up_message_count == 0:
-                      message = "are you still there?"
-                    else:
-                        message = "hello? are you still there?"
-                    # print("DEFINED!!!!!!!")
-                    self.follow_up_message_count += 1
-                    print("FOLLOW UP COUNT!!:")
-                    print(self.follow_up_message_count)
-                    asyncio.create_task(self.send_follow_up_message(BaseMessage(text=message)))
-            if self.follow_up_message_count > 2:
-                self.logger.debug("Conversation idle for too long, terminating")
-                await self.terminate()
-                return
-            await asyncio.sleep(5)
+    def get_idle_deadline(self) -> Optional[float]:
+        idle_time_before_follow_up = (
+            self.agent.get_agent_config().idle_time_before_follow_up
+        )
+        if not idle_time_before_follow_up or not self.is_active():
+            return None
+        return self.last_action_timestamp + idle_time_before_follow_up
 
-    async def track_bot_sentiment(self):
-        """Updates self.bot_sentiment every second based on the current transcript"""
-        prev_transcript = None
-        while self.is_active():
-            await asyncio.sleep(1)
-            if self.transcript.to_string() != prev_transcript:
-                await self.update_bot_sentiment()
-                prev_transcript = self.transcript.to_string()
+    def check_for_idle(self):
+        """Sends a follow up message once idle_time_before_follow_up passes without activity
+
+        Terminates the conversation when it's still idle after two follow ups. Called by
+        self.idle_timer, which waits for the latest deadline after each mark_last_action_timestamp.
+        """
+        if self.follow_up_message_count >= MAX_FOLLOW_UP_MESSAGES:
+            self.logger.debug("Conversation idle for too long, terminating")
+            asyncio.create_task(self.terminate())
+            return
+        if self.follow_up_message_count == 0:
+            message = "are you still there?"
+        else:
+            message = "hello? are you still there?"
+        self.follow_up_message_count += 1
+        self.logger.debug(f"Sending follow up message {self.follow_up_message_count}")
+        asyncio.create_task(self.send_follow_up_message(BaseMessage(text=message)))
+        # the follow up counts as activity, wait for idle_time_before_follow_up again
+        self.mark_last_action_timestamp()
+        self.idle_timer.start()
+
+    def track_bot_sentiment(self):
+        """Updates self.bot_sentiment when the transcript changes, at most every BOT_SENTIMENT_REFRESH_SECONDS"""
+        self.is_tracking_bot_sentiment = True
+        self.transcript.add_change_listener(self.on_transcript_change)
+
+    def on_transcript_change(self):
+        if not self.is_tracking_bot_sentiment or not self.is_active():
+            return
+        self.transcript_changed_since_bot_sentiment = True
+        if self.bot_sentiment_refresh_handle is None and not (
+            self.update_bot_sentiment_task and not self.update_bot_sentiment_task.done()
+        ):
+            self.bot_sentiment_refresh_handle = asyncio.get_running_loop().call_later(
+                BOT_SENTIMENT_REFRESH_SECONDS, self.refresh_bot_sentiment
+            )
+
+    def refresh_bot_sentiment(self):
+        self.bot_sentiment_refresh_handle = None
+        self.transcript_changed_since_bot_sentiment = False
+        self.update_bot_sentiment_task = asyncio.create_task(self.update_bot_sentiment())
+        self.update_bot_sentiment_task.add_done_callback(
+            self.on_bot_sentiment_updated
+        )
+
+    def on_bot_sentiment_updated(self, task: asyncio.Task):
+        if task.cancelled():
+            return
+        if task.exception():
+            self.logger.error(
+                "Error updating bot sentiment", exc_info=task.exception()
+            )
+        # changes made while the sentiment was being analysed
+        if self.transcript_changed_since_bot_sentiment:
+            self.on_transcript_change()
 
     async def update_bot_sentiment(self):
         new_bot_sentiment = await self.bot_sentiment_analyser.analyse(
@@ -609,6 +770,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 break
         self.agent.cancel_current_task()
         self.agent_responses_worker.cancel_current_task()
+        if self.actions_worker is not None:
+            self.actions_worker.cancel_current_task()
         return num_interrupts > 0
 
     def is_interrupt(self, transcription: Transcription):
@@ -621,19 +784,21 @@ class StreamingConversation(Generic[OutputDeviceType]):
         message: str,
         synthesis_result: SynthesisResult,
         stop_event: threading.Event,
-        seconds_per_chunk: int,
         transcript_message: Optional[Message] = None,
         started_event: Optional[threading.Event] = None,
+        turn_id: Optional[str] = None,
     ):
         """
         - Sends the speech chunk by chunk to the output device
           - update the transcript message as chunks come in (transcript_message is always provided for non filler audio utterances)
         - If the stop_event is set, the output is stopped
         - Sets started_event when the first chunk is sent
+        - Marks the first audio of the turn identified by turn_id once the first chunk is sent
 
         Importantly, we rate limit the chunks sent to the output. For interrupts to work properly,
-        the next chunk of audio can only be sent after the last chunk is played, so we send
-        a chunk of x seconds only after x seconds have passed since the last chunk was sent.
+        the next chunk of audio can only be sent once the last chunk is nearly played: a
+        PlaybackClock keeps no more than per_chunk_allowance_seconds of audio buffered on the
+        output device, corrected by the device's playback marks if it sends them.
 
         Returns the message that was sent up to, and a flag if the message was cut off
         """
@@ -642,24 +807,25 @@ class StreamingConversation(Generic[OutputDeviceType]):
             self.transcriber.mute()
         message_sent = message
         cut_off = False
-        chunk_size = seconds_per_chunk * get_chunk_size_per_second(
+        bytes_per_second = get_chunk_size_per_second(
             self.synthesizer.get_synthesizer_config().audio_encoding,
             self.synthesizer.get_synthesizer_config().sampling_rate,
         )
+        playback_clock = PlaybackClock(lead_seconds=self.per_chunk_allowance_seconds)
         chunk_idx = 0
-        seconds_spoken = 0
         async for chunk_result in synthesis_result.chunk_generator:
-            start_time = time.time()
-            speech_length_seconds = seconds_per_chunk * (
-                len(chunk_result.chunk) / chunk_size
-            )
-            seconds_spoken = chunk_idx * seconds_per_chunk
             if stop_event.is_set():
                 self.logger.debug(
                     "Interrupted, stopping text to speech after {} chunks".format(
                         chunk_idx
                     )
                 )
+                # audio the device can't clear is still played
+                seconds_spoken = (
+                    playback_clock.get_seconds_played()
+                    if self.output_device.clear_nonblocking()
+                    else playback_clock.seconds_sent
+                )
                 message_sent = f"{synthesis_result.get_message_up_to(seconds_spoken)}-"
                 cut_off = True
                 break
@@ -667,51 +833,81 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 if started_event:
                     started_event.set()
             self.output_device.consume_nonblocking(chunk_result.chunk)
-            end_time = time.time()
-            await asyncio.sleep(
-                max(
-                    speech_length_seconds
-                    - (end_time - start_time)
-                    - self.per_chunk_allowance_seconds,
-                    0,
-                )
+            playback_clock.on_sent(len(chunk_result.chunk) / bytes_per_second)
+            self.output_device.send_playback_mark_nonblocking(
+                playback_clock.create_on_played()
             )
+            if chunk_idx == 0:
+                self.turn_latency_tracker.mark_first_audio(turn_id)
+            await asyncio.sleep(playback_clock.get_send_delay())
             self.logger.debug(
                 "Sent chunk {} with size {}".format(chunk_idx, len(chunk_result.chunk))
             )
             self.mark_last_action_timestamp()
             chunk_idx += 1
-            seconds_spoken += seconds_per_chunk
             if transcript_message:
                 transcript_message.text = synthesis_result.get_message_up_to(
-                    seconds_spoken
+                    playback_clock.get_seconds_played()
                 )
+                self.transcript.mark_changed()
         if self.transcriber.get_transcriber_config().mute_during_speech:
             self.logger.debug("Unmuting transcriber")
             self.transcriber.unmute()
         if transcript_message:
             transcript_message.text = message_sent
+            self.transcript.mark_changed()
         return message_sent, cut_off
 
+    def get_queue_metrics(self) -> List[QueueMetrics]:
+        """Depth, high-water mark and overflows of the queues between the conversation's workers"""
+        return get_queue_metrics(
+            [
+                self.transcriber.input_queue,
+                self.transcriber.output_queue,
+                self.agent.get_input_queue(),
+                self.agent.get_output_queue(),
+                self.synthesis_results_queue,
+                self.filler_audio_queue,
+                getattr(self.output_device, "queue", None),
+            ]
+        )
+
     def mark_terminated(self):
         self.active = False
 
-    async def terminate(self):
+    async def terminate(self, publish_events: bool = True):
+        """Stops the conversation and releases its resources
+
+        publish_events=False tears down a conversation that never happened (e.g. a prewarmed
+        call whose media websocket never connected) without telling listeners it ended.
+        """
         self.mark_terminated()
         self.broadcast_interrupt()
-        self.events_manager.publish_event(
-            TranscriptCompleteEvent(conversation_id=self.id, transcript=self.transcript)
-        )
-        if self.agent.get_patient_details_task:
+        if publish_events:
+            self.events_manager.publish_event(
+                TranscriptCompleteEvent(
+                    conversation_id=self.id, transcript=self.transcript
+                )
+            )
+        # only LyngoChatGPTAgent looks up patient details
+        get_patient_details_task = getattr(self.agent, "get_patient_details_task", None)
+        if get_patient_details_task:
             self.logger.debug("Terminating get_patient_details_task Task")
-            self.agent.get_patient_details_task.cancel()
-        if self.check_for_idle_task:
-            self.logger.debug("Terminating check_for_idle Task")
-            self.check_for_idle_task.cancel()
-        if self.track_bot_sentiment_task:
-            self.logger.debug("Terminating track_bot_sentiment Task")
-            self.track_bot_sentiment_task.cancel()
-        if self.events_manager and self.events_task:
+            get_patient_details_task.cancel()
+        if self.prewarm_task and not self.prewarm_task.done():
+            self.logger.debug("Terminating prewarm Task")
+            self.prewarm_task.cancel()
+        self.idle_timer.cancel()
+        for queue_metrics in self.get_queue_metrics():
+            self.logger.debug(f"Queue metrics: {queue_metrics}")
+        self.is_tracking_bot_sentiment = False
+        if self.bot_sentiment_refresh_handle:
+            self.bot_sentiment_refresh_handle.cancel()
+            self.bot_sentiment_refresh_handle = None
+        if self.update_bot_sentiment_task and not self.update_bot_sentiment_task.done():
+            self.logger.debug("Terminating update_bot_sentiment Task")
+            self.update_bot_sentiment_task.cancel()
+        if publish_events and self.events_manager and self.events_task:
             self.logger.debug("Terminating events Task")
             await self.events_manager.flush()
         self.logger.debug("Tearing down synthesizer")
@@ -727,6 +923,9 @@ class StreamingConversation(Generic[OutputDeviceType]):
             self.logger.debug("Terminating vector db")
             await self.agent.vector_db.tear_down()
         self.agent.terminate()
+        LyngoChatGPTAgentRegistry.remove_agent(
+            self.agent.get_agent_config().conversation_id
+        )
         self.logger.debug("Terminating output device")
         self.output_device.terminate()
         self.logger.debug("Terminating speech transcriber")
@@ -1,5 +1,4 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import re
@@ -26,6 +25,11 @@ from vocode.streaming.models.audio_encoding import AudioEncoding
 
 import azure.cognitiveservices.speech as speechsdk
 
+from vocode.streaming.utils.blocking_io import (
+    get_blocking_io_executor,
+    iterate_blocking_reads,
+)
+
 
 NAMESPACES = {
     "mstts": "https://www.w3.org/2001/mstts",
@@ -112,7 +116,7 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         self.voice_name = self.synthesizer_config.voice_name
         self.pitch = self.synthesizer_config.pitch
         self.rate = self.synthesizer_config.rate
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+        self.thread_pool_executor = get_blocking_io_executor()
         self.logger = logger or logging.getLogger(__name__)
 
     async def get_phrase_filler_audios(self) -> List[FillerAudio]:
@@ -356,8 +360,6 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         chunk_size: int,
         bot_sentiment: Optional[BotSentiment] = None,
     ) -> SynthesisResult:
-        # offset = int(self.OFFSET_MS * (self.synthesizer_config.sampling_rate / 1000))
-        offset = 0
         self.logger.debug(f"Synthesizing message: {message}")
 
         # Azure will return no audio for certain strings like "-", "[-", and "!"
@@ -372,28 +374,16 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         async def chunk_generator(
             audio_data_stream: speechsdk.AudioDataStream, chunk_transform=lambda x: x
         ):
-            audio_buffer = bytes(chunk_size)
-            filled_size = await asyncio.get_event_loop().run_in_executor(
-                self.thread_pool_executor,
-                lambda: audio_data_stream.read_data(audio_buffer),
-            )
-            if filled_size != chunk_size:
-                yield SynthesisResult.ChunkResult(
-                    chunk_transform(audio_buffer[offset:]), True
-                )
-                return
-            else:
+            def read_chunk() -> bytes:
+                # a buffer per chunk, since chunks read ahead are still waiting to be sent
+                audio_buffer = bytes(chunk_size)
+                filled_size = audio_data_stream.read_data(audio_buffer)
+                return audio_buffer[:filled_size]
+
+            async for chunk in iterate_blocking_reads(read_chunk, chunk_size):
                 yield SynthesisResult.ChunkResult(
-                    chunk_transform(audio_buffer[offset:]), False
+                    chunk_transform(chunk), len(chunk) != chunk_size
                 )
-            while True:
-                filled_size = audio_data_stream.read_data(audio_buffer)
-                if filled_size != chunk_size:
-                    yield SynthesisResult.ChunkResult(
-                        chunk_transform(audio_buffer[: filled_size - offset]), True
-                    )
-                    break
-                yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), False)
 
         word_boundary_event_pool = WordBoundaryEventPool()
         self.synthesizer.synthesis_word_boundary.connect(
@@ -1,5 +1,7 @@
 import asyncio
+import logging
 import os
+import threading
 from typing import (
     Any,
     AsyncGenerator,
@@ -13,8 +15,7 @@ from typing import (
     Union,
 )
 import math
-import io
-import wave
+import struct
 import aiohttp
 from nltk.tokenize import word_tokenize
 from nltk.tokenize.treebank import TreebankWordDetokenizer
@@ -25,6 +26,7 @@ from vocode.streaming.agent.bot_sentiment_analyser import BotSentiment
 from vocode.streaming.models.agent import FillerAudioConfig
 from vocode.streaming.models.message import BaseMessage
 from vocode.streaming.synthesizer.miniaudio_worker import MiniaudioWorker
+from vocode.streaming.synthesizer.synthesis_cache import SynthesisCache
 from vocode.streaming.utils import convert_wav, get_chunk_size_per_second
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.models.synthesizer import SynthesizerConfig
@@ -43,16 +45,62 @@ FILLER_AUDIO_PATH = os.path.join(os.path.dirname(__file__), "filler_audio")
 TYPING_NOISE_PATH = "%s/typing-noise.wav" % FILLER_AUDIO_PATH
 
 
-def encode_as_wav(chunk: bytes, synthesizer_config: SynthesizerConfig) -> bytes:
-    output_bytes_io = io.BytesIO()
-    in_memory_wav = wave.open(output_bytes_io, "wb")
-    in_memory_wav.setnchannels(1)
+# RIFF header of a mono 16-bit PCM wav file, byte for byte what the wave module writes
+WAV_HEADER_FORMAT = "<4sI4s4sIHHIIHH4sI"
+WAV_HEADER_SIZE = struct.calcsize(WAV_HEADER_FORMAT)
+
+
+def get_wav_header(num_bytes: int, sampling_rate: int) -> bytes:
+    return struct.pack(
+        WAV_HEADER_FORMAT,
+        b"RIFF",
+        WAV_HEADER_SIZE - 8 + num_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # size of the fmt subchunk
+        1,  # PCM
+        1,  # mono
+        sampling_rate,
+        sampling_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        num_bytes,
+    )
+
+
+def encode_as_wav(
+    chunk: Union[bytes, memoryview], synthesizer_config: SynthesizerConfig
+) -> bytes:
     assert synthesizer_config.audio_encoding == AudioEncoding.LINEAR16
-    in_memory_wav.setsampwidth(2)
-    in_memory_wav.setframerate(synthesizer_config.sampling_rate)
-    in_memory_wav.writeframes(chunk)
-    output_bytes_io.seek(0)
-    return output_bytes_io.read()
+    # packing the header directly (instead of writing through the wave module) means the
+    # chunk is only copied once, into the output
+    return b"".join(
+        (get_wav_header(len(chunk), synthesizer_config.sampling_rate), chunk)
+    )
+
+
+RIFF_CHUNK_HEADER_FORMAT = "<4sI"
+RIFF_CHUNK_HEADER_SIZE = struct.calcsize(RIFF_CHUNK_HEADER_FORMAT)
+
+
+# returns the audio in the data chunk of a wav file without copying it; the header isn't always
+# encode_as_wav's, e.g. wav files can carry LIST or fact chunks before their data
+def decode_wav_chunk(chunk: bytes) -> memoryview:
+    view = memoryview(chunk)
+    if len(chunk) < 12 or chunk[:4] != b"RIFF" or chunk[8:12] != b"WAVE":
+        raise ValueError("Not a wav file")
+    offset = 12
+    while offset + RIFF_CHUNK_HEADER_SIZE <= len(chunk):
+        chunk_id, chunk_size = struct.unpack_from(
+            RIFF_CHUNK_HEADER_FORMAT, chunk, offset
+        )
+        offset += RIFF_CHUNK_HEADER_SIZE
+        if chunk_id == b"data":
+            # streamed wavs can't know their size up front and overstate it
+            return view[offset : offset + chunk_size]
+        offset += chunk_size + chunk_size % 2  # chunks are padded to an even size
+    raise ValueError("Wav file has no data chunk")
 
 
 tracer = trace.get_tracer(__name__)
@@ -73,6 +121,83 @@ class SynthesisResult:
         self.get_message_up_to = get_message_up_to
 
 
+class SynthesisResultPrefetcher:
+    """Drains the chunk generator of a SynthesisResult in the background so that the audio
+    is already buffered when playback reaches it.
+
+    A prefetcher holds one of the semaphore's slots from when it starts prefetching until its
+    audio has been consumed or it is cancelled, so the semaphore bounds how many results are
+    buffered in memory, not just how many are downloading. Prefetching stops once stop_event
+    is set, and the task can be cancelled to abort a pending network read. If the synthesis
+    fails, the error is raised to the consumer once the chunks before it have been played.
+    """
+
+    def __init__(
+        self,
+        synthesis_result: SynthesisResult,
+        stop_event: threading.Event,
+        semaphore: asyncio.Semaphore,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.synthesis_result = synthesis_result
+        self.stop_event = stop_event
+        self.semaphore = semaphore
+        self.logger = logger or logging.getLogger(__name__)
+        self.holds_slot = False
+        self.chunk_queue: asyncio.Queue[
+            Union[SynthesisResult.ChunkResult, Exception, None]
+        ] = asyncio.Queue()
+        self.task = asyncio.create_task(self.prefetch())
+
+    async def prefetch(self):
+        try:
+            await self.semaphore.acquire()
+            self.holds_slot = True
+            async for chunk_result in self.synthesis_result.chunk_generator:
+                if self.stop_event.is_set():
+                    break
+                self.chunk_queue.put_nowait(chunk_result)
+                if chunk_result.is_last_chunk:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.exception("Failed to prefetch synthesis result")
+            self.chunk_queue.put_nowait(e)
+        finally:
+            self.chunk_queue.put_nowait(None)  # sentinel
+            await self.synthesis_result.chunk_generator.aclose()
+
+    async def chunk_generator(self) -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
+        try:
+            while True:
+                chunk_result = await self.chunk_queue.get()
+                if chunk_result is None:
+                    return
+                if isinstance(chunk_result, Exception):
+                    raise chunk_result
+                yield chunk_result
+        finally:
+            self.release_slot()
+
+    def get_synthesis_result(self) -> SynthesisResult:
+        return SynthesisResult(
+            self.chunk_generator(), self.synthesis_result.get_message_up_to
+        )
+
+    def release_slot(self):
+        if self.holds_slot:
+            self.holds_slot = False
+            self.semaphore.release()
+
+    def is_done(self) -> bool:
+        return self.task.done() and not self.holds_slot
+
+    def cancel(self):
+        self.release_slot()
+        return self.task.cancel()
+
+
 class FillerAudio:
     def __init__(
         self,
@@ -132,6 +257,7 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
                 synthesizer_config.sampling_rate == 8000
             ), "MuLaw encoding only supports 8kHz sampling rate"
         self.filler_audios: List[FillerAudio] = []
+        self.synthesis_cache: Optional[SynthesisCache] = None
         if aiohttp_session:
             # the caller is responsible for closing the session
             self.aiohttp_session = aiohttp_session
@@ -205,6 +331,55 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
     ) -> SynthesisResult:
         raise NotImplementedError
 
+    def attach_synthesis_cache(self, synthesis_cache: SynthesisCache):
+        self.synthesis_cache = synthesis_cache
+
+    # same contract as create_speech, but replays the audio from the synthesis cache if this
+    # message has been synthesized before and fills the cache otherwise
+    async def create_speech_with_cache(
+        self,
+        message: BaseMessage,
+        chunk_size: int,
+        bot_sentiment: Optional[BotSentiment] = None,
+    ) -> SynthesisResult:
+        if self.synthesis_cache is None:
+            return await self.create_speech(
+                message, chunk_size, bot_sentiment=bot_sentiment
+            )
+        cache_key = self.synthesis_cache.get_key(
+            self.synthesizer_config, message, bot_sentiment
+        )
+        cached_audio = await self.synthesis_cache.get(cache_key)
+        if cached_audio is not None:
+            return self.create_synthesis_result_from_bytes(
+                self.synthesizer_config, cached_audio, message, chunk_size
+            )
+        synthesis_result = await self.create_speech(
+            message, chunk_size, bot_sentiment=bot_sentiment
+        )
+        return SynthesisResult(
+            self.cache_output_generator(synthesis_result.chunk_generator, cache_key),
+            synthesis_result.get_message_up_to,
+        )
+
+    async def cache_output_generator(
+        self,
+        chunk_generator: AsyncGenerator[SynthesisResult.ChunkResult, None],
+        cache_key: str,
+    ) -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
+        assert self.synthesis_cache is not None
+        audio = bytearray()
+        async for chunk_result in chunk_generator:
+            if self.synthesizer_config.should_encode_as_wav:
+                audio.extend(decode_wav_chunk(chunk_result.chunk))
+            else:
+                audio.extend(chunk_result.chunk)
+            # only complete utterances are cached, so store before handing off the last chunk
+            # in case the consumer stops iterating once it has it
+            if chunk_result.is_last_chunk:
+                await self.synthesis_cache.put(cache_key, bytes(audio))
+            yield chunk_result
+
     # @param file - a file-like object in wav format
     @staticmethod
     def create_synthesis_result_from_wav(
@@ -218,7 +393,18 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
             output_sample_rate=synthesizer_config.sampling_rate,
             output_encoding=synthesizer_config.audio_encoding,
         )
+        return BaseSynthesizer.create_synthesis_result_from_bytes(
+            synthesizer_config, output_bytes, message, chunk_size
+        )
 
+    # @param output_bytes - audio already in the synthesizer's output encoding and sampling rate
+    @staticmethod
+    def create_synthesis_result_from_bytes(
+        synthesizer_config: SynthesizerConfig,
+        output_bytes: bytes,
+        message: BaseMessage,
+        chunk_size: int,
+    ) -> SynthesisResult:
         if synthesizer_config.should_encode_as_wav:
             chunk_transform = lambda chunk: encode_as_wav(chunk, synthesizer_config)
         else:
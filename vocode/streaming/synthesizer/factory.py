@@ -17,6 +17,7 @@ from vocode.streaming.models.synthesizer import (
     SynthesizerType,
 )
 from vocode.streaming.synthesizer.azure_synthesizer import AzureSynthesizer
+from vocode.streaming.synthesizer.base_synthesizer import BaseSynthesizer
 from vocode.streaming.synthesizer.eleven_labs_synthesizer import ElevenLabsSynthesizer
 from vocode.streaming.synthesizer.google_synthesizer import GoogleSynthesizer
 from vocode.streaming.synthesizer.gtts_synthesizer import GTTSSynthesizer
@@ -27,50 +28,70 @@ from vocode.streaming.synthesizer.stream_elements_synthesizer import (
     StreamElementsSynthesizer,
 )
 from vocode.streaming.synthesizer.coqui_tts_synthesizer import CoquiTTSSynthesizer
+from vocode.streaming.synthesizer.synthesis_cache import SynthesisCache
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 
 
 class SynthesizerFactory:
+    def __init__(
+        self,
+        synthesis_cache: Optional[SynthesisCache] = None,
+        http_resource_pool: Optional[HTTPResourcePool] = None,
+    ):
+        # the cache and the pool are shared by every synthesizer this factory creates
+        self.synthesis_cache = synthesis_cache
+        self.http_resource_pool = http_resource_pool
+
+    def attach_http_resource_pool(self, http_resource_pool: HTTPResourcePool):
+        self.http_resource_pool = http_resource_pool
+
     def create_synthesizer(
         self,
         synthesizer_config: SynthesizerConfig,
         logger: Optional[logging.Logger] = None,
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
+        if aiohttp_session is None and self.http_resource_pool is not None:
+            aiohttp_session = self.http_resource_pool.get_aiohttp_session()
+        synthesizer: BaseSynthesizer
         if isinstance(synthesizer_config, GoogleSynthesizerConfig):
-            return GoogleSynthesizer(
+            synthesizer = GoogleSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, AzureSynthesizerConfig):
-            return AzureSynthesizer(
+            synthesizer = AzureSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, ElevenLabsSynthesizerConfig):
-            return ElevenLabsSynthesizer(
+            synthesizer = ElevenLabsSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, PlayHtSynthesizerConfig):
-            return PlayHtSynthesizer(
+            synthesizer = PlayHtSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, RimeSynthesizerConfig):
-            return RimeSynthesizer(
+            synthesizer = RimeSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, GTTSSynthesizerConfig):
-            return GTTSSynthesizer(
+            synthesizer = GTTSSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, StreamElementsSynthesizerConfig):
-            return StreamElementsSynthesizer(
+            synthesizer = StreamElementsSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, CoquiTTSSynthesizerConfig):
-            return CoquiTTSSynthesizer(
+            synthesizer = CoquiTTSSynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         elif isinstance(synthesizer_config, PollySynthesizerConfig):
-            return PollySynthesizer(
+            synthesizer = PollySynthesizer(
                 synthesizer_config, logger=logger, aiohttp_session=aiohttp_session
             )
         else:
             raise Exception("Invalid synthesizer config")
+        if self.synthesis_cache is not None:
+            synthesizer.attach_synthesis_cache(self.synthesis_cache)
+        return synthesizer
@@ -1,13 +1,11 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import io
 import logging
-import os
+import re
 import wave
-from typing import Any, Optional
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
 import aiohttp
-
-from vocode import getenv
+from opentelemetry.trace import Span
 
 from vocode.streaming.agent.bot_sentiment_analyser import BotSentiment
 from vocode.streaming.models.message import BaseMessage
@@ -18,10 +16,41 @@ from vocode.streaming.synthesizer.base_synthesizer import (
     tracer,
 )
 from vocode.streaming.models.synthesizer import GoogleSynthesizerConfig, SynthesizerType
-from vocode.streaming.models.audio_encoding import AudioEncoding
-from vocode.streaming.utils import convert_wav
+from vocode.streaming.utils.audio_converter import StreamingAudioConverter
+
+# the rate audio is requested at; the streaming API only returns 24kHz LINEAR16
+GOOGLE_SAMPLING_RATE = 24000
+
+
+def create_ssml_with_marks(text: str) -> str:
+    """Wraps text in SSML with a mark before each word, named by the word's offset in text"""
+    ssml = []
+    end = 0
+    for word in re.finditer(r"\S+", text):
+        ssml.append(escape(text[end : word.start()]))
+        ssml.append(f'<mark name="{word.start()}"/>{escape(word.group())}')
+        end = word.end()
+    ssml.append(escape(text[end:]))
+    return f"<speak>{''.join(ssml)}</speak>"
+
+
+# given the (mark name, seconds) timepoints of create_ssml_with_marks's marks, where did we get
+# in the message by the given number of seconds?
+def get_message_up_to_from_timepoints(
+    message: str, seconds: float, timepoints: Sequence[Tuple[str, float]]
+) -> str:
+    for mark_name, time_seconds in timepoints:
+        if time_seconds > seconds:
+            return message[: int(mark_name)]
+    return message
+
 
-from opentelemetry.context.context import Context
+def get_linear_audio(audio_content: bytes) -> bytes:
+    # synthesize_speech's LINEAR16 audio comes with a WAV header
+    if not audio_content.startswith(b"RIFF"):
+        return audio_content
+    with wave.open(io.BytesIO(audio_content), "rb") as wav:
+        return wav.readframes(wav.getnframes())
 
 
 class GoogleSynthesizer(BaseSynthesizer[GoogleSynthesizerConfig]):
@@ -32,6 +61,7 @@ class GoogleSynthesizer(BaseSynthesizer[GoogleSynthesizerConfig]):
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
         super().__init__(synthesizer_config, aiohttp_session)
+        self.logger = logger or logging.getLogger(__name__)
 
         from google.cloud import texttospeech_v1beta1 as tts
         import google.auth
@@ -41,7 +71,7 @@ class GoogleSynthesizer(BaseSynthesizer[GoogleSynthesizerConfig]):
         self.tts = tts
 
         # Instantiates a client
-        self.client = tts.TextToSpeechClient()
+        self.client = tts.TextToSpeechAsyncClient()
 
         # Build the voice request, select the language code ("en-US") and the ssml
         # voice gender ("neutral")
@@ -53,19 +83,30 @@ class GoogleSynthesizer(BaseSynthesizer[GoogleSynthesizerConfig]):
         # Select the type of audio file you want returned
         self.audio_config = tts.AudioConfig(
             audio_encoding=tts.AudioEncoding.LINEAR16,
-            sample_rate_hertz=24000,
+            sample_rate_hertz=GOOGLE_SAMPLING_RATE,
             speaking_rate=synthesizer_config.speaking_rate,
             pitch=synthesizer_config.pitch,
             effects_profile_id=["telephony-class-application"],
         )
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
 
-    def synthesize(self, message: str) -> Any:
-        synthesis_input = self.tts.SynthesisInput(text=message)
+        # streaming_synthesize isn't in older google-cloud-texttospeech releases
+        self.experimental_streaming = (
+            synthesizer_config.experimental_streaming
+            and hasattr(tts, "StreamingSynthesizeRequest")
+        )
+        if synthesizer_config.experimental_streaming and not self.experimental_streaming:
+            self.logger.warning(
+                "google-cloud-texttospeech is too old to stream synthesis, "
+                "synthesizing whole messages instead"
+            )
+
+    async def synthesize(self, message: str) -> Tuple[bytes, List[Tuple[str, float]]]:
+        """Returns the LINEAR16 audio for message, and the timepoints of its word marks"""
+        synthesis_input = self.tts.SynthesisInput(ssml=create_ssml_with_marks(message))
 
         # Perform the text-to-speech request on the text input with the selected
         # voice parameters and audio file type
-        return self.client.synthesize_speech(
+        response = await self.client.synthesize_speech(
             request=self.tts.SynthesizeSpeechRequest(
                 input=synthesis_input,
                 voice=self.voice,
@@ -75,41 +116,101 @@ class GoogleSynthesizer(BaseSynthesizer[GoogleSynthesizerConfig]):
                 ],
             )
         )
+        return get_linear_audio(response.audio_content), [
+            (timepoint.mark_name, timepoint.time_seconds)
+            for timepoint in response.timepoints
+        ]
+
+    async def streaming_synthesize(self, message: str) -> AsyncIterator[bytes]:
+        """Yields LINEAR16 audio for message as it's synthesized"""
+
+        async def requests():
+            yield self.tts.StreamingSynthesizeRequest(
+                streaming_config=self.tts.StreamingSynthesizeConfig(voice=self.voice)
+            )
+            yield self.tts.StreamingSynthesizeRequest(
+                input=self.tts.StreamingSynthesisInput(text=message)
+            )
+
+        # only called when the installed client has it, see __init__
+        streaming_synthesize = getattr(self.client, "streaming_synthesize")
+        responses = await streaming_synthesize(requests=requests())
+        async for response in responses:
+            if response.audio_content:
+                yield response.audio_content
+
+    def create_audio_converter(self) -> StreamingAudioConverter:
+        return StreamingAudioConverter(
+            input_sampling_rate=GOOGLE_SAMPLING_RATE,
+            output_sampling_rate=self.synthesizer_config.sampling_rate,
+            output_encoding=self.synthesizer_config.audio_encoding,
+        )
 
-    # TODO: make this nonblocking, see speech.TextToSpeechAsyncClient
     async def create_speech(
         self,
         message: BaseMessage,
         chunk_size: int,
         bot_sentiment: Optional[BotSentiment] = None,
     ) -> SynthesisResult:
+        if self.experimental_streaming:
+            return self.create_streaming_speech(message, chunk_size)
         create_speech_span = tracer.start_span(
             f"synthesizer.{SynthesizerType.GOOGLE.value.split('_', 1)[-1]}.create_total",
         )
-        response: self.tts.SynthesizeSpeechResponse = (  # type: ignore
-            await asyncio.get_event_loop().run_in_executor(
-                self.thread_pool_executor, self.synthesize, message.text
-            )
-        )
+        audio, timepoints = await self.synthesize(message.text)
         create_speech_span.end()
-        convert_span = tracer.start_span(
-            f"synthesizer.{SynthesizerType.GOOGLE.value.split('_', 1)[-1]}.convert",
-        )
-        output_sample_rate = response.audio_config.sample_rate_hertz
-
-        output_bytes_io = io.BytesIO()
-        in_memory_wav = wave.open(output_bytes_io, "wb")
-        in_memory_wav.setnchannels(1)
-        in_memory_wav.setsampwidth(2)
-        in_memory_wav.setframerate(output_sample_rate)
-        in_memory_wav.writeframes(response.audio_content)
-        output_bytes_io.seek(0)
-
-        result = self.create_synthesis_result_from_wav(
+        result = self.create_synthesis_result_from_bytes(
             synthesizer_config=self.synthesizer_config,
-            file=output_bytes_io,
+            output_bytes=self.create_audio_converter().convert(audio),
             message=message,
             chunk_size=chunk_size,
         )
-        convert_span.end()
-        return result
+        if not timepoints:
+            return result
+        return SynthesisResult(
+            result.chunk_generator,
+            lambda seconds: get_message_up_to_from_timepoints(
+                message.text, seconds, timepoints
+            ),
+        )
+
+    def create_streaming_speech(
+        self, message: BaseMessage, chunk_size: int
+    ) -> SynthesisResult:
+        audio_converter = self.create_audio_converter()
+        num_output_bytes = 0
+
+        async def chunk_generator() -> AsyncGenerator[SynthesisResult.ChunkResult, None]:
+            nonlocal num_output_bytes
+            create_speech_span: Optional[Span] = tracer.start_span(
+                f"synthesizer.{SynthesizerType.GOOGLE.value.split('_', 1)[-1]}.create_first_chunk",
+            )
+            buffer = bytearray()
+            # a full chunk is held back until more audio arrives, so the last one can be flagged
+            async for audio in self.streaming_synthesize(message.text):
+                if create_speech_span is not None:
+                    create_speech_span.end()
+                    create_speech_span = None
+                output_bytes = audio_converter.convert(audio)
+                num_output_bytes += len(output_bytes)
+                buffer.extend(output_bytes)
+                while len(buffer) > chunk_size:
+                    yield SynthesisResult.ChunkResult(
+                        self.transform_chunk(bytes(buffer[:chunk_size])), False
+                    )
+                    del buffer[:chunk_size]
+            if create_speech_span is not None:
+                create_speech_span.end()
+            yield SynthesisResult.ChunkResult(self.transform_chunk(bytes(buffer)), True)
+
+        return SynthesisResult(
+            chunk_generator(),
+            lambda seconds: self.get_message_cutoff_from_total_response_length(
+                self.synthesizer_config, message, seconds, num_output_bytes
+            ),
+        )
+
+    def transform_chunk(self, chunk: bytes) -> bytes:
+        if self.synthesizer_config.should_encode_as_wav:
+            return encode_as_wav(chunk, self.synthesizer_config)
+        return chunk
@@ -1,5 +1,4 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import logging
 import aiohttp
 from pydub import AudioSegment
@@ -13,6 +12,7 @@ from vocode.streaming.synthesizer.base_synthesizer import (
     SynthesisResult,
     tracer,
 )
+from vocode.streaming.utils.blocking_io import get_blocking_io_executor
 
 from opentelemetry.context.context import Context
 
@@ -29,7 +29,7 @@ class GTTSSynthesizer(BaseSynthesizer):
         from gtts import gTTS
 
         self.gTTS = gTTS
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+        self.thread_pool_executor = get_blocking_io_executor()
 
     async def create_speech(
         self,
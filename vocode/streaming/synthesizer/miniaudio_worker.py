@@ -6,12 +6,122 @@ import asyncio
 import miniaudio
 
 from vocode.streaming.models.synthesizer import SynthesizerConfig
-from vocode.streaming.utils import convert_wav
-from vocode.streaming.utils.mp3_helper import decode_mp3
+from vocode.streaming.utils.audio_converter import StreamingAudioConverter
+from vocode.streaming.utils.mp3_helper import (
+    MP3_FRAME_HEADER_SIZE,
+    Mp3StreamInfo,
+    get_mp3_stream_info,
+    parse_mp3_frame_header,
+)
 from vocode.streaming.utils.worker import ThreadAsyncWorker, logger
 
+# what the decoder outputs if the stream's own sample rate can't be read
+DECODER_SAMPLING_RATE = 44100
+# one MPEG 1 mp3 frame, two MPEG 2 ones
+DECODER_FRAMES_PER_READ = 1152
+
+
+class Mp3QueueSource(miniaudio.StreamableSource):
+    """Feeds the mp3 of one utterance from the worker's input queue to the decoder
+
+    The decoder pulls from read() on the worker thread before decoding each frame, and it
+    drops a frame it only has part of, so read() hands it one complete frame at a time, as
+    soon as that has arrived. A stream that can't be split into frames is passed on as it
+    arrives. The utterance ends at the None sentinel or when the worker ends.
+    """
+
+    def __init__(self, worker: MiniaudioWorker):
+        self.worker = worker
+        # kept whole, so the decoder can seek back after probing for an ID3 tag
+        self.buffer = bytearray()
+        self.position = 0
+        # where the frame at position ends, once its header is parsed
+        self.frame_end: Optional[int] = None
+        self.is_unframed = False
+        self.ended = False
+
+    def receive(self) -> bool:
+        """Blocks until more mp3 is buffered, returns False if the utterance ended instead"""
+        while not self.ended:
+            if self.worker._ended:
+                self.ended = True
+                break
+            try:
+                mp3_chunk = self.worker.input_janus_queue.sync_q.get(timeout=1)
+            except queue.Empty:
+                continue
+            if mp3_chunk is None:
+                self.ended = True
+            else:
+                self.buffer.extend(mp3_chunk)
+                return True
+        return False
+
+    def wait_for_frame(self) -> int:
+        """Blocks until the frame at position is complete, returns where it ends"""
+        while True:
+            header_end = self.position + MP3_FRAME_HEADER_SIZE
+            if (
+                self.frame_end is None
+                and not self.is_unframed
+                and len(self.buffer) >= header_end
+            ):
+                try:
+                    self.frame_end = self.position + parse_mp3_frame_header(
+                        bytes(self.buffer[self.position : header_end])
+                    ).frame_size
+                except ValueError:
+                    self.is_unframed = True
+            if self.frame_end is not None and len(self.buffer) >= self.frame_end:
+                return self.frame_end
+            if self.is_unframed and len(self.buffer) > self.position:
+                return len(self.buffer)
+            if not self.receive():
+                return len(self.buffer)
+
+    def read(self, num_bytes: int) -> bytes:
+        end = min(self.position + num_bytes, self.wait_for_frame())
+        data = bytes(self.buffer[self.position : end])
+        self.position += len(data)
+        if self.frame_end is not None and self.position >= self.frame_end:
+            self.frame_end = None
+        return data
+
+    def seek(self, offset: int, origin: miniaudio.SeekOrigin) -> bool:
+        if origin == miniaudio.SeekOrigin.START:
+            position = offset
+        elif origin == miniaudio.SeekOrigin.CURRENT:
+            position = self.position + offset
+        else:
+            # the length isn't known until the utterance ends
+            return False
+        while len(self.buffer) < position and self.receive():
+            pass
+        if not 0 <= position <= len(self.buffer):
+            return False
+        self.position = position
+        self.frame_end = None
+        return True
+
+    def skip(self, num_bytes: int):
+        """Drops the first num_bytes, so the decoder doesn't see them at all"""
+        while len(self.buffer) < num_bytes and self.receive():
+            pass
+        del self.buffer[:num_bytes]
+
+    def drain(self):
+        while self.read(DECODER_FRAMES_PER_READ):
+            pass
+
 
 class MiniaudioWorker(ThreadAsyncWorker[Union[bytes, None]]):
+    """Decodes streamed mp3 into chunks of chunk_size bytes in the synthesizer's output format
+
+    Each utterance is the mp3 bytes up to a None sentinel; its last chunk is flagged with True.
+    The decoder and the resampler keep their state across network chunks, so each mp3 byte is
+    decoded and resampled exactly once.
+    """
+
     def __init__(
         self,
         synthesizer_config: SynthesizerConfig,
@@ -26,59 +136,93 @@ class MiniaudioWorker(ThreadAsyncWorker[Union[bytes, None]]):
         self._ended = False
 
     def _run_loop(self):
-        # tracks the mp3 so far
-        current_mp3_buffer = bytearray()
-        # tracks the wav so far
-        current_wav_buffer = bytearray()
-        # the leftover chunks of the wav that haven't been sent to the output queue yet
-        current_wav_output_buffer = bytearray()
         while not self._ended:
-            # Get a tuple of (mp3_chunk, is_last) from the input queue
+            self.decode_utterance()
+
+    def get_stream_info(self, source: Mp3QueueSource) -> Mp3StreamInfo:
+        while True:
             try:
-                mp3_chunk = self.input_janus_queue.sync_q.get(timeout=1)
-            except queue.Empty:
-                continue
-            if mp3_chunk is None:
-                current_mp3_buffer.clear()
-                current_wav_buffer.clear()
-                self.output_janus_queue.sync_q.put(
-                    (bytes(current_wav_output_buffer), True)
+                stream_info = get_mp3_stream_info(bytes(source.buffer))
+            except ValueError:
+                stream_info = None
+                break
+            if stream_info is not None or not source.receive():
+                break
+        if stream_info is None:
+            # let the decoder deal with whatever this is, untrimmed
+            source.is_unframed = True
+            return Mp3StreamInfo(sample_rate=DECODER_SAMPLING_RATE)
+        return stream_info
+
+    def decode_utterance(self):
+        source = Mp3QueueSource(self)
+        # the leftover chunks of the output that haven't been sent to the output queue yet
+        current_output_buffer = bytearray()
+        stream_info = self.get_stream_info(source)
+        source.skip(stream_info.audio_offset)
+        # decoded at the stream's own rate, so the gapless trimming is exact
+        audio_converter = StreamingAudioConverter(
+            input_sampling_rate=stream_info.sample_rate,
+            output_sampling_rate=self.synthesizer_config.sampling_rate,
+            output_encoding=self.synthesizer_config.audio_encoding,
+        )
+        samples_start = stream_info.num_leading_samples
+        samples_end = (
+            samples_start + stream_info.num_samples
+            if stream_info.num_samples is not None
+            else None
+        )
+        num_samples_decoded = 0
+        try:
+            stream = miniaudio.stream_any(
+                source,
+                source_format=miniaudio.FileFormat.MP3,
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=1,
+                sample_rate=stream_info.sample_rate,
+                frames_to_read=DECODER_FRAMES_PER_READ,
+            )
+            for samples in stream:
+                if not samples:
+                    continue
+                # the part of these samples between the leading silence and the padding
+                start = max(samples_start - num_samples_decoded, 0)
+                end = (
+                    samples_end - num_samples_decoded
+                    if samples_end is not None
+                    else len(samples)
                 )
-                current_wav_output_buffer.clear()
-                continue
-            try:
-                current_mp3_buffer.extend(mp3_chunk)
-                output_bytes = decode_mp3(bytes(current_mp3_buffer))
-            except miniaudio.DecodeError as e:
+                num_samples_decoded += len(samples)
+                if end <= start:
+                    continue
+                current_output_buffer.extend(
+                    audio_converter.convert(samples[start:end].tobytes())
+                )
+
+                # chunk up the output buffer in chunks of chunk_size bytes, but keep the last chunk (less than chunk size) in the buffer
+                output_buffer_idx = 0
+                with memoryview(current_output_buffer) as output_buffer_view:
+                    while (
+                        output_buffer_idx
+                        < len(current_output_buffer) - self.chunk_size
+                    ):
+                        chunk = bytes(
+                            output_buffer_view[
+                                output_buffer_idx : output_buffer_idx + self.chunk_size
+                            ]
+                        )
+                        self.output_janus_queue.sync_q.put((chunk, False))
+                        output_buffer_idx += self.chunk_size
+                del current_output_buffer[:output_buffer_idx]
+        except miniaudio.DecodeError as e:
+            # an empty utterance can't be decoded either, that's not an error
+            if source.buffer:
                 # TODO: better logging
                 logger.exception("MiniaudioWorker error: " + str(e), exc_info=True)
-                self.output_janus_queue.sync_q.put(
-                    (bytes(current_wav_output_buffer), True)
-                )  # sentinel
-                continue
-            converted_output_bytes = convert_wav(
-                output_bytes,
-                output_sample_rate=self.synthesizer_config.sampling_rate,
-                output_encoding=self.synthesizer_config.audio_encoding,
-            )
-            # take the difference between the current_wav_buffer and the converted_output_bytes
-            # and put the difference in the output buffer
-            new_bytes = converted_output_bytes[len(current_wav_buffer) :]
-            current_wav_output_buffer.extend(new_bytes)
-
-            # chunk up new_bytes in chunks of chunk_size bytes, but keep the last chunk (less than chunk size) in the wav output buffer
-            output_buffer_idx = 0
-            while output_buffer_idx < len(current_wav_output_buffer) - self.chunk_size:
-                chunk = current_wav_output_buffer[
-                    output_buffer_idx : output_buffer_idx + self.chunk_size
-                ]
-                self.output_janus_queue.sync_q.put(
-                    (chunk, False)
-                )  # don't need to use bytes() since we already sliced it (which is a copy)
-                output_buffer_idx += self.chunk_size
-
-            current_wav_output_buffer = current_wav_output_buffer[output_buffer_idx:]
-            current_wav_buffer.extend(new_bytes)
+        # skip whatever the decoder didn't consume so it isn't decoded as the next utterance
+        source.drain()
+        if not self._ended:
+            self.output_janus_queue.sync_q.put((bytes(current_output_buffer), True))
 
     def terminate(self):
         self._ended = True
@@ -1,7 +1,6 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 import aiohttp
 import json
 
@@ -14,9 +13,30 @@ from vocode.streaming.synthesizer.base_synthesizer import (
     encode_as_wav,
 )
 from vocode.streaming.models.synthesizer import PollySynthesizerConfig, SynthesizerType
+from vocode.streaming.constants import BLOCKING_IO_MAX_WORKERS
+from vocode.streaming.utils.blocking_io import (
+    get_blocking_io_executor,
+    iterate_blocking_reads,
+)
 from vocode.streaming.utils.mp3_helper import decode_mp3
 
 import boto3
+from botocore.config import Config
+
+_polly_client: Optional[Any] = None
+
+
+def get_polly_client() -> Any:
+    """The process-wide Polly client, so every synthesizer reuses its pool of open connections
+
+    boto3 clients are thread safe; the pool is as big as the executor that calls it.
+    """
+    global _polly_client
+    if _polly_client is None:
+        _polly_client = boto3.client(
+            "polly", config=Config(max_pool_connections=BLOCKING_IO_MAX_WORKERS)
+        )
+    return _polly_client
 
 
 class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
@@ -27,8 +47,7 @@ class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
         super().__init__(synthesizer_config, aiohttp_session)
-
-        client = boto3.client("polly")
+        self.logger = logger or logging.getLogger(__name__)
 
         # AWS Polly supports sampling rate of 8k and 16k for pcm output
         if synthesizer_config.sampling_rate not in [8000, 16000]:
@@ -38,10 +57,17 @@ class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
             )
 
         self.sampling_rate = synthesizer_config.sampling_rate
-        self.client = client
+        self.client = get_polly_client()
         self.language_code = synthesizer_config.language_code
         self.voice_id = synthesizer_config.voice_id
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+        self.thread_pool_executor = get_blocking_io_executor()
+
+    def ready_synthesizer(self):
+        # opens a connection to Polly ahead of the first sentence; runs in an executor
+        try:
+            self.client.describe_voices(LanguageCode=self.language_code)
+        except Exception:
+            self.logger.exception("Failed to warm up the Polly connection")
 
     def synthesize(self, message: str) -> Any:
         # Perform the text-to-speech request on the text input with the selected
@@ -68,6 +94,10 @@ class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
             Engine="neural"
         )
 
+    def read_word_events(self, message: str) -> List[Dict[str, Any]]:
+        speech_marks = self.get_speech_marks(message).get("AudioStream").read()
+        return [json.loads(v) for v in speech_marks.decode().split() if v]
+
     # given the number of seconds the message was allowed to go until, where did we get in the message?
     def get_message_up_to(
         self,
@@ -90,40 +120,39 @@ class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
         create_speech_span = tracer.start_span(
             f"synthesizer.{SynthesizerType.POLLY.value.split('_', 1)[-1]}.create_total",
         )
+        # the speech marks are only needed if the bot is cut off, so audio doesn't wait on them:
+        # until they arrive, get_message_up_to treats the whole message as said
+        word_events: List[Dict[str, Any]] = []
+        word_events_future = asyncio.get_event_loop().run_in_executor(
+            self.thread_pool_executor, self.read_word_events, message.text
+        )
+
+        def on_word_events(future: "asyncio.Future[List[Dict[str, Any]]]"):
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self.logger.error(
+                    "Failed to get Polly speech marks", exc_info=future.exception()
+                )
+                return
+            word_events.extend(future.result())
+
+        word_events_future.add_done_callback(on_word_events)
+
         audio_response = await asyncio.get_event_loop().run_in_executor(
             self.thread_pool_executor, self.synthesize, message.text
         )
         audio_stream = audio_response.get("AudioStream")
 
-        speech_marks_response = await asyncio.get_event_loop().run_in_executor(
-            self.thread_pool_executor, self.get_speech_marks, message.text
-        )
-        word_events = [
-            json.loads(v)
-            for v in speech_marks_response.get("AudioStream").read().decode().split()
-            if v
-        ]
-
         create_speech_span.end()
 
         async def chunk_generator(audio_data_stream, chunk_transform=lambda x: x):
-            audio_buffer = await asyncio.get_event_loop().run_in_executor(
-                self.thread_pool_executor,
-                lambda: audio_stream.read(chunk_size),
-            )
-            if len(audio_buffer) != chunk_size:
-                yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), True)
-                return
-            else:
-                yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), False)
-            while True:
-                audio_buffer = audio_stream.read(chunk_size)
-                if len(audio_buffer) != chunk_size:
-                    yield SynthesisResult.ChunkResult(
-                        chunk_transform(audio_buffer[: len(audio_buffer)]), True
-                    )
-                    break
-                yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), False)
+            async for chunk in iterate_blocking_reads(
+                lambda: audio_data_stream.read(chunk_size), chunk_size
+            ):
+                yield SynthesisResult.ChunkResult(
+                    chunk_transform(chunk), len(chunk) != chunk_size
+                )
 
         if self.synthesizer_config.should_encode_as_wav:
             output_generator = chunk_generator(
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from vocode.streaming.agent.bot_sentiment_analyser import BotSentiment
+from vocode.streaming.models.message import BaseMessage, SSMLMessage
+from vocode.streaming.models.synthesizer import SynthesizerConfig
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# fields that don't change the synthesized audio, or that change how it is framed
+# rather than what it sounds like (the cache stores unframed audio)
+CACHE_KEY_EXCLUDED_CONFIG_FIELDS = {
+    "api_key",
+    "sentiment_config",
+    "synthesis_lookahead",
+    "should_encode_as_wav",
+}
+
+
+class SynthesisCache:
+    """Content-addressed store for synthesized audio, shared across conversations.
+
+    Entries are keyed on the message text (and SSML) plus every synthesizer config field that
+    affects the audio: voice, rate, pitch, audio encoding, sampling rate, etc. Audio is stored
+    in the synthesizer's output encoding without any WAV framing. An in-memory LRU tier is
+    bounded by max_memory_bytes; if disk_cache_path is set, entries are also persisted there
+    so they survive restarts, and the oldest files are pruned past max_disk_bytes.
+
+    The size of the disk tier is counted once, on the first write, and then kept up to date in
+    memory, so the directory is only scanned again when it needs pruning. Entries written by
+    other processes sharing the directory are picked up by that scan.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        disk_cache_path: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_cache_path = disk_cache_path
+        self.max_disk_bytes = max_disk_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self.memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # None until the first write counts what's already on disk
+        self.disk_bytes: Optional[int] = None
+        # writes run in executor threads
+        self.disk_lock = threading.Lock()
+        if self.disk_cache_path is not None:
+            os.makedirs(self.disk_cache_path, exist_ok=True)
+
+    @staticmethod
+    def get_key(
+        synthesizer_config: SynthesizerConfig,
+        message: BaseMessage,
+        bot_sentiment: Optional[BotSentiment] = None,
+    ) -> str:
+        key_parts = [
+            message.text,
+            message.ssml if isinstance(message, SSMLMessage) else "",
+            synthesizer_config.json(
+                exclude=CACHE_KEY_EXCLUDED_CONFIG_FIELDS, sort_keys=True
+            ),
+            bot_sentiment.json(sort_keys=True) if bot_sentiment else "",
+        ]
+        return hashlib.sha256("\0".join(key_parts).encode("utf-8")).hexdigest()
+
+    def get_disk_path(self, key: str) -> str:
+        assert self.disk_cache_path is not None
+        return os.path.join(self.disk_cache_path, f"{key}.bytes")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        audio = self.memory_cache.get(key)
+        if audio is not None:
+            self.memory_cache.move_to_end(key)
+        elif self.disk_cache_path is not None:
+            audio = await asyncio.get_event_loop().run_in_executor(
+                None, self.read_from_disk, key
+            )
+            if audio is not None:
+                self.put_in_memory(key, audio)
+        if audio is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return audio
+
+    async def put(self, key: str, audio: bytes):
+        if not audio:
+            return
+        self.put_in_memory(key, audio)
+        if self.disk_cache_path is not None:
+            await asyncio.get_event_loop().run_in_executor(
+                None, self.write_to_disk, key, audio
+            )
+
+    def put_in_memory(self, key: str, audio: bytes):
+        if len(audio) > self.max_memory_bytes:
+            return
+        previous = self.memory_cache.pop(key, None)
+        if previous is not None:
+            self.memory_bytes -= len(previous)
+        self.memory_cache[key] = audio
+        self.memory_bytes += len(audio)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory_cache.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+
+    def read_from_disk(self, key: str) -> Optional[bytes]:
+        path = self.get_disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            os.utime(path)  # keeps recently used entries from being pruned
+            return audio
+        except FileNotFoundError:
+            return None
+
+    def write_to_disk(self, key: str, audio: bytes):
+        path = self.get_disk_path(key)
+        # write to a temporary file first so that a concurrent reader never sees a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self.disk_lock:
+            if self.disk_bytes is None:
+                self.disk_bytes = self.get_disk_usage()
+            try:
+                replaced_bytes = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced_bytes = 0
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(audio)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.warning(f"Failed to write synthesis cache entry: {e}")
+                return
+            self.disk_bytes += len(audio) - replaced_bytes
+            if self.disk_bytes > self.max_disk_bytes:
+                self.disk_bytes = self.prune_disk(keep_path=path)
+
+    def get_disk_usage(self) -> int:
+        return sum(size for _, size, _ in self.scan_disk())
+
+    def scan_disk(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every entry on disk"""
+        assert self.disk_cache_path is not None
+        entries = []
+        with os.scandir(self.disk_cache_path) as it:
+            for entry in it:
+                if not entry.name.endswith(".bytes"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def prune_disk(self, keep_path: Optional[str] = None) -> int:
+        """Removes the least recently used entries past max_disk_bytes, returns the bytes left"""
+        entries = self.scan_disk()
+        total_bytes = sum(size for _, size, _ in entries)
+        if total_bytes <= self.max_disk_bytes:
+            return total_bytes
+        for _, size, path in sorted(entries):
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            if total_bytes <= self.max_disk_bytes:
+                break
+        return total_bytes
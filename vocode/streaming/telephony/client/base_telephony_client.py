@@ -23,7 +23,11 @@ class BaseTelephonyClient:
     async def end_call(self, id) -> bool:
         raise NotImplementedError
 
-    def validate_outbound_call(
+    async def is_call_ended(self, id) -> bool:
+        """Whether the provider reports the call as over, including calls that never connected"""
+        raise NotImplementedError
+
+    async def validate_outbound_call(
         self,
         to_phone: str,
         from_phone: str,
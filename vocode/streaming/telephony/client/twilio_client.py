@@ -1,28 +1,134 @@
-from typing import Optional
-from twilio.rest import Client
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
 
-from vocode.streaming.models.telephony import BaseCallConfig, TwilioConfig
+import aiohttp
+
+from vocode.streaming.models.telephony import TwilioConfig
 from vocode.streaming.telephony.client.base_telephony_client import BaseTelephonyClient
+from vocode.streaming.telephony.constants import LINE_TYPE_CACHE_SIZE
 from vocode.streaming.telephony.templater import Templater
 
+TWILIO_API_URL = "https://api.twilio.com/2010-04-01"
+TWILIO_LOOKUPS_API_URL = "https://lookups.twilio.com/v2"
+# extra_params that aren't parameters of the Calls API
+NON_CALL_EXTRA_PARAMS = {"recordings_create_params"}
+
+# statuses of calls that are over, whether or not they were answered
+TWILIO_ENDED_CALL_STATUSES = {"completed", "busy", "failed", "no-answer", "canceled"}
+
+# credentials already checked by this process, as (account sid, auth token hash)
+validated_credentials: Set[Tuple[str, str]] = set()
+# line type ("mobile", "landline", ...) by phone number, least recently used first, so
+# numbers that are called again aren't looked up again
+line_types: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
+
+def to_twilio_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts twilio-python style kwargs (e.g. machine_detection=...) to REST API form fields"""
+    twilio_params: Dict[str, Any] = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, (list, tuple)):
+            value = [str(item) for item in value]
+        else:
+            value = str(value)
+        twilio_params["".join(word.capitalize() for word in name.split("_"))] = value
+    return twilio_params
+
+
+def to_form_data(params: Dict[str, Any]) -> aiohttp.FormData:
+    form_data = aiohttp.FormData()
+    for name, value in params.items():
+        for item in value if isinstance(value, list) else [value]:
+            form_data.add_field(name, item)
+    return form_data
+
 
 class TwilioClient(BaseTelephonyClient):
-    def __init__(self, base_url: str, twilio_config: TwilioConfig):
+    """Calls the Twilio REST API with aiohttp, so requests don't block the event loop
+
+    Credentials are checked on the first request made with them, once per process.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        twilio_config: TwilioConfig,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
+    ):
         super().__init__(base_url)
         self.twilio_config = twilio_config
-        # TODO: this is blocking
-        self.twilio_client = Client(twilio_config.account_sid, twilio_config.auth_token)
+        self.auth = aiohttp.BasicAuth(
+            twilio_config.account_sid, twilio_config.auth_token
+        )
+        self.account_url = f"{TWILIO_API_URL}/Accounts/{twilio_config.account_sid}"
+        self.maybe_aiohttp_session = aiohttp_session
+        self.templater = Templater()
+
+    def get_telephony_config(self):
+        return self.twilio_config
+
+    def get_credentials_key(self) -> Tuple[str, str]:
+        return (
+            self.twilio_config.account_sid,
+            hashlib.sha256(self.twilio_config.auth_token.encode()).hexdigest(),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        action: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        aiohttp_session = self.maybe_aiohttp_session or aiohttp.ClientSession()
+        try:
+            async with aiohttp_session.request(
+                method,
+                url,
+                params=params,
+                data=to_form_data(data) if data is not None else None,
+                auth=self.auth,
+            ) as response:
+                if not response.ok:
+                    raise RuntimeError(
+                        f"Failed to {action}: {response.status} {await response.text()}"
+                    )
+                return await response.json()
+        finally:
+            if not self.maybe_aiohttp_session:
+                await aiohttp_session.close()
+
+    async def validate_credentials(self):
+        credentials_key = self.get_credentials_key()
+        if credentials_key in validated_credentials:
+            return
         try:
-            # Test credentials
-            self.twilio_client.api.accounts(twilio_config.account_sid).fetch()
+            await self.request(
+                "GET", f"{self.account_url}.json", action="fetch account"
+            )
         except Exception as e:
             raise RuntimeError(
                 "Could not create Twilio client. Invalid credentials"
             ) from e
-        self.templater = Templater()
+        validated_credentials.add(credentials_key)
 
-    def get_telephony_config(self):
-        return self.twilio_config
+    async def call_api(
+        self,
+        method: str,
+        path: str,
+        action: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        await self.validate_credentials()
+        return await self.request(
+            method, f"{self.account_url}{path}", action=action, data=data
+        )
 
     async def create_call(
         self,
@@ -32,29 +138,61 @@ class TwilioClient(BaseTelephonyClient):
         record: bool = False,
         digits: Optional[str] = None,
     ) -> str:
-        # TODO: Make this async. This is blocking.
         twiml = self.get_connection_twiml(conversation_id=conversation_id)
-        twilio_call = self.twilio_client.calls.create(
-            twiml=twiml.body.decode("utf-8"),
-            to=to_phone,
-            from_=from_phone,
-            send_digits=digits,
-            record=record,
-            **self.get_telephony_config().extra_params,
+        extra_params = {
+            name: value
+            for name, value in (self.get_telephony_config().extra_params or {}).items()
+            if name not in NON_CALL_EXTRA_PARAMS
+        }
+        twilio_call = await self.call_api(
+            "POST",
+            "/Calls.json",
+            action="start call",
+            data=to_twilio_params(
+                {
+                    "twiml": twiml.body.decode("utf-8"),
+                    "to": to_phone,
+                    "from": from_phone,
+                    "send_digits": digits,
+                    "record": record,
+                    **extra_params,
+                }
+            ),
         )
-        return twilio_call.sid
+        return twilio_call["sid"]
 
     def get_connection_twiml(self, conversation_id: str):
         return self.templater.get_connection_twiml(
             base_url=self.base_url, call_id=conversation_id
         )
 
+    async def fetch_call(self, twilio_sid: str) -> Dict[str, Any]:
+        return await self.call_api(
+            "GET", f"/Calls/{twilio_sid}.json", action="fetch call"
+        )
+
+    async def is_call_ended(self, twilio_sid: str) -> bool:
+        twilio_call = await self.fetch_call(twilio_sid)
+        return twilio_call["status"] in TWILIO_ENDED_CALL_STATUSES
+
+    async def create_recording(self, twilio_sid: str, **params) -> Dict[str, Any]:
+        return await self.call_api(
+            "POST",
+            f"/Calls/{twilio_sid}/Recordings.json",
+            action="start recording",
+            data=to_twilio_params(params),
+        )
+
     async def end_call(self, twilio_sid):
-        # TODO: Make this async. This is blocking.
-        response = self.twilio_client.calls(twilio_sid).update(status="completed")
-        return response.status == "completed"
+        twilio_call = await self.call_api(
+            "POST",
+            f"/Calls/{twilio_sid}.json",
+            action="end call",
+            data={"Status": "completed"},
+        )
+        return twilio_call["status"] == "completed"
 
-    def validate_outbound_call(
+    async def validate_outbound_call(
         self,
         to_phone: str,
         from_phone: str,
@@ -65,12 +203,23 @@ class TwilioClient(BaseTelephonyClient):
 
         if not mobile_only:
             return
-        line_type_intelligence = (
-            self.twilio_client.lookups.v2.phone_numbers(to_phone)
-            .fetch(fields="line_type_intelligence")
-            .line_type_intelligence
-        )
-        if not line_type_intelligence or (
-            line_type_intelligence and line_type_intelligence["type"] != "mobile"
-        ):
+        if await self.get_line_type(to_phone) != "mobile":
             raise ValueError("Can only call mobile phones")
+
+    async def get_line_type(self, phone: str) -> Optional[str]:
+        if phone in line_types:
+            line_types.move_to_end(phone)
+            return line_types[phone]
+        await self.validate_credentials()
+        phone_number = await self.request(
+            "GET",
+            f"{TWILIO_LOOKUPS_API_URL}/PhoneNumbers/{phone}",
+            action="look up phone number",
+            params={"Fields": "line_type_intelligence"},
+        )
+        line_type_intelligence = phone_number.get("line_type_intelligence")
+        line_type = line_type_intelligence["type"] if line_type_intelligence else None
+        line_types[phone] = line_type
+        if len(line_types) > LINE_TYPE_CACHE_SIZE:
+            line_types.popitem(last=False)
+        return line_type
@@ -6,6 +6,17 @@ import vonage
 
 from vocode.streaming.telephony.constants import VONAGE_CONTENT_TYPE
 
+# statuses of calls that are over, whether or not they were answered
+VONAGE_ENDED_CALL_STATUSES = {
+    "completed",
+    "busy",
+    "cancelled",
+    "failed",
+    "rejected",
+    "timeout",
+    "unanswered",
+}
+
 
 class VonageClient(BaseTelephonyClient):
     def __init__(
@@ -123,8 +134,29 @@ class VonageClient(BaseTelephonyClient):
             await aiohttp_session.close()
         return True
 
+    async def fetch_call(self, id) -> Dict[str, Any]:
+        aiohttp_session = self.maybe_aiohttp_session or aiohttp.ClientSession()
+        async with aiohttp_session.get(
+            f"https://api.nexmo.com/v1/calls/{id}",
+            headers={
+                "Authorization": f"Bearer {self.client._generate_application_jwt().decode()}"
+            },
+        ) as response:
+            if not response.ok:
+                raise RuntimeError(
+                    f"Failed to fetch call: {response.status} {response.reason}"
+                )
+            vonage_call = await response.json()
+        if not self.maybe_aiohttp_session:
+            await aiohttp_session.close()
+        return vonage_call
+
+    async def is_call_ended(self, id) -> bool:
+        vonage_call = await self.fetch_call(id)
+        return vonage_call["status"] in VONAGE_ENDED_CALL_STATUSES
+
     # TODO(EPD-186)
-    def validate_outbound_call(
+    async def validate_outbound_call(
         self,
         to_phone: str,
         from_phone: str,
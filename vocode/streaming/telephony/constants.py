@@ -5,7 +5,29 @@ DEFAULT_SAMPLING_RATE = 8000
 DEFAULT_AUDIO_ENCODING = AudioEncoding.MULAW
 DEFAULT_CHUNK_SIZE = 20 * 160
 
+# short chunks, so that an interrupt stops the bot within a tenth of a second
+TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS = 0.1
+
 VONAGE_SAMPLING_RATE = 16000
 VONAGE_AUDIO_ENCODING = AudioEncoding.LINEAR16
 VONAGE_CHUNK_SIZE = 640  # 20ms at 16kHz with 16bit samples
 VONAGE_CONTENT_TYPE = "audio/l16;rate=16000"
+
+# how long a prewarmed call waits for its media websocket before its resources are released
+PREWARMED_CALL_TTL_SECONDS = 30
+
+# outbound campaigns
+OUTBOUND_CAMPAIGN_MAX_CONCURRENT_CALLS = 50
+# Twilio's default limit is 1 call per second per account
+OUTBOUND_CAMPAIGN_ACCOUNT_CALLS_PER_SECOND = 1.0
+OUTBOUND_CAMPAIGN_NUMBER_CALLS_PER_SECOND = 1.0
+# calls whose status can't be fetched free their slot after this
+OUTBOUND_CAMPAIGN_MAX_CALL_SECONDS = 15 * 60
+# how often the status of live calls is fetched from the provider
+OUTBOUND_CAMPAIGN_CALL_ENDED_POLL_SECONDS = 5
+# line types of looked up numbers, kept by TwilioClient
+LINE_TYPE_CACHE_SIZE = 100_000
+
+# how often each TelephonyWorker reports its load, and how long a report lasts if it stops
+TELEPHONY_WORKER_LOAD_REPORT_INTERVAL_SECONDS = 2
+TELEPHONY_WORKER_LOAD_TTL_SECONDS = 10
@@ -19,7 +19,10 @@ from vocode.streaming.synthesizer.factory import SynthesizerFactory
 from vocode.streaming.telephony.config_manager.base_config_manager import (
     BaseConfigManager,
 )
-from vocode.streaming.telephony.constants import DEFAULT_SAMPLING_RATE
+from vocode.streaming.telephony.constants import (
+    DEFAULT_SAMPLING_RATE,
+    TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
+)
 from vocode.streaming.streaming_conversation import StreamingConversation
 from vocode.streaming.transcriber.factory import TranscriberFactory
 from vocode.streaming.utils.events_manager import EventsManager
@@ -66,6 +69,7 @@ class Call(StreamingConversation[TelephonyOutputDeviceType]):
             synthesizer_factory.create_synthesizer(synthesizer_config, logger=logger),
             conversation_id=conversation_id,
             per_chunk_allowance_seconds=0.01,
+            text_to_speech_chunk_size_seconds=TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS,
             events_manager=events_manager,
             logger=logger,
         )
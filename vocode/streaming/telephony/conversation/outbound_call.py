@@ -1,5 +1,7 @@
 import logging
 from typing import Optional, Union
+
+import aiohttp
 from vocode import getenv
 
 from vocode.streaming.models.agent import AgentConfig
@@ -8,6 +10,7 @@ from vocode.streaming.models.synthesizer import (
     SynthesizerConfig,
 )
 from vocode.streaming.models.telephony import (
+    BaseCallConfig,
     TwilioCallConfig,
     TwilioConfig,
     VonageCallConfig,
@@ -44,8 +47,11 @@ class OutboundCall:
             str
         ] = None,  # Keys to press when the call connects, see send_digits https://www.twilio.com/docs/voice/api/call-resource#create-a-call-resource
         output_to_speaker: bool = False,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
+        telephony_client: Optional[BaseTelephonyClient] = None,
     ):
         self.base_url = base_url
+        self.aiohttp_session = aiohttp_session
         self.to_phone = to_phone
         self.digits = digits
         self.from_phone = from_phone
@@ -64,23 +70,28 @@ class OutboundCall:
                 account_sid=getenv("TWILIO_ACCOUNT_SID"),
                 auth_token=getenv("TWILIO_AUTH_TOKEN"),
             )
-        self.telephony_client = self.create_telephony_client()
+        # calls placed together can share a client
+        self.telephony_client = telephony_client or self.create_telephony_client()
         assert not output_to_speaker or isinstance(
             self.telephony_client, VonageClient
         ), "Output to speaker is only supported for Vonage calls"
         self.transcriber_config = self.create_transcriber_config(transcriber_config)
         self.synthesizer_config = self.create_synthesizer_config(synthesizer_config)
-        self.telephony_id = None
+        self.telephony_id: Optional[str] = None
         self.output_to_speaker = output_to_speaker
 
     def create_telephony_client(self) -> BaseTelephonyClient:
         if self.twilio_config is not None:
             return TwilioClient(
-                base_url=self.base_url, twilio_config=self.twilio_config
+                base_url=self.base_url,
+                twilio_config=self.twilio_config,
+                aiohttp_session=self.aiohttp_session,
             )
         elif self.vonage_config is not None:
             return VonageClient(
-                base_url=self.base_url, vonage_config=self.vonage_config
+                base_url=self.base_url,
+                vonage_config=self.vonage_config,
+                aiohttp_session=self.aiohttp_session,
             )
         else:
             raise ValueError("No telephony config provided")
@@ -111,11 +122,21 @@ class OutboundCall:
 
     async def start(self):
         self.logger.debug("Starting outbound call")
-        self.telephony_client.validate_outbound_call(
+        await self.validate()
+        await self.place_call()
+
+    async def validate(self):
+        await self.telephony_client.validate_outbound_call(
             to_phone=self.to_phone,
             from_phone=self.from_phone,
             mobile_only=self.mobile_only,
         )
+
+    async def place_call(self):
+        """Dials the call and saves its config, which the call needs as soon as it connects
+
+        If the config can't be saved, the call is hung up and the error is raised.
+        """
         self.telephony_id = await self.telephony_client.create_call(
             conversation_id=self.conversation_id,
             to_phone=self.to_phone,
@@ -123,30 +144,41 @@ class OutboundCall:
             record=self.telephony_client.get_telephony_config().record,
             digits=self.digits,
         )
+        call_config = self.create_call_config(self.telephony_id)
+        try:
+            await self.config_manager.save_config(self.conversation_id, call_config)
+        except Exception:
+            try:
+                await self.end()
+            except Exception:
+                self.logger.exception("Failed to end call with no saved config")
+            raise
+
+    def create_call_config(self, telephony_id: str) -> BaseCallConfig:
         if isinstance(self.telephony_client, TwilioClient):
-            call_config = TwilioCallConfig(
+            return TwilioCallConfig(
                 transcriber_config=self.transcriber_config,
                 agent_config=self.agent_config,
                 synthesizer_config=self.synthesizer_config,
                 twilio_config=self.telephony_client.twilio_config,
-                twilio_sid=self.telephony_id,
+                twilio_sid=telephony_id,
                 from_phone=self.from_phone,
                 to_phone=self.to_phone,
             )
         elif isinstance(self.telephony_client, VonageClient):
-            call_config = VonageCallConfig(
+            return VonageCallConfig(
                 transcriber_config=self.transcriber_config,
                 agent_config=self.agent_config,
                 synthesizer_config=self.synthesizer_config,
                 vonage_config=self.telephony_client.vonage_config,
-                vonage_uuid=self.telephony_id,
+                vonage_uuid=telephony_id,
                 from_phone=self.from_phone,
                 to_phone=self.to_phone,
                 output_to_speaker=self.output_to_speaker,
             )
         else:
             raise ValueError("Unknown telephony client")
-        await self.config_manager.save_config(self.conversation_id, call_config)
 
     async def end(self):
+        assert self.telephony_id is not None, "Call has not been placed"
         return await self.telephony_client.end_call(self.telephony_id)
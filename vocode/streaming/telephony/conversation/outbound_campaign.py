@@ -0,0 +1,277 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import AsyncIterable, Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+import aiohttp
+from pydantic import BaseModel
+
+from vocode import getenv
+from vocode.streaming.models.agent import AgentConfig
+from vocode.streaming.models.events import Event, PhoneCallEndedEvent
+from vocode.streaming.models.synthesizer import SynthesizerConfig
+from vocode.streaming.models.telephony import TwilioConfig, VonageConfig
+from vocode.streaming.models.transcriber import TranscriberConfig
+from vocode.streaming.telephony.client.base_telephony_client import BaseTelephonyClient
+from vocode.streaming.telephony.client.twilio_client import TwilioClient
+from vocode.streaming.telephony.client.vonage_client import VonageClient
+from vocode.streaming.telephony.config_manager.base_config_manager import (
+    BaseConfigManager,
+)
+from vocode.streaming.telephony.constants import (
+    OUTBOUND_CAMPAIGN_ACCOUNT_CALLS_PER_SECOND,
+    OUTBOUND_CAMPAIGN_CALL_ENDED_POLL_SECONDS,
+    OUTBOUND_CAMPAIGN_MAX_CALL_SECONDS,
+    OUTBOUND_CAMPAIGN_MAX_CONCURRENT_CALLS,
+    OUTBOUND_CAMPAIGN_NUMBER_CALLS_PER_SECOND,
+)
+from vocode.streaming.telephony.conversation.outbound_call import OutboundCall
+from vocode.streaming.utils.rate_limiter import RateLimiter
+
+
+class OutboundCampaignTarget(BaseModel):
+    to_phone: str
+    # defaults to the campaign's
+    agent_config: Optional[AgentConfig] = None
+    digits: Optional[str] = None
+
+
+class ActiveCall(NamedTuple):
+    telephony_id: str
+    # frees the call's slot regardless after max_call_seconds
+    timer_handle: asyncio.TimerHandle
+
+
+class OutboundCampaignMetrics(BaseModel):
+    num_targets: int
+    num_calls_placed: int
+    # failed validation, e.g. not a mobile number
+    num_targets_rejected: int
+    num_calls_failed: int
+    num_active_calls: int
+    elapsed_seconds: float
+    calls_placed_per_second: float
+
+
+class OutboundCampaign:
+    """Dials a stream of targets with OutboundCall, as fast as the provider's limits allow
+
+    Calls are placed at most account_calls_per_second across the campaign and
+    number_calls_per_second from each of from_phones (used in turn), with no more than
+    max_concurrent_calls live at once. A call's slot is freed when the provider reports the
+    call as over, which covers calls that were never answered, or sooner if on_event is called
+    with the events of the server running the calls. A call whose status can't be fetched
+    frees its slot after max_call_seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        from_phones: List[str],
+        config_manager: BaseConfigManager,
+        agent_config: AgentConfig,
+        twilio_config: Optional[TwilioConfig] = None,
+        vonage_config: Optional[VonageConfig] = None,
+        transcriber_config: Optional[TranscriberConfig] = None,
+        synthesizer_config: Optional[SynthesizerConfig] = None,
+        max_concurrent_calls: int = OUTBOUND_CAMPAIGN_MAX_CONCURRENT_CALLS,
+        account_calls_per_second: float = OUTBOUND_CAMPAIGN_ACCOUNT_CALLS_PER_SECOND,
+        number_calls_per_second: float = OUTBOUND_CAMPAIGN_NUMBER_CALLS_PER_SECOND,
+        max_call_seconds: float = OUTBOUND_CAMPAIGN_MAX_CALL_SECONDS,
+        mobile_only: bool = True,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        if not from_phones:
+            raise ValueError("At least one from phone is needed")
+        self.base_url = base_url
+        self.from_phones = from_phones
+        self.config_manager = config_manager
+        self.agent_config = agent_config
+        self.twilio_config = twilio_config
+        self.vonage_config = vonage_config
+        if not self.twilio_config and not self.vonage_config:
+            self.twilio_config = TwilioConfig(
+                account_sid=getenv("TWILIO_ACCOUNT_SID"),
+                auth_token=getenv("TWILIO_AUTH_TOKEN"),
+            )
+        self.transcriber_config = transcriber_config
+        self.synthesizer_config = synthesizer_config
+        self.max_call_seconds = max_call_seconds
+        self.mobile_only = mobile_only
+        self.aiohttp_session = aiohttp_session
+        self.logger = logger or logging.getLogger(__name__)
+        self.telephony_client = self.create_telephony_client()
+
+        self.call_slots = asyncio.Semaphore(max_concurrent_calls)
+        self.account_rate_limiter = RateLimiter(account_calls_per_second)
+        self.number_rate_limiters = {
+            from_phone: RateLimiter(number_calls_per_second)
+            for from_phone in from_phones
+        }
+        self.next_from_phones = itertools.cycle(from_phones)
+        # live calls by conversation id
+        self.active_calls: Dict[str, ActiveCall] = {}
+
+        self.num_targets = 0
+        self.num_calls_placed = 0
+        self.num_targets_rejected = 0
+        self.num_calls_failed = 0
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+
+    def create_telephony_client(self) -> BaseTelephonyClient:
+        if self.twilio_config is not None:
+            return TwilioClient(
+                base_url=self.base_url,
+                twilio_config=self.twilio_config,
+                aiohttp_session=self.aiohttp_session,
+            )
+        else:
+            assert self.vonage_config is not None
+            return VonageClient(
+                base_url=self.base_url,
+                vonage_config=self.vonage_config,
+                aiohttp_session=self.aiohttp_session,
+            )
+
+    def create_outbound_call(
+        self, target: OutboundCampaignTarget, from_phone: str
+    ) -> OutboundCall:
+        return OutboundCall(
+            base_url=self.base_url,
+            to_phone=target.to_phone,
+            from_phone=from_phone,
+            config_manager=self.config_manager,
+            agent_config=target.agent_config or self.agent_config,
+            twilio_config=self.twilio_config,
+            vonage_config=self.vonage_config,
+            transcriber_config=self.transcriber_config,
+            synthesizer_config=self.synthesizer_config,
+            logger=self.logger,
+            mobile_only=self.mobile_only,
+            digits=target.digits,
+            aiohttp_session=self.aiohttp_session,
+            telephony_client=self.telephony_client,
+        )
+
+    async def run(
+        self,
+        targets: Union[
+            Iterable[OutboundCampaignTarget], AsyncIterable[OutboundCampaignTarget]
+        ],
+    ) -> OutboundCampaignMetrics:
+        """Dials every target, returns once they've all been dialed"""
+        self.start_time = time.time()
+        self.end_time = None
+        dial_tasks: Set[asyncio.Task] = set()
+        poll_task = asyncio.create_task(self.poll_for_ended_calls())
+        try:
+            async for target in self.iterate(targets):
+                self.num_targets += 1
+                await self.call_slots.acquire()
+                dial_task = asyncio.create_task(
+                    self.dial(target, next(self.next_from_phones))
+                )
+                dial_tasks.add(dial_task)
+                dial_task.add_done_callback(dial_tasks.discard)
+            await asyncio.gather(*dial_tasks)
+        finally:
+            poll_task.cancel()
+            for dial_task in dial_tasks:
+                dial_task.cancel()
+            self.end_time = time.time()
+        return self.get_metrics()
+
+    async def iterate(self, targets):
+        if isinstance(targets, AsyncIterable):
+            async for target in targets:
+                yield target
+        else:
+            for target in targets:
+                yield target
+
+    async def dial(self, target: OutboundCampaignTarget, from_phone: str):
+        outbound_call = self.create_outbound_call(target, from_phone)
+        try:
+            await outbound_call.validate()
+        except ValueError as e:
+            self.logger.info(f"Not calling {target.to_phone}: {e}")
+            self.num_targets_rejected += 1
+            self.call_slots.release()
+            return
+        except Exception:
+            self.logger.exception(f"Failed to validate {target.to_phone}")
+            self.num_calls_failed += 1
+            self.call_slots.release()
+            return
+        await self.number_rate_limiters[from_phone].wait()
+        await self.account_rate_limiter.wait()
+        try:
+            # saves the call's config before the call can connect
+            await outbound_call.place_call()
+        except Exception:
+            self.logger.exception(f"Failed to call {target.to_phone}")
+            self.num_calls_failed += 1
+            self.call_slots.release()
+            return
+        assert outbound_call.telephony_id is not None
+        self.num_calls_placed += 1
+        conversation_id = outbound_call.conversation_id
+        self.active_calls[conversation_id] = ActiveCall(
+            telephony_id=outbound_call.telephony_id,
+            timer_handle=asyncio.get_running_loop().call_later(
+                self.max_call_seconds, self.on_call_ended, conversation_id
+            ),
+        )
+
+    def on_event(self, event: Event):
+        if isinstance(event, PhoneCallEndedEvent):
+            self.on_call_ended(event.conversation_id)
+
+    def on_call_ended(self, conversation_id: str):
+        active_call = self.active_calls.pop(conversation_id, None)
+        if active_call is None:
+            return
+        active_call.timer_handle.cancel()
+        self.call_slots.release()
+
+    async def poll_for_ended_calls(self):
+        """Checks the status of every live call with the provider, wherever the call runs"""
+        while True:
+            await asyncio.sleep(OUTBOUND_CAMPAIGN_CALL_ENDED_POLL_SECONDS)
+            active_calls = list(self.active_calls.items())
+            are_calls_ended = await asyncio.gather(
+                *(
+                    self.telephony_client.is_call_ended(active_call.telephony_id)
+                    for _, active_call in active_calls
+                ),
+                return_exceptions=True,
+            )
+            for (conversation_id, active_call), is_call_ended in zip(
+                active_calls, are_calls_ended
+            ):
+                if isinstance(is_call_ended, BaseException):
+                    self.logger.warning(
+                        f"Failed to fetch status of call {active_call.telephony_id}: "
+                        f"{is_call_ended}"
+                    )
+                elif is_call_ended:
+                    self.on_call_ended(conversation_id)
+
+    def get_metrics(self) -> OutboundCampaignMetrics:
+        elapsed_seconds = 0.0
+        if self.start_time is not None:
+            elapsed_seconds = (self.end_time or time.time()) - self.start_time
+        return OutboundCampaignMetrics(
+            num_targets=self.num_targets,
+            num_calls_placed=self.num_calls_placed,
+            num_targets_rejected=self.num_targets_rejected,
+            num_calls_failed=self.num_calls_failed,
+            num_active_calls=len(self.active_calls),
+            elapsed_seconds=elapsed_seconds,
+            calls_placed_per_second=self.num_calls_placed / elapsed_seconds
+            if elapsed_seconds > 0
+            else 0,
+        )
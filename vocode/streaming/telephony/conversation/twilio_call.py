@@ -1,4 +1,5 @@
 import asyncio
+import aiohttp
 from fastapi import WebSocket
 import base64
 from enum import Enum
@@ -51,6 +52,7 @@ class TwilioCall(Call[TwilioOutputDevice]):
         synthesizer_factory: SynthesizerFactory = SynthesizerFactory(),
         events_manager: Optional[EventsManager] = None,
         logger: Optional[logging.Logger] = None,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
         super().__init__(
             from_phone,
@@ -75,7 +77,9 @@ class TwilioCall(Call[TwilioOutputDevice]):
             auth_token=getenv("TWILIO_AUTH_TOKEN"),
         )
         self.telephony_client = TwilioClient(
-            base_url=base_url, twilio_config=self.twilio_config
+            base_url=base_url,
+            twilio_config=self.twilio_config,
+            aiohttp_session=aiohttp_session,
         )
         self.twilio_sid = twilio_sid
         self.latest_media_timestamp = 0
@@ -86,8 +90,7 @@ class TwilioCall(Call[TwilioOutputDevice]):
     async def attach_ws_and_start(self, ws: WebSocket):
         super().attach_ws(ws)
 
-        twilio_call_ref = self.telephony_client.twilio_client.calls(self.twilio_sid)
-        twilio_call = twilio_call_ref.fetch()
+        twilio_call = await self.telephony_client.fetch_call(self.twilio_sid)
 
         if self.twilio_config.record:
             recordings_create_params = (
@@ -95,16 +98,15 @@ class TwilioCall(Call[TwilioOutputDevice]):
                 if self.twilio_config.extra_params
                 else None
             )
-            recording = (
-                twilio_call_ref.recordings.create(**recordings_create_params)
-                if recordings_create_params
-                else twilio_call_ref.recordings.create()
+            recording = await self.telephony_client.create_recording(
+                self.twilio_sid, **(recordings_create_params or {})
             )
-            self.logger.info(f"Recording: {recording.sid}")
+            self.logger.info(f"Recording: {recording['sid']}")
 
-        if twilio_call.answered_by in ("machine_start", "fax"):
-            self.logger.info(f"Call answered by {twilio_call.answered_by}")
-            twilio_call.update(status="completed")
+        answered_by = twilio_call.get("answered_by")
+        if answered_by in ("machine_start", "fax"):
+            self.logger.info(f"Call answered by {answered_by}")
+            await self.telephony_client.end_call(self.twilio_sid)
         else:
             await self.wait_for_twilio_start(ws)
             await super().start()
@@ -154,6 +156,9 @@ class TwilioCall(Call[TwilioOutputDevice]):
                 self.receive_audio(b"\xff" * bytes_to_fill)
             self.latest_media_timestamp = int(media["timestamp"])
             self.receive_audio(chunk)
+        elif data["event"] == "mark":
+            assert isinstance(self.output_device, TwilioOutputDevice)
+            self.output_device.on_mark(data["mark"]["name"])
         elif data["event"] == "stop":
             self.logger.debug(f"Media WS: Received event 'stop': {message}")
             self.logger.debug("Stopping...")
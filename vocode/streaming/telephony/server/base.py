@@ -25,7 +25,9 @@ from vocode.streaming.telephony.constants import (
 )
 
 from vocode.streaming.telephony.server.router.calls import CallsRouter
+from vocode.streaming.telephony.server.telephony_worker import TelephonyWorker
 from vocode.streaming.models.telephony import (
+    BaseCallConfig,
     TwilioCallConfig,
     TwilioConfig,
     VonageCallConfig,
@@ -33,10 +35,14 @@ from vocode.streaming.models.telephony import (
 )
 
 from vocode.streaming.telephony.templater import Templater
+from vocode.streaming.telephony.worker_registry.base_worker_registry import (
+    TelephonyWorkerLoad,
+)
 from vocode.streaming.transcriber.base_transcriber import BaseTranscriber
 from vocode.streaming.transcriber.factory import TranscriberFactory
 from vocode.streaming.utils import create_conversation_id
 from vocode.streaming.utils.events_manager import EventsManager
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 
 
 class AbstractInboundCallConfig(BaseModel, abc.ABC):
@@ -67,28 +73,52 @@ class TelephonyServer:
         config_manager: BaseConfigManager,
         inbound_call_configs: List[AbstractInboundCallConfig] = [],
         transcriber_factory: TranscriberFactory = TranscriberFactory(),
-        agent_factory: AgentFactory = AgentFactory(),
-        synthesizer_factory: SynthesizerFactory = SynthesizerFactory(),
+        agent_factory: Optional[AgentFactory] = None,
+        synthesizer_factory: Optional[SynthesizerFactory] = None,
         events_manager: Optional[EventsManager] = None,
         logger: Optional[logging.Logger] = None,
+        http_resource_pool: Optional[HTTPResourcePool] = None,
+        worker: Optional[TelephonyWorker] = None,
     ):
         self.base_url = base_url
         self.logger = logger or logging.getLogger(__name__)
         self.router = APIRouter()
+        if http_resource_pool is None:
+            http_resource_pool = HTTPResourcePool(logger=self.logger)
+            # the server owns the pool it creates, so it closes it when the app shuts down
+            self.router.add_event_handler("shutdown", http_resource_pool.close)
+        self.http_resource_pool = http_resource_pool
+        # a default factory argument would be shared by every server, pool and all
+        if agent_factory is None:
+            agent_factory = AgentFactory()
+        if synthesizer_factory is None:
+            synthesizer_factory = SynthesizerFactory()
+        # factories that were given their own pool keep it
+        if agent_factory.http_resource_pool is None:
+            agent_factory.attach_http_resource_pool(self.http_resource_pool)
+        if synthesizer_factory.http_resource_pool is None:
+            synthesizer_factory.attach_http_resource_pool(self.http_resource_pool)
         self.config_manager = config_manager
         self.templater = Templater()
         self.events_manager = events_manager
-        self.router.include_router(
-            CallsRouter(
-                base_url=base_url,
-                config_manager=self.config_manager,
-                transcriber_factory=transcriber_factory,
-                agent_factory=agent_factory,
-                synthesizer_factory=synthesizer_factory,
-                events_manager=self.events_manager,
-                logger=self.logger,
-            ).get_router()
+        # when the server runs as several TelephonyWorker processes, calls are spread across them
+        self.worker = worker
+        self.calls_router = CallsRouter(
+            base_url=base_url,
+            config_manager=self.config_manager,
+            transcriber_factory=transcriber_factory,
+            agent_factory=agent_factory,
+            synthesizer_factory=synthesizer_factory,
+            events_manager=self.events_manager,
+            logger=self.logger,
+            worker=self.worker,
+            http_resource_pool=self.http_resource_pool,
         )
+        self.router.include_router(self.calls_router.get_router())
+        if self.worker is not None:
+            self.router.add_event_handler("startup", self.worker.start)
+            self.router.add_event_handler("shutdown", self.worker.stop)
+            self.router.add_api_route("/workers", self.workers, methods=["GET"])
         for config in inbound_call_configs:
             self.router.add_api_route(
                 config.url,
@@ -105,6 +135,27 @@ class TelephonyServer:
     def events(self, request: Request):
         return Response()
 
+    async def workers(self) -> List[TelephonyWorkerLoad]:
+        assert self.worker is not None
+        return await self.worker.get_loads()
+
+    async def assign_call(
+        self, conversation_id: str, call_config: BaseCallConfig
+    ) -> str:
+        """Saves the config of a new inbound call and returns the base url its websocket connects to
+
+        With workers, the call goes to the least loaded one and is only prewarmed if that's this one.
+        """
+        base_url = self.base_url
+        if self.worker is not None:
+            worker_load = await self.worker.choose_worker()
+            call_config.worker_id = worker_load.worker_id
+            base_url = worker_load.base_url
+        await self.config_manager.save_config(conversation_id, call_config)
+        if self.worker is None or call_config.worker_id == self.worker.worker_id:
+            self.calls_router.prewarm_call(conversation_id, call_config)
+        return base_url
+
     async def recordings(self, request: Request, conversation_id: str):
         recording_url = (await request.json())["recording_url"]
         if self.events_manager is not None and recording_url is not None:
@@ -134,9 +185,9 @@ class TelephonyServer:
             )
 
             conversation_id = create_conversation_id()
-            await self.config_manager.save_config(conversation_id, call_config)
+            base_url = await self.assign_call(conversation_id, call_config)
             return self.templater.get_connection_twiml(
-                base_url=self.base_url, call_id=conversation_id
+                base_url=base_url, call_id=conversation_id
             )
 
         async def vonage_route(
@@ -155,9 +206,9 @@ class TelephonyServer:
             )
             print("VONAGE UUID: ", vonage_answer_request.uuid)
             conversation_id = create_conversation_id()
-            await self.config_manager.save_config(conversation_id, call_config)
+            base_url = await self.assign_call(conversation_id, call_config)
             return VonageClient.create_call_ncco(
-                base_url=self.base_url, conversation_id=conversation_id, record=vonage_config.record
+                base_url=base_url, conversation_id=conversation_id, record=vonage_config.record
             )
 
         if isinstance(inbound_call_config, TwilioInboundCallConfig):
@@ -183,12 +234,16 @@ class TelephonyServer:
         telephony_client: BaseTelephonyClient
         if isinstance(call_config, TwilioCallConfig):
             telephony_client = TwilioClient(
-                base_url=self.base_url, twilio_config=call_config.twilio_config
+                base_url=self.base_url,
+                twilio_config=call_config.twilio_config,
+                aiohttp_session=self.http_resource_pool.get_aiohttp_session(),
             )
             await telephony_client.end_call(call_config.twilio_sid)
         elif isinstance(call_config, VonageCallConfig):
             telephony_client = VonageClient(
-                base_url=self.base_url, vonage_config=call_config.vonage_config
+                base_url=self.base_url,
+                vonage_config=call_config.vonage_config,
+                aiohttp_session=self.http_resource_pool.get_aiohttp_session(),
             )
             await telephony_client.end_call(call_config.vonage_uuid)
         return {"id": conversation_id}
@@ -1,6 +1,9 @@
-from typing import Optional
+import asyncio
+from typing import Dict, Optional
 import logging
 
+import aiohttp
+
 from fastapi import APIRouter, HTTPException, WebSocket
 from vocode.streaming.agent.factory import AgentFactory
 from vocode.streaming.models.telephony import (
@@ -9,6 +12,7 @@ from vocode.streaming.models.telephony import (
     VonageCallConfig,
 )
 from vocode.streaming.synthesizer.factory import SynthesizerFactory
+from vocode.streaming.telephony.constants import PREWARMED_CALL_TTL_SECONDS
 from vocode.streaming.telephony.config_manager.base_config_manager import (
     BaseConfigManager,
 )
@@ -16,9 +20,11 @@ from vocode.streaming.telephony.config_manager.base_config_manager import (
 from vocode.streaming.telephony.conversation.call import Call
 from vocode.streaming.telephony.conversation.twilio_call import TwilioCall
 from vocode.streaming.telephony.conversation.vonage_call import VonageCall
+from vocode.streaming.telephony.server.telephony_worker import TelephonyWorker
 from vocode.streaming.transcriber.factory import TranscriberFactory
 from vocode.streaming.utils.base_router import BaseRouter
 from vocode.streaming.utils.events_manager import EventsManager
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 
 
 class CallsRouter(BaseRouter):
@@ -31,6 +37,9 @@ class CallsRouter(BaseRouter):
         synthesizer_factory: SynthesizerFactory = SynthesizerFactory(),
         events_manager: Optional[EventsManager] = None,
         logger: Optional[logging.Logger] = None,
+        prewarmed_call_ttl_seconds: float = PREWARMED_CALL_TTL_SECONDS,
+        worker: Optional[TelephonyWorker] = None,
+        http_resource_pool: Optional[HTTPResourcePool] = None,
     ):
         super().__init__()
         self.base_url = base_url
@@ -40,6 +49,15 @@ class CallsRouter(BaseRouter):
         self.synthesizer_factory = synthesizer_factory
         self.events_manager = events_manager
         self.logger = logger or logging.getLogger(__name__)
+        self.prewarmed_call_ttl_seconds = prewarmed_call_ttl_seconds
+        self.http_resource_pool = http_resource_pool
+        self.prewarmed_calls: Dict[str, asyncio.Task] = {}
+        self.prewarmed_call_expiry_tasks: Dict[str, asyncio.Task] = {}
+        self.num_calls = 0
+        self.worker = worker
+        if self.worker is not None:
+            self.worker.get_num_calls = lambda: self.num_calls
+            self.worker.get_num_prewarmed_calls = lambda: len(self.prewarmed_calls)
         self.router = APIRouter()
         self.router.websocket("/connect_call/{id}")(self.connect_call)
 
@@ -54,6 +72,7 @@ class CallsRouter(BaseRouter):
         agent_factory: AgentFactory = AgentFactory(),
         synthesizer_factory: SynthesizerFactory = SynthesizerFactory(),
         events_manager: Optional[EventsManager] = None,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
         if isinstance(call_config, TwilioCallConfig):
             return TwilioCall(
@@ -72,6 +91,7 @@ class CallsRouter(BaseRouter):
                 agent_factory=agent_factory,
                 synthesizer_factory=synthesizer_factory,
                 events_manager=events_manager,
+                aiohttp_session=aiohttp_session,
             )
         elif isinstance(call_config, VonageCallConfig):
             return VonageCall(
@@ -95,26 +115,103 @@ class CallsRouter(BaseRouter):
         else:
             raise ValueError(f"Unknown call config type {call_config.type}")
 
-    async def connect_call(self, websocket: WebSocket, id: str):
-        await websocket.accept()
-        self.logger.debug("Phone WS connection opened for chat {}".format(id))
-        call_config = await self.config_manager.get_config(id)
-        if not call_config:
-            raise HTTPException(status_code=400, detail="No active phone call")
-
-        call = self._from_call_config(
+    def create_call(self, conversation_id: str, call_config: BaseCallConfig) -> Call:
+        return self._from_call_config(
             base_url=self.base_url,
             call_config=call_config,
             config_manager=self.config_manager,
-            conversation_id=id,
+            conversation_id=conversation_id,
             transcriber_factory=self.transcriber_factory,
             agent_factory=self.agent_factory,
             synthesizer_factory=self.synthesizer_factory,
             events_manager=self.events_manager,
             logger=self.logger,
+            # the Twilio REST requests of every call share keep-alive connections
+            aiohttp_session=self.http_resource_pool.get_aiohttp_session()
+            if self.http_resource_pool is not None
+            else None,
         )
 
-        await call.attach_ws_and_start(websocket)
+    def prewarm_call(self, conversation_id: str, call_config: BaseCallConfig):
+        """Builds the call and connects its upstream services before the media websocket arrives
+
+        Called once the call config is saved (i.e. while the TwiML/NCCO response is in flight),
+        so connect_call only needs to attach the websocket to the ready call.
+        """
+        if conversation_id in self.prewarmed_calls:
+            return
+        self.prewarmed_calls[conversation_id] = asyncio.create_task(
+            self.build_prewarmed_call(conversation_id, call_config)
+        )
+
+    async def build_prewarmed_call(
+        self, conversation_id: str, call_config: BaseCallConfig
+    ) -> Call:
+        call = self.create_call(conversation_id, call_config)
+        call.start_prewarm()
+        self.prewarmed_call_expiry_tasks[conversation_id] = asyncio.create_task(
+            self.expire_prewarmed_call(conversation_id, call)
+        )
+        return call
+
+    async def expire_prewarmed_call(self, conversation_id: str, call: Call):
+        await asyncio.sleep(self.prewarmed_call_ttl_seconds)
+        self.prewarmed_call_expiry_tasks.pop(conversation_id, None)
+        if self.prewarmed_calls.pop(conversation_id, None) is None:
+            return
+        self.logger.debug(
+            f"Media WS never connected for prewarmed call {conversation_id}, releasing it"
+        )
+        await call.terminate(publish_events=False)
+
+    async def get_prewarmed_call(self, conversation_id: str) -> Optional[Call]:
+        prewarmed_call_task = self.prewarmed_calls.pop(conversation_id, None)
+        if prewarmed_call_task is None:
+            return None
+        try:
+            call = await prewarmed_call_task
+        except Exception:
+            self.logger.exception("Failed to prewarm call, building it from scratch")
+            return None
+        # the websocket claimed the call, so it no longer expires
+        expiry_task = self.prewarmed_call_expiry_tasks.pop(conversation_id, None)
+        if expiry_task is not None:
+            expiry_task.cancel()
+        assert call.prewarm_task is not None
+        try:
+            await call.prewarm_task
+        except Exception:
+            self.logger.exception("Failed to prewarm call, building it from scratch")
+            await call.terminate(publish_events=False)
+            return None
+        return call
+
+    async def connect_call(self, websocket: WebSocket, id: str):
+        await websocket.accept()
+        self.logger.debug("Phone WS connection opened for chat {}".format(id))
+        call = await self.get_prewarmed_call(id)
+        if call is None:
+            call_config = await self.config_manager.get_config(id)
+            if not call_config:
+                raise HTTPException(status_code=400, detail="No active phone call")
+            if (
+                self.worker is not None
+                and call_config.worker_id != self.worker.worker_id
+            ):
+                # e.g. a proxy that doesn't route by worker, the call still works but
+                # lookups by owner need to find it here
+                self.logger.warning(
+                    f"Call {id} was assigned to worker {call_config.worker_id}, running it on {self.worker.worker_id}"
+                )
+                call_config.worker_id = self.worker.worker_id
+                await self.config_manager.save_config(id, call_config)
+            call = self.create_call(id, call_config)
+
+        self.num_calls += 1
+        try:
+            await call.attach_ws_and_start(websocket)
+        finally:
+            self.num_calls -= 1
         self.logger.debug("Phone WS connection closed for chat {}".format(id))
 
     def get_router(self) -> APIRouter:
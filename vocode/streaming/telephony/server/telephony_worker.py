@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vocode.streaming.telephony.constants import (
+    TELEPHONY_WORKER_LOAD_REPORT_INTERVAL_SECONDS,
+    TELEPHONY_WORKER_LOAD_TTL_SECONDS,
+)
+from vocode.streaming.telephony.worker_registry.base_worker_registry import (
+    BaseWorkerRegistry,
+    TelephonyWorkerLoad,
+)
+
+WORKER_ID_ENV_VAR = "VOCODE_TELEPHONY_WORKER_ID"
+WORKER_BASE_URL_ENV_VAR = "VOCODE_TELEPHONY_WORKER_BASE_URL"
+
+
+class TelephonyWorker:
+    """One of several processes serving calls for the same TelephonyServer app
+
+    Each worker listens on its own port and is reachable at its own base_url (e.g. a path prefix
+    that a reverse proxy maps to that port), and the workers share a config manager and a worker
+    registry, e.g. both Redis. The worker that handles an inbound call webhook picks the least
+    loaded worker from the registry, saves it as the call's owner in the call config and points
+    the media websocket at the owner's base_url, so the call runs entirely in that process.
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        base_url: str,
+        registry: BaseWorkerRegistry,
+        load_report_interval_seconds: float = TELEPHONY_WORKER_LOAD_REPORT_INTERVAL_SECONDS,
+        load_ttl_seconds: float = TELEPHONY_WORKER_LOAD_TTL_SECONDS,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.worker_id = worker_id
+        self.base_url = base_url
+        self.registry = registry
+        self.load_report_interval_seconds = load_report_interval_seconds
+        self.load_ttl_seconds = load_ttl_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self.get_num_calls: Callable[[], int] = lambda: 0
+        self.get_num_prewarmed_calls: Callable[[], int] = lambda: 0
+        self.event_loop_lag_seconds = 0.0
+        # calls sent to other workers since their last report, which their load doesn't show yet
+        self.num_calls_routed: Dict[Tuple[str, float], int] = {}
+        self.report_load_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(
+        cls, registry: BaseWorkerRegistry, logger: Optional[logging.Logger] = None
+    ) -> Optional["TelephonyWorker"]:
+        """The worker started by run_telephony_workers, or None if not running as one"""
+        worker_id = os.environ.get(WORKER_ID_ENV_VAR)
+        base_url = os.environ.get(WORKER_BASE_URL_ENV_VAR)
+        if worker_id is None or base_url is None:
+            return None
+        return cls(worker_id, base_url, registry, logger=logger)
+
+    def get_load(self) -> TelephonyWorkerLoad:
+        return TelephonyWorkerLoad(
+            worker_id=self.worker_id,
+            base_url=self.base_url,
+            pid=os.getpid(),
+            num_calls=self.get_num_calls(),
+            num_prewarmed_calls=self.get_num_prewarmed_calls(),
+            event_loop_lag_seconds=self.event_loop_lag_seconds,
+            reported_at=time.time(),
+        )
+
+    async def get_loads(self) -> List[TelephonyWorkerLoad]:
+        """Every live worker's load, with this worker's up to date"""
+        loads = [
+            load
+            for load in await self.registry.get_loads()
+            if load.worker_id != self.worker_id
+        ]
+        return [self.get_load()] + loads
+
+    async def choose_worker(self) -> TelephonyWorkerLoad:
+        """Assigns a new call to the worker with the fewest calls, this one if it's tied"""
+        loads = await self.get_loads()
+        self.num_calls_routed = {
+            key: num_calls
+            for key, num_calls in self.num_calls_routed.items()
+            if key in {(load.worker_id, load.reported_at) for load in loads}
+        }
+        chosen_load = min(
+            loads,
+            key=lambda load: load.get_num_calls_assigned()
+            + self.num_calls_routed.get((load.worker_id, load.reported_at), 0),
+        )
+        if chosen_load.worker_id != self.worker_id:
+            key = (chosen_load.worker_id, chosen_load.reported_at)
+            self.num_calls_routed[key] = self.num_calls_routed.get(key, 0) + 1
+        return chosen_load
+
+    async def report_load(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await self.registry.report_load(self.get_load(), self.load_ttl_seconds)
+            except Exception:
+                self.logger.exception("Failed to report worker load")
+            start = loop.time()
+            await asyncio.sleep(self.load_report_interval_seconds)
+            # how late the loop was to wake us: a worker busy with CPU bound work lags
+            self.event_loop_lag_seconds = max(
+                loop.time() - start - self.load_report_interval_seconds, 0
+            )
+
+    async def start(self):
+        self.logger.info(f"Starting telephony worker {self.worker_id} at {self.base_url}")
+        self.report_load_task = asyncio.create_task(self.report_load())
+
+    async def stop(self):
+        if self.report_load_task is not None:
+            self.report_load_task.cancel()
+        await self.registry.remove_worker(self.worker_id)
+
+
+def _run_worker(app: str, host: str, port: int, env: Dict[str, str]):
+    import uvicorn
+
+    os.environ.update(env)
+    uvicorn.run(app, host=host, port=port)
+
+
+def run_telephony_workers(
+    app: str,
+    num_workers: int = os.cpu_count() or 1,
+    host: str = "0.0.0.0",
+    base_port: int = 3000,
+    base_url_template: str = "localhost:{port}",
+):
+    """Runs num_workers processes serving app (e.g. "main:app"), worker i on base_port + i
+
+    base_url_template is formatted with each worker's index and port to get its base_url, e.g.
+    "calls.example.com/worker/{index}" with a proxy routing /worker/{index}/ to the port. The app
+    builds its TelephonyWorker with TelephonyWorker.from_env and passes it to TelephonyServer.
+    """
+    hostname = socket.gethostname()
+    processes = []
+    for index in range(num_workers):
+        port = base_port + index
+        env = {
+            WORKER_ID_ENV_VAR: f"{hostname}-{index}",
+            WORKER_BASE_URL_ENV_VAR: base_url_template.format(index=index, port=port),
+        }
+        process = multiprocessing.get_context("spawn").Process(
+            target=_run_worker, args=(app, host, port, env)
+        )
+        process.start()
+        processes.append(process)
+    for process in processes:
+        process.join()
@@ -0,0 +1,29 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class TelephonyWorkerLoad(BaseModel):
+    worker_id: str
+    # where the worker's call websockets can be reached, see TelephonyWorker
+    base_url: str
+    pid: int
+    num_calls: int
+    num_prewarmed_calls: int
+    event_loop_lag_seconds: float
+    reported_at: float
+
+    def get_num_calls_assigned(self) -> int:
+        return self.num_calls + self.num_prewarmed_calls
+
+
+class BaseWorkerRegistry:
+    async def report_load(self, load: TelephonyWorkerLoad, ttl_seconds: float):
+        """Records the worker's load, which is forgotten if it isn't reported again in ttl_seconds"""
+        raise NotImplementedError
+
+    async def get_loads(self) -> List[TelephonyWorkerLoad]:
+        raise NotImplementedError
+
+    async def remove_worker(self, worker_id: str):
+        raise NotImplementedError
@@ -0,0 +1,24 @@
+import time
+from typing import Dict, List, Tuple
+
+from vocode.streaming.telephony.worker_registry.base_worker_registry import (
+    BaseWorkerRegistry,
+    TelephonyWorkerLoad,
+)
+
+
+class InMemoryWorkerRegistry(BaseWorkerRegistry):
+    """Only sees workers in the same process, for tests and single process servers"""
+
+    def __init__(self):
+        self.loads: Dict[str, Tuple[TelephonyWorkerLoad, float]] = {}
+
+    async def report_load(self, load: TelephonyWorkerLoad, ttl_seconds: float):
+        self.loads[load.worker_id] = (load, time.time() + ttl_seconds)
+
+    async def get_loads(self) -> List[TelephonyWorkerLoad]:
+        now = time.time()
+        return [load for load, expires_at in self.loads.values() if expires_at > now]
+
+    async def remove_worker(self, worker_id: str):
+        self.loads.pop(worker_id, None)
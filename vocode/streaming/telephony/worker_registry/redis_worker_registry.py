@@ -0,0 +1,51 @@
+import logging
+import math
+import os
+from typing import List, Optional
+
+from redis.asyncio import Redis
+
+from vocode.streaming.telephony.worker_registry.base_worker_registry import (
+    BaseWorkerRegistry,
+    TelephonyWorkerLoad,
+)
+
+WORKER_LOAD_KEY_PREFIX = "telephony_worker_load:"
+
+
+class RedisWorkerRegistry(BaseWorkerRegistry):
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.redis: Redis = Redis(
+            host=os.environ.get("REDISHOST", "localhost"),
+            port=int(os.environ.get("REDISPORT", 6379)),
+            username=os.environ.get("REDISUSER", None),
+            password=os.environ.get("REDISPASSWORD", None),
+            db=0,
+            decode_responses=True,
+        )
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def report_load(self, load: TelephonyWorkerLoad, ttl_seconds: float):
+        await self.redis.set(
+            f"{WORKER_LOAD_KEY_PREFIX}{load.worker_id}",
+            load.json(),
+            ex=math.ceil(ttl_seconds),
+        )
+
+    async def get_loads(self) -> List[TelephonyWorkerLoad]:
+        keys = [
+            key
+            async for key in self.redis.scan_iter(match=f"{WORKER_LOAD_KEY_PREFIX}*")
+        ]
+        if not keys:
+            return []
+        # keys can expire between the scan and the get
+        return [
+            TelephonyWorkerLoad.parse_raw(raw_load)
+            for raw_load in await self.redis.mget(keys)
+            if raw_load
+        ]
+
+    async def remove_worker(self, worker_id: str):
+        self.logger.debug(f"Removing worker {worker_id}")
+        await self.redis.delete(f"{WORKER_LOAD_KEY_PREFIX}{worker_id}")
@@ -159,7 +159,7 @@ class AssemblyAITranscriber(BaseAsyncTranscriber[AssemblyAITranscriberConfig]):
                         max_latency_hist.record(cur_max_latency)
                         min_latency_hist.record(max(cur_min_latency, 0))
 
-                        self.output_queue.put_nowait(
+                        await self.output_queue.put(
                             Transcription(
                                 message=data["text"],
                                 confidence=data["confidence"],
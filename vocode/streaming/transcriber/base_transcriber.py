@@ -7,7 +7,12 @@ from typing import Generic, TypeVar, Union
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.models.model import BaseModel
 
+from vocode.streaming.constants import (
+    TRANSCRIBER_AUDIO_QUEUE_MAX_SIZE,
+    TRANSCRIPTION_QUEUE_MAX_SIZE,
+)
 from vocode.streaming.models.transcriber import TranscriberConfig
+from vocode.streaming.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy
 from vocode.streaming.utils.worker import AsyncWorker, ThreadAsyncWorker
 
 
@@ -27,6 +32,18 @@ class Transcription(BaseModel):
 TranscriberConfigType = TypeVar("TranscriberConfigType", bound=TranscriberConfig)
 
 
+def create_audio_queue(maxsize: int) -> BoundedQueue[bytes]:
+    # audio that can't be transcribed in time is stale, drop it rather than grow
+    return BoundedQueue(
+        maxsize, QueueOverflowPolicy.DROP_OLDEST, name="transcriber_audio"
+    )
+
+
+def create_transcription_queue(maxsize: int) -> BoundedQueue[Transcription]:
+    # transcribers await put(), so they wait for the conversation to catch up
+    return BoundedQueue(maxsize, QueueOverflowPolicy.BLOCK, name="transcriptions")
+
+
 class AbstractTranscriber(Generic[TranscriberConfigType]):
     def __init__(self, transcriber_config: TranscriberConfigType):
         self.transcriber_config = transcriber_config
@@ -56,9 +73,15 @@ class BaseAsyncTranscriber(AbstractTranscriber[TranscriberConfigType], AsyncWork
     def __init__(
         self,
         transcriber_config: TranscriberConfigType,
+        max_audio_queue_size: int = TRANSCRIBER_AUDIO_QUEUE_MAX_SIZE,
+        max_transcription_queue_size: int = TRANSCRIPTION_QUEUE_MAX_SIZE,
     ):
-        self.input_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self.output_queue: asyncio.Queue[Transcription] = asyncio.Queue()
+        self.input_queue: asyncio.Queue[bytes] = create_audio_queue(
+            max_audio_queue_size
+        )
+        self.output_queue: asyncio.Queue[Transcription] = create_transcription_queue(
+            max_transcription_queue_size
+        )
         AsyncWorker.__init__(self, self.input_queue, self.output_queue)
         AbstractTranscriber.__init__(self, transcriber_config)
 
@@ -81,9 +104,15 @@ class BaseThreadAsyncTranscriber(
     def __init__(
         self,
         transcriber_config: TranscriberConfigType,
+        max_audio_queue_size: int = TRANSCRIBER_AUDIO_QUEUE_MAX_SIZE,
+        max_transcription_queue_size: int = TRANSCRIPTION_QUEUE_MAX_SIZE,
     ):
-        self.input_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self.output_queue: asyncio.Queue[Transcription] = asyncio.Queue()
+        self.input_queue: asyncio.Queue[bytes] = create_audio_queue(
+            max_audio_queue_size
+        )
+        self.output_queue: asyncio.Queue[Transcription] = create_transcription_queue(
+            max_transcription_queue_size
+        )
         ThreadAsyncWorker.__init__(self, self.input_queue, self.output_queue)
         AbstractTranscriber.__init__(self, transcriber_config)
 
@@ -4,7 +4,6 @@ import logging
 from typing import Optional
 import websockets
 from websockets.client import WebSocketClientProtocol
-import audioop
 from urllib.parse import urlencode
 from vocode import getenv
 
@@ -21,6 +20,7 @@ from vocode.streaming.models.transcriber import (
     TimeEndpointingConfig,
 )
 from vocode.streaming.models.audio_encoding import AudioEncoding
+from vocode.streaming.utils.audio_converter import StreamingAudioConverter
 from vocode.streaming.utils.deepgram_keyword_encoder import urlencode_keywords
 
 PUNCTUATION_TERMINATORS = [".", "!", "?"]
@@ -62,6 +62,16 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
         self.is_ready = False
         self.logger = logger or logging.getLogger(__name__)
         self.audio_cursor = 0.0
+        self.downsampler: Optional[StreamingAudioConverter] = None
+        if (
+            self.transcriber_config.downsampling
+            and self.transcriber_config.audio_encoding == AudioEncoding.LINEAR16
+        ):
+            self.downsampler = StreamingAudioConverter(
+                input_sampling_rate=self.transcriber_config.sampling_rate
+                * self.transcriber_config.downsampling,
+                output_sampling_rate=self.transcriber_config.sampling_rate,
+            )
 
     async def _run_loop(self):
         restarts = 0
@@ -73,19 +83,8 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
             )
 
     def send_audio(self, chunk):
-        if (
-            self.transcriber_config.downsampling
-            and self.transcriber_config.audio_encoding == AudioEncoding.LINEAR16
-        ):
-            chunk, _ = audioop.ratecv(
-                chunk,
-                2,
-                1,
-                self.transcriber_config.sampling_rate
-                * self.transcriber_config.downsampling,
-                self.transcriber_config.sampling_rate,
-                None,
-            )
+        if self.downsampler is not None:
+            chunk = self.downsampler.convert(chunk)
         super().send_audio(chunk)
 
     def terminate(self):
@@ -174,6 +173,8 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
 
     async def process(self):
         self.audio_cursor = 0.0
+        if self.downsampler is not None:
+            self.downsampler.reset()
         extra_headers = {"Authorization": f"Token {self.api_key}"}
 
         async with websockets.connect(
@@ -243,7 +244,7 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                         num_buffer_utterances += 1
 
                     if speech_final:
-                        self.output_queue.put_nowait(
+                        await self.output_queue.put(
                             Transcription(
                                 message=buffer,
                                 confidence=buffer_avg_confidence,
@@ -255,7 +256,7 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                         num_buffer_utterances = 1
                         time_silent = 0
                     elif top_choice["transcript"] and confidence > 0.0:
-                        self.output_queue.put_nowait(
+                        await self.output_queue.put(
                             Transcription(
                                 message=buffer,
                                 confidence=confidence,
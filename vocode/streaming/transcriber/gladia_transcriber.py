@@ -111,7 +111,7 @@ class GladiaTranscriber(BaseAsyncTranscriber[GladiaTranscriberConfig]):
                         is_final = data["type"] == "final"
 
                         if "transcription" in data and data["transcription"]:
-                            self.output_queue.put_nowait(
+                            await self.output_queue.put(
                                 Transcription(
                                     message=data["transcription"],
                                     confidence=data["confidence"],
@@ -123,14 +123,14 @@ class RevAITranscriber(BaseAsyncTranscriber[RevAITranscriberConfig]):
 
                     confidence = 1.0
                     if is_done:
-                        self.output_queue.put_nowait(
+                        await self.output_queue.put(
                             Transcription(
                                 message=buffer, confidence=confidence, is_final=True
                             )
                         )
                         buffer = ""
                     else:
-                        self.output_queue.put_nowait(
+                        await self.output_queue.put(
                             Transcription(
                                 message=buffer,
                                 confidence=confidence,
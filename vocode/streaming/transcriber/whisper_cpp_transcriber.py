@@ -80,7 +80,7 @@ class WhisperCPPTranscriber(BaseThreadAsyncTranscriber[WhisperCPPTranscriberConf
                     message_buffer.endswith(ending) for ending in SENTENCE_ENDINGS
                 )
                 in_memory_wav, audio_buffer = self.create_new_buffer()
-                self.output_queue.put_nowait(
+                self.output_janus_queue.sync_q.put_nowait(
                     Transcription(
                         message=message_buffer, confidence=confidence, is_final=is_final
                     )
@@ -61,6 +61,14 @@ def get_chunk_size_per_second(audio_encoding: AudioEncoding, sampling_rate: int)
         raise Exception("Unsupported audio encoding")
 
 
+def get_chunk_size(
+    audio_encoding: AudioEncoding, sampling_rate: int, seconds: float
+) -> int:
+    """The size in bytes of seconds of audio, to a whole number of samples"""
+    num_samples = max(int(sampling_rate * seconds), 1)
+    return get_chunk_size_per_second(audio_encoding, num_samples)
+
+
 def create_conversation_id() -> str:
     return secrets.token_urlsafe(16)
 
@@ -0,0 +1,65 @@
+import audioop
+from typing import Any, Optional
+
+from vocode.streaming.models.audio_encoding import AudioEncoding
+
+
+class StreamingAudioConverter:
+    """Converts one stream of audio chunks between encodings and sampling rates
+
+    Resampling a stream chunk by chunk with a fresh audioop.ratecv state each time restarts the
+    filter at every chunk boundary, which clicks and drifts. This keeps the ratecv state (and
+    any odd trailing byte of a LINEAR16 chunk) across calls, so converting a stream in chunks
+    gives exactly the same audio as converting it in one go. Use one converter per stream.
+    """
+
+    def __init__(
+        self,
+        input_sampling_rate: int,
+        output_sampling_rate: int,
+        input_encoding: AudioEncoding = AudioEncoding.LINEAR16,
+        output_encoding: AudioEncoding = AudioEncoding.LINEAR16,
+    ):
+        self.input_sampling_rate = input_sampling_rate
+        self.output_sampling_rate = output_sampling_rate
+        self.input_encoding = input_encoding
+        self.output_encoding = output_encoding
+        self.ratecv_state: Optional[Any] = None
+        self.remainder = b""
+
+    def is_passthrough(self) -> bool:
+        return (
+            self.input_sampling_rate == self.output_sampling_rate
+            and self.input_encoding == self.output_encoding
+        )
+
+    def convert(self, chunk: bytes) -> bytes:
+        if self.is_passthrough():
+            return chunk
+        if self.input_encoding == AudioEncoding.MULAW:
+            linear_audio = audioop.ulaw2lin(chunk, 2)
+        else:
+            if self.remainder:
+                chunk = self.remainder + chunk
+            if len(chunk) % 2:
+                chunk, self.remainder = chunk[:-1], chunk[-1:]
+            else:
+                self.remainder = b""
+            linear_audio = chunk
+        if self.input_sampling_rate != self.output_sampling_rate:
+            linear_audio, self.ratecv_state = audioop.ratecv(
+                linear_audio,
+                2,
+                1,
+                self.input_sampling_rate,
+                self.output_sampling_rate,
+                self.ratecv_state,
+            )
+        if self.output_encoding == AudioEncoding.MULAW:
+            return audioop.lin2ulaw(linear_audio, 2)
+        return linear_audio
+
+    def reset(self):
+        """Starts a new stream, e.g. a new utterance"""
+        self.ratecv_state = None
+        self.remainder = b""
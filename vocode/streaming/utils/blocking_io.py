@@ -0,0 +1,72 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Callable, Optional, TypeVar, Union
+
+from vocode.streaming.constants import (
+    BLOCKING_IO_MAX_WORKERS,
+    BLOCKING_STREAM_PREFETCH_CHUNKS,
+)
+
+ResultType = TypeVar("ResultType")
+
+_blocking_io_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_blocking_io_executor() -> ThreadPoolExecutor:
+    """The process-wide executor for blocking SDK calls, which caps the threads they use
+
+    Shared rather than one per synthesizer, so a conversation with a slow stream doesn't take
+    a thread of its own, and a burst of calls can't spawn an unbounded number of threads.
+    """
+    global _blocking_io_executor
+    if _blocking_io_executor is None:
+        _blocking_io_executor = ThreadPoolExecutor(
+            max_workers=BLOCKING_IO_MAX_WORKERS, thread_name_prefix="blocking_io"
+        )
+    return _blocking_io_executor
+
+
+async def run_blocking(func: Callable[..., ResultType], *args) -> ResultType:
+    return await asyncio.get_running_loop().run_in_executor(
+        get_blocking_io_executor(), functools.partial(func, *args)
+    )
+
+
+async def iterate_blocking_reads(
+    read: Callable[[], bytes],
+    chunk_size: int,
+    prefetch_chunks: int = BLOCKING_STREAM_PREFETCH_CHUNKS,
+) -> AsyncGenerator[bytes, None]:
+    """Yields the chunks returned by a blocking read, which is only ever called off the loop
+
+    read is called with no two calls overlapping, and the stream ends after a read returns
+    fewer than chunk_size bytes (that last chunk is still yielded). Up to prefetch_chunks are
+    read ahead of the consumer, so the consumer doesn't wait for each read in turn.
+    """
+    # a read's exception is passed on in place of its chunk
+    chunks: asyncio.Queue[Union[bytes, Exception]] = asyncio.Queue(
+        maxsize=prefetch_chunks
+    )
+
+    async def read_chunks():
+        try:
+            while True:
+                chunk = await run_blocking(read)
+                await chunks.put(chunk)
+                if len(chunk) < chunk_size:
+                    return
+        except Exception as e:
+            await chunks.put(e)
+
+    read_task = asyncio.create_task(read_chunks())
+    try:
+        while True:
+            chunk = await chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+    finally:
+        read_task.cancel()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+from enum import Enum
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+QueueItemType = TypeVar("QueueItemType")
+
+
+class QueueOverflowPolicy(str, Enum):
+    # put() waits for room, put_nowait() raises asyncio.QueueFull: for control messages that
+    # can't be lost, producers that can wait get backpressure
+    BLOCK = "block"
+    # the oldest item is dropped to make room: for audio, where late is as bad as lost
+    DROP_OLDEST = "drop_oldest"
+
+
+class QueueMetrics(BaseModel):
+    name: str
+    depth: int
+    max_depth: int
+    maxsize: int
+    num_dropped: int
+    num_blocked_puts: int
+
+
+class BoundedQueue(asyncio.Queue, Generic[QueueItemType]):
+    """asyncio.Queue with an overflow policy for when maxsize is reached, and depth metrics
+
+    maxsize=0 is unbounded, like asyncio.Queue, which still reports metrics. With DROP_OLDEST
+    and is_droppable, only the items is_droppable is True for count toward maxsize and are
+    dropped; the others (e.g. control messages queued between audio) are always kept, in order.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        name: str = "queue",
+        is_droppable: Optional[Callable[[QueueItemType], bool]] = None,
+    ):
+        assert is_droppable is None or overflow_policy == QueueOverflowPolicy.DROP_OLDEST
+        self.is_droppable = is_droppable
+        self.num_droppable = 0
+        # the bound is enforced here rather than by asyncio.Queue when it only counts some items
+        super().__init__(0 if is_droppable else maxsize)
+        self.bound = maxsize
+        self.overflow_policy = overflow_policy
+        self.name = name
+        self.max_depth = 0
+        self.num_dropped = 0
+        self.num_blocked_puts = 0
+
+    def _put(self, item: QueueItemType):
+        super()._put(item)
+        if self.is_droppable is not None and self.is_droppable(item):
+            self.num_droppable += 1
+
+    def _get(self) -> QueueItemType:
+        item = super()._get()
+        if self.is_droppable is not None and self.is_droppable(item):
+            self.num_droppable -= 1
+        return item
+
+    def drop_oldest(self):
+        if self.is_droppable is None:
+            self.get_nowait()
+        else:
+            for i, item in enumerate(self._queue):  # type: ignore[attr-defined]
+                if self.is_droppable(item):
+                    del self._queue[i]  # type: ignore[attr-defined]
+                    self.num_droppable -= 1
+                    break
+        self.task_done()
+        self.num_dropped += 1
+
+    def put_nowait(self, item: QueueItemType):
+        if self.overflow_policy == QueueOverflowPolicy.DROP_OLDEST:
+            if self.is_droppable is None:
+                if self.full():
+                    self.drop_oldest()
+            elif (
+                0 < self.bound <= self.num_droppable and self.is_droppable(item)
+            ):
+                self.drop_oldest()
+        super().put_nowait(item)
+        depth = self.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    async def put(self, item: QueueItemType):
+        if self.full():
+            if self.overflow_policy == QueueOverflowPolicy.DROP_OLDEST:
+                return self.put_nowait(item)
+            self.num_blocked_puts += 1
+        return await super().put(item)
+
+    def get_metrics(self) -> QueueMetrics:
+        return QueueMetrics(
+            name=self.name,
+            depth=self.qsize(),
+            max_depth=self.max_depth,
+            maxsize=self.bound,
+            num_dropped=self.num_dropped,
+            num_blocked_puts=self.num_blocked_puts,
+        )
+
+
+def get_queue_metrics(queues: List[Optional[asyncio.Queue]]) -> List[QueueMetrics]:
+    return [queue.get_metrics() for queue in queues if isinstance(queue, BoundedQueue)]
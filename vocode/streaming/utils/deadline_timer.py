@@ -0,0 +1,53 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class DeadlineTimer:
+    """Calls back once a deadline has passed, where the deadline can keep moving
+
+    Deadlines are registered with the event loop's timer heap, which every conversation in the
+    process shares, so a conversation waiting on one costs no wakeups until it's due. Moving the
+    deadline (e.g. on every chunk of audio sent) is just a write of whatever get_deadline reads:
+    when the timer fires before the new deadline, it re-arms itself for it.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        get_deadline: Callable[[], Optional[float]],
+    ):
+        self.callback = callback
+        # a time.time() timestamp, or None to stop
+        self.get_deadline = get_deadline
+        self.timer_handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        self.cancel()
+        self.arm()
+
+    def arm(self):
+        deadline = self.get_deadline()
+        if deadline is None:
+            return
+        self.timer_handle = asyncio.get_running_loop().call_later(
+            max(deadline - time.time(), 0), self.fire
+        )
+
+    def fire(self):
+        self.timer_handle = None
+        deadline = self.get_deadline()
+        if deadline is None:
+            return
+        if deadline > time.time():
+            self.arm()
+            return
+        self.callback()
+
+    def is_armed(self) -> bool:
+        return self.timer_handle is not None
+
+    def cancel(self):
+        if self.timer_handle is not None:
+            self.timer_handle.cancel()
+            self.timer_handle = None
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+from typing import List, Optional
 
 from vocode.streaming.models.events import Event, EventType
 
 
 class EventsManager:
-    def __init__(self, subscriptions: List[EventType] = []):
+    def __init__(self, subscriptions: Optional[List[EventType]] = None):
         self.queue: asyncio.Queue[Event] = asyncio.Queue()
-        self.subscriptions = set(subscriptions)
+        self.subscriptions = set(subscriptions or [])
         self.active = False
 
     def publish_event(self, event: Event):
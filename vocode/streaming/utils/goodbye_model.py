@@ -1,11 +1,13 @@
 import os
 import asyncio
-from typing import Optional
+import re
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 from openai import AsyncOpenAI
 
 
 import numpy as np
-import requests
 
 from vocode import getenv
 
@@ -21,6 +23,88 @@ GOODBYE_PHRASES = [
     "have a good day",
     "have a good night",
 ]
+# the local model only matches similar wording, so it's given more of it
+LOCAL_GOODBYE_PHRASES = GOODBYE_PHRASES + [
+    "see you soon",
+    "see you tomorrow",
+    "see you next week",
+    "see you then",
+    "see you around",
+    "see ya",
+    "see ya later",
+    "catch you later",
+    "talk soon",
+    "talk to you tomorrow",
+    "talk to you next week",
+    "take care",
+    "take it easy",
+    "cheers",
+    "good night",
+    "have a nice day",
+    "have a great day",
+    "have a wonderful day",
+    "have a lovely day",
+    "have a good one",
+    "have a good afternoon",
+    "have a good evening",
+    "have a lovely evening",
+    "have a good weekend",
+    "have a nice weekend",
+    "enjoy your day",
+    "enjoy the rest of your day",
+]
+LOCAL_SIMILARITY_THRESHOLD = 0.8
+LOCAL_EMBEDDING_SIZE = 1024
+LOCAL_EMBEDDING_NGRAM_SIZES = (2, 3, 4)
+UTTERANCE_EMBEDDINGS_CACHE_SIZE = 1024
+WORD_PATTERN = re.compile(r"[a-z']+")
+CLAUSE_PATTERN = re.compile(r"[^,.!?;:]+[,.!?;:]*")
+
+
+def get_statement_clauses(text: str) -> List[str]:
+    """Splits text at punctuation, leaving out questions"""
+    clauses = [clause.strip() for clause in CLAUSE_PATTERN.findall(text)]
+    return [
+        clause
+        for clause in clauses
+        if clause.strip(",.!?;: ") and not clause.endswith("?")
+    ]
+
+
+class LocalEmbeddingModel:
+    """Embeds text as hashed counts of its words and character n-grams
+
+    Runs on CPU in well under a millisecond per utterance, with no model download or network
+    call, so it can be used offline. Texts with similar wording get similar embeddings.
+    """
+
+    def __init__(
+        self,
+        embedding_size: int = LOCAL_EMBEDDING_SIZE,
+        ngram_sizes=LOCAL_EMBEDDING_NGRAM_SIZES,
+    ):
+        self.embedding_size = embedding_size
+        self.ngram_sizes = ngram_sizes
+
+    def get_feature_indices(self, text: str) -> List[int]:
+        words = WORD_PATTERN.findall(text.lower())
+        padded_text = f" {' '.join(words)} "
+        features = [f"w:{word}" for word in words]
+        for n in self.ngram_sizes:
+            features.extend(
+                padded_text[i : i + n] for i in range(len(padded_text) - n + 1)
+            )
+        # crc32 rather than hash(), which changes between processes
+        return [
+            zlib.crc32(feature.encode()) % self.embedding_size for feature in features
+        ]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self.embedding_size))
+        for i, text in enumerate(texts):
+            np.add.at(embeddings[i], self.get_feature_indices(text), 1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
 
 
 class GoodbyeModel:
@@ -30,14 +114,36 @@ class GoodbyeModel:
             os.path.dirname(__file__), "goodbye_embeddings"
         ),
         openai_api_key: Optional[str] = None,
+        use_local_model: bool = False,
+        utterance_embeddings_cache_size: int = UTTERANCE_EMBEDDINGS_CACHE_SIZE,
     ):
-        if not openai_api_key or getenv("OPENAI_API_KEY"):
-            raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
-        self.aclient = AsyncOpenAI(api_key=openai_api_key or getenv("OPENAI_API_KEY"))
+        self.aclient: Optional[AsyncOpenAI] = None
+        self.local_embedding_model: Optional[LocalEmbeddingModel] = None
+        if use_local_model:
+            self.local_embedding_model = LocalEmbeddingModel()
+            self.similarity_threshold = LOCAL_SIMILARITY_THRESHOLD
+        else:
+            openai_api_key = openai_api_key or getenv("OPENAI_API_KEY")
+            if not openai_api_key:
+                raise ValueError(
+                    "OPENAI_API_KEY must be set in environment or passed in"
+                )
+            self.aclient = AsyncOpenAI(api_key=openai_api_key)
+            self.similarity_threshold = SIMILARITY_THRESHOLD
         self.embeddings_cache_path = embeddings_cache_path
         self.goodbye_embeddings: Optional[np.ndarray] = None
+        if self.local_embedding_model is not None:
+            # cheap enough to be ready before the first utterance
+            self.goodbye_embeddings = self.local_embedding_model.embed(
+                LOCAL_GOODBYE_PHRASES
+            ).T
+        # recent utterances and their embeddings, least recently used first
+        self.utterance_embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.utterance_embeddings_cache_size = utterance_embeddings_cache_size
 
     async def initialize_embeddings(self):
+        if self.goodbye_embeddings is not None:
+            return
         self.goodbye_embeddings = await self.load_or_create_embeddings(
             f"{self.embeddings_cache_path}/goodbye_embeddings.npy"
         )
@@ -47,28 +153,53 @@ class GoodbyeModel:
             return np.load(path)
         else:
             embeddings = await self.create_embeddings()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
             np.save(path, embeddings)
             return embeddings
 
     async def create_embeddings(self):
         print("Creating embeddings...")
-        size = EMBEDDING_SIZE
-        embeddings = np.empty((size, len(GOODBYE_PHRASES)))
-        for i, goodbye_phrase in enumerate(GOODBYE_PHRASES):
-            embeddings[:, i] = await self.create_embedding(goodbye_phrase)
-        return embeddings
+        return np.stack(await self.create_embedding_batch(GOODBYE_PHRASES), axis=1)
 
     async def is_goodbye(self, text: str) -> bool:
         assert self.goodbye_embeddings is not None, "Embeddings not initialized"
-        if "bye" in text.lower():
+        text = text.strip().lower()
+        if "bye" in text:
             return True
-        embedding = await self.create_embedding(text.strip().lower())
-        similarity_results = embedding @ self.goodbye_embeddings
-        return np.max(similarity_results) > SIMILARITY_THRESHOLD
+        if self.local_embedding_model is not None:
+            # a goodbye is usually one clause among thanks and pleasantries, which would
+            # water down the whole utterance's wording, and a question isn't a goodbye
+            texts = get_statement_clauses(text)
+        else:
+            texts = [text]
+        for utterance in texts:
+            embedding = await self.get_utterance_embedding(utterance)
+            similarity_results = embedding @ self.goodbye_embeddings
+            if np.max(similarity_results) > self.similarity_threshold:
+                return True
+        return False
+
+    async def get_utterance_embedding(self, text: str) -> np.ndarray:
+        embedding = self.utterance_embeddings.get(text)
+        if embedding is not None:
+            self.utterance_embeddings.move_to_end(text)
+            return embedding
+        if self.local_embedding_model is not None:
+            embedding = self.local_embedding_model.embed([text])[0]
+        else:
+            embedding = await self.create_embedding(text)
+        self.utterance_embeddings[text] = embedding
+        if len(self.utterance_embeddings) > self.utterance_embeddings_cache_size:
+            self.utterance_embeddings.popitem(last=False)
+        return embedding
 
     async def create_embedding(self, text) -> np.ndarray:
-        params = {
-            "input": text,
+        return (await self.create_embedding_batch([text]))[0]
+
+    async def create_embedding_batch(self, texts: List[str]) -> List[np.ndarray]:
+        assert self.aclient is not None
+        params: Dict[str, Any] = {
+            "input": texts,
         }
 
         engine = getenv("AZURE_OPENAI_TEXT_EMBEDDING_ENGINE")
@@ -77,9 +208,11 @@ class GoodbyeModel:
         else:
             params["model"] = "text-embedding-ada-002"
 
-        return np.array(
-            (await self.aclient.embeddings.create(**params))["data"][0]["embedding"]
-        )
+        response = await self.aclient.embeddings.create(**params)
+        return [
+            np.array(embedding.embedding)
+            for embedding in sorted(response.data, key=lambda e: e.index)
+        ]
 
 
 if __name__ == "__main__":
@@ -89,6 +222,7 @@ if __name__ == "__main__":
 
     async def main():
         model = GoodbyeModel()
+        await model.initialize_embeddings()
         while True:
             print(await model.is_goodbye(input("Text: ")))
 
@@ -0,0 +1,130 @@
+import logging
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple, Union
+
+import aiohttp
+import httpx
+from openai import AsyncAzureOpenAI, AsyncOpenAI
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+
+
+class HTTPResourcePool:
+    """Process-wide keep-alive HTTP clients, shared by every conversation.
+
+    Synthesizers and vector DBs get the same aiohttp.ClientSession, whose connector keeps a
+    separate pool of idle connections per upstream host (capped at limit_per_host), so a new
+    call reuses warm TCP+TLS connections to ElevenLabs, Play.ht, Pinecone, etc. OpenAI clients
+    are cached per credentials and share one httpx connection pool.
+
+    The session is created lazily because it must be bound to the running event loop. The
+    owner is responsible for calling close() on shutdown.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.aiohttp_session: Optional[aiohttp.ClientSession] = None
+        self.httpx_client: Optional[httpx.AsyncClient] = None
+        self.openai_clients: Dict[
+            Tuple[Optional[str], ...], Union[AsyncOpenAI, AsyncAzureOpenAI]
+        ] = {}
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.openai_clients_created = 0
+        self.openai_clients_reused = 0
+
+    def get_aiohttp_session(self) -> aiohttp.ClientSession:
+        if self.aiohttp_session is None or self.aiohttp_session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self.on_connection_created)
+            trace_config.on_connection_reuseconn.append(self.on_connection_reused)
+            self.aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                trace_configs=[trace_config],
+            )
+        return self.aiohttp_session
+
+    def get_httpx_client(self) -> httpx.AsyncClient:
+        if self.httpx_client is None or self.httpx_client.is_closed:
+            self.httpx_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.limit,
+                    max_keepalive_connections=self.limit_per_host,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+                timeout=httpx.Timeout(600, connect=5),
+            )
+        return self.httpx_client
+
+    def get_openai_client(
+        self,
+        api_key: str,
+        azure_endpoint: Optional[str] = None,
+        api_version: Optional[str] = None,
+    ) -> Union[AsyncOpenAI, AsyncAzureOpenAI]:
+        key = (api_key, azure_endpoint, api_version)
+        client = self.openai_clients.get(key)
+        if client is not None:
+            self.openai_clients_reused += 1
+            return client
+        if azure_endpoint is not None:
+            client = AsyncAzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=azure_endpoint,
+                api_version=api_version,
+                http_client=self.get_httpx_client(),
+            )
+        else:
+            client = AsyncOpenAI(api_key=api_key, http_client=self.get_httpx_client())
+        self.openai_clients[key] = client
+        self.openai_clients_created += 1
+        return client
+
+    async def on_connection_created(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        self.connections_created += 1
+
+    async def on_connection_reused(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        self.connections_reused += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "openai_clients_created": self.openai_clients_created,
+            "openai_clients_reused": self.openai_clients_reused,
+        }
+
+    async def close(self):
+        self.logger.debug(f"Closing HTTP resource pool: {self.get_stats()}")
+        if self.aiohttp_session is not None:
+            await self.aiohttp_session.close()
+            self.aiohttp_session = None
+        if self.httpx_client is not None:
+            await self.httpx_client.aclose()
+            self.httpx_client = None
+        self.openai_clients.clear()
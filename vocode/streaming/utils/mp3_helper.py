@@ -1,5 +1,7 @@
 import io
 import wave
+from typing import NamedTuple, Optional
+
 import miniaudio
 
 
@@ -18,3 +20,151 @@ def decode_mp3(mp3_bytes: bytes) -> io.BytesIO:
         wave_obj.writeframes(wav_chunk.samples)
     output_bytes_io.seek(0)
     return output_bytes_io
+
+
+# samples the mp3 decoder outputs before the first real one, added to a LAME tag's encoder delay
+MP3_DECODER_DELAY = 529
+ID3_HEADER_SIZE = 10
+MP3_FRAME_HEADER_SIZE = 4
+# by MPEG version bits: MPEG 2.5, reserved, MPEG 2, MPEG 1
+MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+# in kbps by bitrate index, for layer III
+MP3_BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+class Mp3FrameHeader(NamedTuple):
+    sample_rate: int
+    is_mpeg1: bool
+    is_mono: bool
+    samples_per_frame: int
+    # the size of the whole frame, header included
+    frame_size: int
+
+
+def parse_mp3_frame_header(header: bytes) -> Mp3FrameHeader:
+    """Parses the 4 byte header of a layer III frame, raises ValueError if it isn't one
+
+    Free format frames don't say how long they are, so they raise ValueError too.
+    """
+    if len(header) < MP3_FRAME_HEADER_SIZE:
+        raise ValueError("Not an mp3 frame header")
+    version = (header[1] >> 3) & 0x3
+    layer = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x3
+    if (
+        header[0] != 0xFF
+        or header[1] & 0xE0 != 0xE0
+        or version not in MP3_SAMPLE_RATES
+        or layer != 1
+        or bitrate_index in (0, 15)
+        or sample_rate_index == 3
+    ):
+        raise ValueError("Not an mp3 frame header")
+    sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+    is_mpeg1 = version == 3
+    samples_per_frame = 1152 if is_mpeg1 else 576
+    bitrate = MP3_BITRATES[is_mpeg1][bitrate_index] * 1000
+    padding = (header[2] >> 1) & 0x1
+    return Mp3FrameHeader(
+        sample_rate=sample_rate,
+        is_mpeg1=is_mpeg1,
+        is_mono=header[3] >> 6 == 3,
+        samples_per_frame=samples_per_frame,
+        frame_size=samples_per_frame // 8 * bitrate // sample_rate + padding,
+    )
+
+
+def get_id3_tag_size(mp3_prefix: bytes) -> Optional[int]:
+    """The size of the ID3 tag at the start of mp3_prefix, 0 if there isn't one
+
+    Returns None if mp3_prefix isn't long enough to tell yet.
+    """
+    if mp3_prefix[:3] != b"ID3"[: len(mp3_prefix)]:
+        return 0
+    if len(mp3_prefix) < ID3_HEADER_SIZE:
+        return None
+    size = mp3_prefix[6:10]
+    tag_size = ID3_HEADER_SIZE + (
+        (size[0] & 0x7F) << 21
+        | (size[1] & 0x7F) << 14
+        | (size[2] & 0x7F) << 7
+        | (size[3] & 0x7F)
+    )
+    if mp3_prefix[5] & 0x10:  # footer
+        tag_size += ID3_HEADER_SIZE
+    return tag_size
+
+
+class Mp3StreamInfo(NamedTuple):
+    sample_rate: int
+    # where the audio frames start, after the ID3 tag and the Xing/Info frame (which decodes
+    # as silence in some decoder versions, and makes others trim by themselves)
+    audio_offset: int = 0
+    # decoded samples to drop from the start of the audio frames: the encoder and decoder delay
+    num_leading_samples: int = 0
+    # the number of samples of actual audio after those, if the stream says
+    num_samples: Optional[int] = None
+
+
+def get_mp3_stream_info(mp3_prefix: bytes) -> Optional[Mp3StreamInfo]:
+    """Reads the sample rate and gapless playback info from the start of an mp3 stream
+
+    miniaudio.decode trims the silent Xing/Info frame, the encoder delay and the end padding
+    from complete files; a streaming decoder can't be relied on to, so the Xing/Info frame
+    is skipped and the rest trimmed with this info instead. Returns None if mp3_prefix isn't
+    long enough to tell yet, and raises ValueError if it doesn't start with an mp3 frame.
+    """
+    offset = get_id3_tag_size(mp3_prefix)
+    if offset is None or len(mp3_prefix) < offset + MP3_FRAME_HEADER_SIZE:
+        return None
+    frame_header = parse_mp3_frame_header(
+        mp3_prefix[offset : offset + MP3_FRAME_HEADER_SIZE]
+    )
+    sample_rate = frame_header.sample_rate
+    is_mpeg1 = frame_header.is_mpeg1
+    is_mono = frame_header.is_mono
+    samples_per_frame = frame_header.samples_per_frame
+    side_info_size = (17 if is_mono else 32) if is_mpeg1 else (9 if is_mono else 17)
+    xing_offset = offset + MP3_FRAME_HEADER_SIZE + side_info_size
+    # the Xing/Info header, up to its optional fields and the LAME tag after them
+    if len(mp3_prefix) < xing_offset + 8:
+        return None
+    if mp3_prefix[xing_offset : xing_offset + 4] not in (b"Xing", b"Info"):
+        return Mp3StreamInfo(sample_rate=sample_rate, audio_offset=offset)
+    audio_offset = offset + frame_header.frame_size
+    flags = int.from_bytes(mp3_prefix[xing_offset + 4 : xing_offset + 8], "big")
+    field_offset = xing_offset + 8
+    num_frames = None
+    if flags & 0x1:
+        num_frames = int.from_bytes(mp3_prefix[field_offset : field_offset + 4], "big")
+        field_offset += 4
+    if flags & 0x2:  # number of bytes
+        field_offset += 4
+    if flags & 0x4:  # seek table
+        field_offset += 100
+    if flags & 0x8:  # quality
+        field_offset += 4
+    # the encoder delay and padding are 12 bits each, 21 bytes into the LAME tag
+    lame_tag = mp3_prefix[field_offset : field_offset + 24]
+    if len(lame_tag) < 24:
+        return None
+    if num_frames is None or not lame_tag[:4].isalnum():
+        return Mp3StreamInfo(sample_rate=sample_rate, audio_offset=audio_offset)
+    delay = lame_tag[21] << 4 | lame_tag[22] >> 4
+    padding = (lame_tag[22] & 0xF) << 8 | lame_tag[23]
+    return Mp3StreamInfo(
+        sample_rate=sample_rate,
+        audio_offset=audio_offset,
+        num_leading_samples=delay + MP3_DECODER_DELAY,
+        num_samples=max(num_frames * samples_per_frame - delay - padding, 0),
+    )
@@ -0,0 +1,53 @@
+import time
+from typing import Callable, Optional
+
+
+class PlaybackClock:
+    """Tracks how far playback of the audio sent to an output device has got
+
+    Rather than assuming each chunk takes exactly its length to send and play, the clock keeps
+    the total seconds of audio sent and the (monotonic) time at which all of it will have been
+    played. Pacing against that total doesn't drift with event loop lag, however small the
+    chunks are. Devices that report playback (e.g. Twilio marks) correct the clock with
+    on_played.
+    """
+
+    def __init__(
+        self,
+        lead_seconds: float = 0,
+        get_time: Callable[[], float] = time.monotonic,
+    ):
+        # how much audio is kept buffered on the device ahead of playback
+        self.lead_seconds = lead_seconds
+        self.get_time = get_time
+        self.seconds_sent = 0.0
+        self.playback_end: Optional[float] = None
+
+    def on_sent(self, seconds: float):
+        now = self.get_time()
+        # if playback caught up with us, the new audio starts playing now
+        if self.playback_end is None or self.playback_end < now:
+            self.playback_end = now
+        self.playback_end += seconds
+        self.seconds_sent += seconds
+
+    def on_played(self, seconds_sent: float):
+        """The device has played the first seconds_sent seconds of audio"""
+        self.playback_end = self.get_time() + self.seconds_sent - seconds_sent
+
+    def create_on_played(self) -> Callable[[], None]:
+        """Returns a callback for when the audio sent so far has been played"""
+        seconds_sent = self.seconds_sent
+        return lambda: self.on_played(seconds_sent)
+
+    def get_seconds_buffered(self) -> float:
+        if self.playback_end is None:
+            return 0
+        return max(self.playback_end - self.get_time(), 0)
+
+    def get_seconds_played(self) -> float:
+        return max(self.seconds_sent - self.get_seconds_buffered(), 0)
+
+    def get_send_delay(self) -> float:
+        """How long to wait before sending more audio, so only lead_seconds is buffered"""
+        return max(self.get_seconds_buffered() - self.lead_seconds, 0)
@@ -0,0 +1,28 @@
+import asyncio
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Spaces out whatever waits on it to at most calls_per_second, in the order it waited"""
+
+    def __init__(
+        self,
+        calls_per_second: float,
+        get_time: Callable[[], float] = time.monotonic,
+    ):
+        self.interval_seconds = 1 / calls_per_second
+        self.get_time = get_time
+        self.next_slot = 0.0
+
+    def reserve(self) -> float:
+        """Takes the next free slot, returns how long until it"""
+        now = self.get_time()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval_seconds
+        return slot - now
+
+    async def wait(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
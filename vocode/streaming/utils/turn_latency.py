@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import secrets
+import time
+from typing import Dict, Optional
+
+from opentelemetry import metrics
+
+from vocode.streaming.models.transcript import Transcript, TurnLatency
+
+meter = metrics.get_meter(__name__)
+
+TURN_LATENCY_METRIC_PREFIX = "conversation.turn"
+
+agent_first_token_hist = meter.create_histogram(
+    name=f"{TURN_LATENCY_METRIC_PREFIX}.agent_first_token_latency",
+    unit="seconds",
+    description="Time from the final transcription to the agent's first token",
+)
+synthesis_hist = meter.create_histogram(
+    name=f"{TURN_LATENCY_METRIC_PREFIX}.synthesis_latency",
+    unit="seconds",
+    description="Time from the agent's first token to create_speech returning",
+)
+first_audio_hist = meter.create_histogram(
+    name=f"{TURN_LATENCY_METRIC_PREFIX}.first_audio_latency",
+    unit="seconds",
+    description="Time from create_speech returning to the first chunk reaching the output device",
+)
+total_hist = meter.create_histogram(
+    name=f"{TURN_LATENCY_METRIC_PREFIX}.total_latency",
+    unit="seconds",
+    description="Time from the final transcription to the first chunk reaching the output device",
+)
+
+
+def create_turn_id() -> str:
+    return secrets.token_urlsafe(8)
+
+
+class TurnLatencyTracker:
+    """Records when each stage of a turn first happens and exports the deltas as histograms.
+
+    A turn starts when a final transcription is received. Only the first occurrence of each
+    stage is recorded, so e.g. the synthesis stage measures the first sentence of the response.
+    The TurnLatency records are attached to the transcript so they are published along with it,
+    and a turn is only tracked here until its first audio.
+    """
+
+    def __init__(self, transcript: Transcript):
+        self.transcript = transcript
+        self.turns: Dict[str, TurnLatency] = {}
+
+    def start_turn(self) -> str:
+        turn_latency = TurnLatency(
+            turn_id=create_turn_id(), transcription_time=time.time()
+        )
+        self.turns[turn_latency.turn_id] = turn_latency
+        self.transcript.add_turn_latency(turn_latency)
+        return turn_latency.turn_id
+
+    def get_turn(self, turn_id: Optional[str]) -> Optional[TurnLatency]:
+        if turn_id is None:
+            return None
+        return self.turns.get(turn_id)
+
+    def mark_agent_first_token(self, turn_id: Optional[str]):
+        turn_latency = self.get_turn(turn_id)
+        if turn_latency is None or turn_latency.agent_first_token_time is not None:
+            return
+        turn_latency.agent_first_token_time = time.time()
+        agent_first_token_hist.record(
+            turn_latency.agent_first_token_time - turn_latency.transcription_time
+        )
+
+    def mark_synthesis_complete(self, turn_id: Optional[str]):
+        turn_latency = self.get_turn(turn_id)
+        if turn_latency is None or turn_latency.synthesis_time is not None:
+            return
+        turn_latency.synthesis_time = time.time()
+        synthesis_hist.record(
+            turn_latency.synthesis_time
+            - (turn_latency.agent_first_token_time or turn_latency.transcription_time)
+        )
+
+    def mark_first_audio(self, turn_id: Optional[str]):
+        turn_latency = self.get_turn(turn_id)
+        if turn_latency is None or turn_latency.first_audio_time is not None:
+            return
+        turn_latency.first_audio_time = time.time()
+        del self.turns[turn_latency.turn_id]
+        first_audio_hist.record(
+            turn_latency.first_audio_time
+            - (turn_latency.synthesis_time or turn_latency.transcription_time)
+        )
+        total_hist.record(
+            turn_latency.first_audio_time - turn_latency.transcription_time
+        )
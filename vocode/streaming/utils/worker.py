@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+import contextvars
+from functools import partial
 import threading
 import janus
-from typing import Any, Optional
+from typing import Any, Coroutine, Deque, Dict, Optional
 from typing import TypeVar, Generic
 import logging
 
@@ -17,11 +20,12 @@ class AsyncWorker(Generic[WorkerInputType]):
     def __init__(
         self,
         input_queue: asyncio.Queue,
-        output_queue: asyncio.Queue = asyncio.Queue(),
+        output_queue: Optional[asyncio.Queue] = None,
     ) -> None:
         self.worker_task: Optional[asyncio.Task] = None
         self.input_queue = input_queue
-        self.output_queue = output_queue
+        # a default asyncio.Queue() argument would be one queue shared by every worker
+        self.output_queue = output_queue if output_queue is not None else asyncio.Queue()
 
     def start(self) -> asyncio.Task:
         self.worker_task = asyncio.create_task(self._run_loop())
@@ -47,11 +51,14 @@ class ThreadAsyncWorker(AsyncWorker[WorkerInputType]):
     def __init__(
         self,
         input_queue: asyncio.Queue[WorkerInputType],
-        output_queue: asyncio.Queue = asyncio.Queue(),
+        output_queue: Optional[asyncio.Queue] = None,
     ) -> None:
         super().__init__(input_queue, output_queue)
         self.worker_thread: Optional[threading.Thread] = None
-        self.input_janus_queue: janus.Queue[WorkerInputType] = janus.Queue()
+        # as bounded as input_queue, so a slow thread backs up into input_queue's overflow policy
+        self.input_janus_queue: janus.Queue[WorkerInputType] = janus.Queue(
+            maxsize=input_queue.maxsize
+        )
         self.output_janus_queue: janus.Queue = janus.Queue()
 
     def start(self) -> asyncio.Task:
@@ -72,12 +79,12 @@ class ThreadAsyncWorker(AsyncWorker[WorkerInputType]):
     async def _forward_to_thread(self):
         while True:
             item = await self.input_queue.get()
-            self.input_janus_queue.async_q.put_nowait(item)
+            await self.input_janus_queue.async_q.put(item)
 
     async def _forward_from_thead(self):
         while True:
             item = await self.output_janus_queue.async_q.get()
-            self.output_queue.put_nowait(item)
+            await self.output_queue.put(item)
 
     def _run_loop(self):
         raise NotImplementedError
@@ -166,13 +173,48 @@ class InterruptibleEventFactory:
 InterruptibleEventType = TypeVar("InterruptibleEventType", bound=InterruptibleEvent)
 
 
+class OutputSlot:
+    """Buffers the outputs produced while processing one item so that concurrently
+    processed items publish their outputs in input order
+
+    The slot stays open until process() and every task it started with create_producer_task
+    have finished.
+    """
+
+    def __init__(self, worker: "InterruptibleWorker", item: InterruptibleEvent):
+        self.worker = worker
+        self.item = item
+        self.items: Deque[Any] = deque()
+        # process() and the tasks it started with create_producer_task, while they run
+        self.num_producers = 1
+        # set once every item received before this one has published its outputs
+        self.is_first = asyncio.Event()
+
+    def is_done(self) -> bool:
+        return self.num_producers == 0
+
+
+# set inside each concurrently processed task, so produce_nonblocking knows which slot to buffer into
+current_output_slot: contextvars.ContextVar[Optional[OutputSlot]] = contextvars.ContextVar(
+    "current_output_slot", default=None
+)
+
+
 class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
+    """Processes one item at a time by default.
+
+    With max_concurrency > 1, up to max_concurrency calls to process() run at once. Outputs are
+    still published in input order: an item's outputs are held back until every item received
+    before it has finished processing. Other side effects of process() can be ordered the same
+    way with wait_for_output_turn.
+    """
+
     def __init__(
         self,
         input_queue: asyncio.Queue[InterruptibleEventType],
-        output_queue: asyncio.Queue = asyncio.Queue(),
+        output_queue: Optional[asyncio.Queue] = None,
         interruptible_event_factory: InterruptibleEventFactory = InterruptibleEventFactory(),
-        max_concurrency=2,
+        max_concurrency=1,
     ) -> None:
         super().__init__(input_queue, output_queue)
         self.input_queue = input_queue
@@ -180,6 +222,8 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
         self.interruptible_event_factory = interruptible_event_factory
         self.current_task = None
         self.interruptible_event = None
+        self.in_flight_tasks: Dict[asyncio.Task, InterruptibleEvent] = {}
+        self.output_slots: Deque[OutputSlot] = deque()
 
     def produce_interruptible_event_nonblocking(
         self, item: Any, is_interruptible: bool = True
@@ -189,7 +233,7 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
                 item, is_interruptible=is_interruptible
             )
         )
-        return super().produce_nonblocking(interruptible_event)
+        return self.produce_nonblocking(interruptible_event)
 
     def produce_interruptible_agent_response_event_nonblocking(
         self,
@@ -204,10 +248,67 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
                 agent_response_tracker=agent_response_tracker or asyncio.Event(),
             )
         )
-        return super().produce_nonblocking(interruptible_utterance_event)
+        return self.produce_nonblocking(interruptible_utterance_event)
+
+    def produce_nonblocking(self, item):
+        output_slot = current_output_slot.get()
+        # a slot that's done has already been flushed, or is about to be
+        if (
+            output_slot is None
+            or output_slot.worker is not self
+            or output_slot.is_done()
+        ):
+            return super().produce_nonblocking(item)
+        output_slot.items.append(item)
+        self.flush_output_slots()
+
+    def flush_output_slots(self):
+        while self.output_slots:
+            output_slot = self.output_slots[0]
+            output_slot.is_first.set()
+            while output_slot.items:
+                super().produce_nonblocking(output_slot.items.popleft())
+            if not output_slot.is_done():
+                break
+            self.output_slots.popleft()
+
+    def create_producer_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Starts a task from process() whose outputs are published with the current item's
+
+        In concurrent mode, the item's slot stays open until the task finishes, so its outputs
+        still come before those of later items.
+        """
+        task = asyncio.create_task(coro)
+        output_slot = current_output_slot.get()
+        if output_slot is not None and output_slot.worker is self:
+            output_slot.num_producers += 1
+            # cancelled along with the item's own task
+            self.in_flight_tasks[task] = output_slot.item
+            task.add_done_callback(partial(self._on_producer_task_done, output_slot))
+        return task
+
+    async def wait_for_output_turn(self):
+        """Waits until every item received before the current one has published its outputs
+
+        For side effects of process() other than outputs, which in concurrent mode would
+        otherwise happen before those of earlier items.
+        """
+        output_slot = current_output_slot.get()
+        if output_slot is not None and output_slot.worker is self:
+            await output_slot.is_first.wait()
+
+    def _on_producer_task_done(self, output_slot: OutputSlot, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("InterruptibleWorker", exc_info=task.exception())
+        self.in_flight_tasks.pop(task, None)
+        output_slot.num_producers -= 1
+        if output_slot.is_done():
+            output_slot.item.is_interruptible = False
+        self.flush_output_slots()
 
     async def _run_loop(self):
-        # TODO Implement concurrency with max_nb_of_thread
+        if self.max_concurrency > 1:
+            return await self._run_loop_concurrently()
         while True:
             item = await self.input_queue.get()
             if item.is_interrupted():
@@ -223,6 +324,43 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
             self.interruptible_event.is_interruptible = False
             self.current_task = None
 
+    async def _run_loop_concurrently(self):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        while True:
+            try:
+                await semaphore.acquire()
+                item = await self.input_queue.get()
+            except asyncio.CancelledError:
+                return
+            if item.is_interrupted():
+                semaphore.release()
+                continue
+            output_slot = OutputSlot(self, item)
+            self.output_slots.append(output_slot)
+            self.flush_output_slots()
+            self.interruptible_event = item
+            task = asyncio.create_task(self._process_in_output_slot(item, output_slot))
+            self.in_flight_tasks[task] = item
+            task.add_done_callback(
+                partial(self._on_concurrent_task_done, item, output_slot, semaphore)
+            )
+
+    async def _process_in_output_slot(
+        self, item: InterruptibleEventType, output_slot: OutputSlot
+    ):
+        current_output_slot.set(output_slot)
+        await self.process(item)
+
+    def _on_concurrent_task_done(
+        self,
+        item: InterruptibleEventType,
+        output_slot: OutputSlot,
+        semaphore: asyncio.Semaphore,
+        task: asyncio.Task,
+    ):
+        self._on_producer_task_done(output_slot, task)
+        semaphore.release()
+
     async def process(self, item: InterruptibleEventType):
         """
         Publish results onto output queue.
@@ -235,7 +373,15 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
         - threads tasks won't be able to be interrupted. Hopefully not too much of a big deal
             Threads will also get a reference to the interruptible event
         - asyncio tasks will still have to handle CancelledError and clean up resources
+
+        In concurrent mode, every interruptible in-flight task is cancelled.
         """
+        if self.in_flight_tasks:
+            cancelled = False
+            for task, item in list(self.in_flight_tasks.items()):
+                if not task.done() and item.is_interruptible:
+                    cancelled = task.cancel() or cancelled
+            return cancelled
         if (
             self.current_task
             and not self.current_task.done()
@@ -245,6 +391,11 @@ class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
 
         return False
 
+    def terminate(self):
+        for task in list(self.in_flight_tasks):
+            task.cancel()
+        return super().terminate()
+
 
 class InterruptibleAgentResponseWorker(
     InterruptibleWorker[InterruptibleAgentResponseEvent]
@@ -3,6 +3,7 @@ from typing import Iterable, List, Optional, Tuple
 import aiohttp
 from openai import AsyncOpenAI
 from vocode import getenv
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 
 from langchain.docstore.document import Document
 
@@ -13,11 +14,15 @@ class VectorDB:
     def __init__(
         self,
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
+        http_resource_pool: Optional[HTTPResourcePool] = None,
     ):
         api_key = getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment or passed in")
-        self.aclient = AsyncOpenAI(api_key=api_key)
+        if http_resource_pool is not None:
+            self.aclient = http_resource_pool.get_openai_client(api_key)
+        else:
+            self.aclient = AsyncOpenAI(api_key=api_key)
         if aiohttp_session:
             # the caller is responsible for closing the session
             self.aiohttp_session = aiohttp_session
@@ -4,14 +4,24 @@ import aiohttp
 from vocode.streaming.models.vector_db import PineconeConfig, VectorDBConfig
 from vocode.streaming.vector_db.base_vector_db import VectorDB
 from vocode.streaming.vector_db.pinecone import PineconeDB
+from vocode.streaming.utils.http_resource_pool import HTTPResourcePool
 
 
 class VectorDBFactory:
+    def __init__(self, http_resource_pool: Optional[HTTPResourcePool] = None):
+        self.http_resource_pool = http_resource_pool
+
     def create_vector_db(
         self,
         vector_db_config: VectorDBConfig,
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ) -> VectorDB:
+        if aiohttp_session is None and self.http_resource_pool is not None:
+            aiohttp_session = self.http_resource_pool.get_aiohttp_session()
         if isinstance(vector_db_config, PineconeConfig):
-            return PineconeDB(vector_db_config, aiohttp_session=aiohttp_session)
+            return PineconeDB(
+                vector_db_config,
+                aiohttp_session=aiohttp_session,
+                http_resource_pool=self.http_resource_pool,
+            )
         raise Exception("Invalid vector db config", vector_db_config.type)